@@ -3,12 +3,18 @@ import asyncio
 import aiofiles
 import subprocess
 import dotenv
+from typing import Optional
 from fastapi import APIRouter, HTTPException
 from services_app.tasks import parse_some_data
 from app.schema import ParserRequest
 from transfer_data.redis_client import RedisClient
+from transfer_data.key_schema import GameKeys
 
 route = APIRouter()
+# Клиент Redis, общий для всех запросов API (подключается при первом запросе)
+redis_client = RedisClient()
+# Суффикс сайта в URL истории игры: "akty.com_all_data"
+HISTORY_SUFFIX = '_all_data'
 # Удаляем loop = asyncio.get_event_loop() так как оно не используется
 
 @route.post("/run_parser/")
@@ -82,39 +88,67 @@ async def get_game(
         site: str,
         league: str,
         opponent_0: str,
-        opponent_1: str
+        opponent_1: str,
+        minutes: Optional[float] = None
 ) -> dict:
     """
-     Получает данные игры по составному ключу.
+     Получает данные игры по лиге и командам.
 
      Args:
          site (str): Сайт, откуда пришли данные.
          league (str): Название лиги.
          opponent_0 (str): Имя первой команды.
          opponent_1 (str): Имя второй команды.
+         minutes (float): Только точки за последние minutes минут
+             (для истории в Redis Streams, site вида "akty.com_all_data").
 
      Returns:
          dict: Данные игры или сообщение об ошибке, если игра не найдена.
      """
     try:
-        redis_client = RedisClient()
-        await redis_client.connect()
+        if redis_client.redis is None:
+            await redis_client.connect()
 
-        # Формируем ключ в нижнем регистре
-        key = (f"{site.lower()}, {league.lower()}, "
-               f"{opponent_0.lower()}, {opponent_1.lower()}")
+        site = site.lower()
+        is_history = site.endswith(HISTORY_SUFFIX)
+        if is_history:
+            site = site[:-len(HISTORY_SUFFIX)]
+        keys = GameKeys(site, league, opponent_0, opponent_1)
 
         # Получаем данные из Redis
-        data = await redis_client.get_last_items(key)
+        if is_history:
+            # История игры: список или поток, в зависимости от хранилища
+            data = await redis_client.get_history(keys, minutes)
+        else:
+            data = await redis_client.get_alerts(keys)
 
         if not data:
-            raise HTTPException(status_code=404, detail=f"Игра {key} не найдена")
+            raise HTTPException(status_code=404, detail=f"Игра {keys.id} не найдена")
 
         return {"games": data}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@route.get("/live-games/{site}")
+async def get_live_games(site: str, league: Optional[str] = None) -> dict:
+    """
+    Получает текущие игры сайта из индекса, последние обновлённые первыми.
+
+    Args:
+        site (str): Сайт, например "akty.com".
+        league (str): Только игры этой лиги.
+
+    Returns:
+        dict: Игры с id, лигой и командами.
+    """
+    try:
+        if redis_client.redis is None:
+            await redis_client.connect()
+        return {"games": await redis_client.live_games(site.lower(), league)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @route.post("/update-token/")
 async def update_token(new_token: str):
     """
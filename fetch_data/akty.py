@@ -1,6 +1,5 @@
 import os
 import re
-import copy
 import asyncio
 import socketio
 import hashlib
@@ -9,12 +8,10 @@ import json
 import undetected_chromedriver as uc
 from typing import List, Dict, Any
 from translatepy import Translator
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support import expected_conditions as EC
@@ -22,8 +19,33 @@ from selenium.common.exceptions import TimeoutException, WebDriverException, NoS
 from selenium.webdriver.common.keys import Keys
 from app.logging import setup_logger
 from transfer_data.redis_client import RedisClient
+from transfer_data.key_schema import GameKeys
+from transfer_data.odds_codec import encode_point
+from transfer_data.delta_protocol import (
+    DeltaEncoder, SOCKET_PROTOCOL, renamed_games
+)
 from transfer_data.telegram_bot import send_message_to_telegram
-from scripts.translate_cash_load import load_translate_cash, save_translate_cash
+from scripts.translate_cash_load import TranslateStore
+from fetch_data.page_scripts import (
+    AKTY_INSTALL_OBSERVER_JS, AKTY_DRAIN_OBSERVER_JS,
+    AKTY_CONTAINER_FINGERPRINT_JS
+)
+from fetch_data.html_parser import parse_html
+from fetch_data.row_cache import RowCache
+from fetch_data.browser_host import BROWSER_HOST, open_tab
+from fetch_data.navigation import StartupTimer, document_ready
+from fetch_data.resource_blocking import block_resources
+from fetch_data.async_driver import AsyncDriver
+from fetch_data.poll_scheduler import PollScheduler
+from fetch_data.game_index import GameIndex, game_key
+from fetch_data.lifecycle import GameLifecycle, LifecycleEvent, GAME_END_TTL
+from fetch_data.game_snapshot import GameSnapshot, Tick, snapshot_json
+from fetch_data.translate_index import TranslateIndex, sanitize_name
+from fetch_data.translate_queue import TranslateQueue
+from fetch_data.network_tap import (
+    NetworkTap, FeedDecoder, RATE_FIELDS, enable_performance_log,
+    load_feed_fields, check_feed_fields
+)
 
 
 # Загрузка переменных окружения из .env файла
@@ -47,6 +69,53 @@ REDIS_URL = os.getenv('REDIS_URL')
 SOCKETIO_URL = os.getenv('SOCKETIO_URL')
 SOCKET_KEY = os.getenv('SOCKET_KEY')
 HEADLESS = True
+# Режим мониторинга: 'push' - MutationObserver, 'poll' - сравнение хэшей,
+# 'network' - сетевой фид через CDP
+MONITOR_MODE = os.getenv('AKTY_MONITOR_MODE', 'push')
+FEED_URL_PATTERNS = tuple(
+    pattern for pattern in os.getenv('AKTY_FEED_URL_PATTERNS', '').split(',')
+    if pattern
+)
+# Карта полей фида, уточняется по кадрам из NETWORK_TAP_DUMP
+FEED_FIELDS = load_feed_fields('AKTY_FEED_FIELDS', {'id': 'id'})
+# Период полного извлечения в push-режиме, секунды
+FULL_RESYNC_INTERVAL = 60
+# Таймауты этапов навигации, секунды
+NAVIGATION_TIMEOUTS = {
+    'page_load': 30,
+    'login_form': 30,
+    'login': 30,
+    'sport_menu': 15,
+    'iframe': 60,
+    'basketball_menu': 60,
+}
+LOGIN_INPUT = "input[placeholder*='账号']"
+SPORT_MENU_IMAGE = 'https://senbackkg.m42i79a.com/main-consumer-web/assets-oss/ak/images/header/ty-hq.862daf053a4b08ea6650a4e85ece1711.webp?x-oss-process=image/resize,w_210,h_210/quality,Q_100/sharpen,100/format,webp'
+SPORT_MENU_XPATH = f"//img[@src='{SPORT_MENU_IMAGE}']"
+# Ресурсы, без которых не работает навигация: не блокируются
+ALLOWED_URLS = (SPORT_MENU_IMAGE,)
+BASKETBALL_MENU_XPATH = '//span[@class="menu-text" and text()="篮球"]'
+# Профиль Chrome и снимок авторизованной сессии akty.com
+AKTY_PROFILE_DIR = os.getenv(
+    'AKTY_PROFILE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 'browser_profiles', 'akty')
+)
+SESSION_FILE = os.path.join(AKTY_PROFILE_DIR, 'session.json')
+# Поля CookieParam, которые принимает Network.setCookies
+COOKIE_FIELDS = (
+    'name', 'value', 'domain', 'path', 'secure', 'httpOnly',
+    'sameSite', 'expires', 'priority', 'sameParty', 'sourceScheme',
+    'sourcePort', 'partitionKey'
+)
+
+# Масштаб вкладки (см. change_zoom)
+PAGE_ZOOM = 0.25
+
+# Предкомпилированные шаблоны разбора карточек
+CARD_CLASS = re.compile('list-card-wrap v-scroll-item relative-position')
+TEAM_NAME_CLASS = re.compile('allow-user-select')
+COLLAPSED_STYLE = re.compile(r'height:\s*37px;')
 
 
 class FetchAkty:
@@ -63,11 +132,15 @@ class FetchAkty:
         self.proxy = proxy
         self.sio = socketio.AsyncSimpleClient()
         self.redis_client = None
+        self.startup_timer = StartupTimer('akty', logger)
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self.driver = self.loop.run_until_complete(
             self.get_driver(headless=HEADLESS)
         )
+        # Блокирующие вызовы WebDriver выполняются в отдельном потоке
+        self.browser = AsyncDriver(self.driver, name='akty-driver')
+        self.startup_timer.mark('driver_launch')
         self.time_game_translate = {
             '第一节': 'I',
             '第二节': 'II',
@@ -75,78 +148,95 @@ class FetchAkty:
             '第四节': 'IV'
         }
         self.debug = LOCAL_DEBUG
-        self.translate_cash = None
         self.action = ActionChains(self.driver)
-        self.previous_data = {}
+        self.previous_data = GameIndex()
         self.translator = Translator()
-        self.translate_cash = load_translate_cash()
+        self.translate_store = TranslateStore()
+        self.translate_index = TranslateIndex(self.translate_store.load())
+        self.translate_queue = TranslateQueue(self.translate_text)
         self.restart_required = False
-        self.ended_games = {}
-    async def save_games(self, data: dict, liga_name: str):
+        self.lifecycle = GameLifecycle()
+        self.delta_encoder = DeltaEncoder(NAME_BOOKMAKER)
+        self.network_tap = None
+        self.feed_decoder = FeedDecoder(FEED_FIELDS)
+        self.container_soup = None
+        self.card_cache = RowCache()
+        # Игровое время матчей, прочитанное в последнем такте
+        # (вход для PollScheduler)
+        self.game_clocks: Dict[Any, str] = {}
+        self.venue_url = None
+        self.publish_task = None
+        # Отправки из цикла тактов и из listen_server идут по очереди
+        self.publish_lock = asyncio.Lock()
+        self.listen_task = None
+        # Изменившиеся игры такта для записи в Redis: (лига, игра)
+        self.pending_games = []
+
+    async def save_games(self, data: GameSnapshot, liga_name: str):
         """
-        Сохраняет игры по отдельным ключам в Redis.
+        Ставит изменившуюся игру в пакет записи такта. Пакет
+        отправляется в Redis одним запросом в flush_games.
 
         Args:
-            data (dict): Данные в формате JSON для сохранения.
+            data (GameSnapshot): Данные игры для сохранения.
             liga_name (str): Наименование лиги для сохранения в Redis.
         """
-        try:
-            rate_bets = [
-                'total_bet_0',
-                'total_bet_1',
-                'handicap_bet_0',
-                'handicap_bet_1'
-            ]
-            data_rate = data.get('rate', {})
+        self.pending_games.append((liga_name, data))
 
-            # Преобразуем значения в data_rate
-            for rate_bet in rate_bets:
-                value = data_rate.get(rate_bet, '0')
-                if value in ('-', '', None):
-                    data_rate[rate_bet] = 0.0
-                else:
-                    try:
-                        data_rate[rate_bet] = float(value)
-                    except (ValueError, TypeError):
-                        data_rate[rate_bet] = 0.0
-
-            # Проверяем, нужно ли сохранять данные в Redis
-            is_save = any(0 < data_rate[rate_bet] <= 1.73 for rate_bet in (
-                    rate_bets))
-            opponent_0 = data.get('opponent_0', '')
-            opponent_1 = data.get('opponent_1', '')
-            key_for_all_data = (f"akty.com_all_data, {liga_name.lower()}, "
-                   f"{opponent_0.lower()}, {opponent_1.lower()}")
-            key_for_save = (f"akty.com, {liga_name.lower()}, "
-                   f"{opponent_0.lower()}, {opponent_1.lower()}")
-            data_rate['server_time'] = data.get('server_time', '')
-            data_rate['time_game'] = data.get('time_game', '')
-            json_data = json.dumps(data_rate, ensure_ascii=False)
-            if not self.debug:
-                await self.redis_client.add_to_list(key_for_all_data, json_data)
+    async def flush_games(self):
+        """
+        Сохраняет игры такта по отдельным ключам в Redis одним
+        pipeline: история, списки по порогу коэффициентов и чтение
+        последних данных fb.com для уведомлений в Telegram.
+        """
+        games, self.pending_games = self.pending_games, []
+        if not games or self.debug:
+            return
+        try:
+            batch = self.redis_client.batch()
+            messages = {}
+            for liga_name, data in games:
+                # Коэффициенты уже разобраны в числа при извлечении
+                bets = data.bets()
+                data_rate = dict(data.rate)
+                data_rate.update(bets)
+
+                # Проверяем, нужно ли сохранять данные в Redis
+                is_save = any(0 < bet <= 1.73 for bet in bets.values())
+                opponent_0 = data.opponent_0
+                opponent_1 = data.opponent_1
+                keys = GameKeys(
+                    NAME_BOOKMAKER, liga_name, opponent_0, opponent_1)
+                data_rate['server_time'] = data.server_time
+                data_rate['time_game'] = data.time_game
+                point = encode_point(
+                    data_rate, data.time_game, data.tick.epoch_ms,
+                    data.server_time)
+                batch.add_history(keys, point, data.tick.epoch_ms)
                 if is_save:
-                    await self.redis_client.add_to_list(key_for_save, json_data)
+                    batch.add_alert(keys, point)
                 # Проверяем, нужно ли отправить данные в Telegram
-            is_send_tg = any(0 <
-                data_rate[rate_bet] <= 1.68 for rate_bet in rate_bets)
-            if is_send_tg:
-                key_fb = (f"fb.com_all_data, {liga_name.lower()}, "
-                       f"{opponent_0.lower()}, {opponent_1.lower()}")
-                # Получаем данные из Redis
-                if not self.debug:
-                    data_fb = await self.redis_client.get_last_item(key_fb)
-                    if data_fb:
-                        data_fb['site'] = 'FB'
+                if any(0 < bet <= 1.68 for bet in bets.values()):
+                    game = (liga_name, opponent_0, opponent_1)
+                    batch.get_last_history(keys.on('fb.com'), game)
                     data_rate.update({
                         'opponent_0': opponent_0,
                         'opponent_1': opponent_1,
                         'liga': liga_name,
                         'site': 'OB'
                     })
-                    await send_message_to_telegram(
-                        data_rate,
-                        data_fb
-                    )
+                    messages[game] = data_rate
+
+            # Данные fb.com по играм такта
+            last_items = await batch.execute()
+            for game, data_rate in messages.items():
+                data_fb = last_items.get(game)
+                if data_fb:
+                    data_fb['site'] = 'FB'
+                await send_message_to_telegram(
+                    data_rate,
+                    data_fb
+                )
 
         except Exception as e:
             await self.send_to_logs(f'Ошибка при сохранении данных: {str(e)}')
@@ -170,12 +260,71 @@ class FetchAkty:
             )
             return
         try:
-            json_data = json.dumps(data, ensure_ascii=False)
+            if SOCKET_PROTOCOL == 'delta':
+                data = self.encode_delta(data)
+                if data is None:
+                    return
+            json_data = json.dumps(
+                data, ensure_ascii=False, default=snapshot_json)
             # Отправляем данные на Socket.IO сервер напрямую
             await self.sio.emit('message', json_data)
         except Exception as e:
+            # Подписчики пропустили сообщение: следующим идёт снапшот
+            self.delta_encoder.needs_snapshot = True
             await self.send_to_logs(f'Ошибка при отправке данных: {str(e)}')
 
+    def encode_delta(
+            self,
+            data: dict
+    ) -> dict | None:
+        """
+        Кодирует данные такта в сообщение протокола дельт. Если
+        подписчики могли пропустить сообщения (первая отправка, сбой,
+        переподключение), вместо дельты отправляется снапшот всех игр.
+
+        :param data: Данные такта.
+        :return: Сообщение delta/snapshot или None, если изменений нет.
+        """
+        if self.delta_encoder.needs_snapshot:
+            return self.delta_encoder.snapshot({
+                league: list(games.values())
+                for league, games in self.previous_data.items()
+            })
+        return self.delta_encoder.encode(data)
+
+    async def publish(
+            self,
+            data: dict
+    ) -> None:
+        """
+        Отправляет данные такта в фоне, чтобы извлечение следующего
+        такта шло параллельно с отправкой текущего. Перед запуском
+        новой отправки дожидается предыдущей, порядок тактов сохраняется.
+
+        :param data: Данные для отправки.
+        """
+        async with self.publish_lock:
+            if self.publish_task:
+                await self.publish_task
+            self.publish_task = asyncio.create_task(self.send_data(data))
+
+    async def listen_server(self) -> None:
+        """
+        Обрабатывает события сервера Socket.IO. По событию 'resync'
+        (у сервера нет полного состояния игр, например после его
+        перезапуска, или он пропустил сообщение) сразу отправляет
+        снапшот всех игр. Рассылка сообщений подписчикам, которую
+        получает и парсер, пропускается.
+        """
+        while True:
+            try:
+                event, *_ = await self.sio.receive()
+            except socketio.exceptions.DisconnectedError:
+                return
+            if event == 'resync':
+                self.delta_encoder.needs_snapshot = True
+                await self.publish({NAME_BOOKMAKER: {}})
+
     async def init_async_components(self):
         """
         Инициализация асинхронных компонентов, таких как Redis клиент и подключение к Socket.IO.
@@ -189,6 +338,10 @@ class FetchAkty:
             if not self.sio.connected:
                 await self.sio.connect(SOCKETIO_URL,
                                    auth={'socket_key': SOCKET_KEY})
+                # Новое подключение начинается со снапшота
+                self.delta_encoder.needs_snapshot = True
+            if self.listen_task is None or self.listen_task.done():
+                self.listen_task = asyncio.create_task(self.listen_server())
         except Exception as e:
             print(f"Error initializing async components: {e}")
             raise
@@ -210,9 +363,25 @@ class FetchAkty:
         while attempt < retries:
             try:
                 options = uc.ChromeOptions()
-                if self.proxy:
-                    options.add_argument(f'--proxy-server={self.proxy}')
-                driver = uc.Chrome(options=options, headless=headless)
+                if MONITOR_MODE == 'network':
+                    enable_performance_log(options)
+                if BROWSER_HOST:
+                    # Вкладка в общем браузере вместо отдельного Chrome
+                    driver = open_tab(
+                        'akty',
+                        options=options,
+                        proxy=self.proxy,
+                        headless=headless
+                    )
+                else:
+                    if self.proxy:
+                        options.add_argument(f'--proxy-server={self.proxy}')
+                    driver = uc.Chrome(
+                        options=options,
+                        headless=headless,
+                        user_data_dir=os.path.join(AKTY_PROFILE_DIR, 'chrome')
+                    )
+                block_resources(driver, ALLOWED_URLS)
                 return driver
             except WebDriverException as e:
                 attempt += 1
@@ -232,7 +401,7 @@ class FetchAkty:
 
         :param url: URL страницы для загрузки.
         """
-        self.driver.get(url)
+        await self.browser.get(url)
 
     async def scroll_to_element(
             self,
@@ -244,7 +413,7 @@ class FetchAkty:
 
         :param element: WebElement, до которого необходимо прокрутить страницу.
         """
-        self.driver.execute_script(
+        await self.browser.execute_script(
             "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
             element)
 
@@ -262,14 +431,14 @@ class FetchAkty:
         scroll_pause_time = 0.1  # Уменьшенная пауза  для плавности
         scroll_step = 100  # Количество пикселей для каждой прокрутки
 
-        last_height = self.driver.execute_script(
+        last_height = await self.browser.execute_script(
             "return document.body.scrollHeight")
 
         while True:
-            self.driver.execute_script("window.scrollBy(0, arguments[0]);",
-                                       scroll_step)
+            await self.browser.execute_script(
+                "window.scrollBy(0, arguments[0]);", scroll_step)
             await asyncio.sleep(scroll_pause_time)
-            new_height = self.driver.execute_script(
+            new_height = await self.browser.execute_script(
                 "return document.body.scrollHeight")
 
             if new_height == last_height:
@@ -292,8 +461,9 @@ class FetchAkty:
         если элемент не был найден в течение заданного времени.
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            element = await self.browser.wait(
+                EC.presence_of_element_located((by, value)),
+                timeout
             )
             # Проверяем наличие элемента с сообщением о входе в другой сессии
             if await self.is_logged_in_elsewhere():
@@ -314,6 +484,27 @@ class FetchAkty:
             else:
                 breakpoint()
 
+    async def wait_until(
+            self,
+            condition,
+            timeout: int,
+            description: str
+    ):
+        """
+        Ожидает выполнения условия вместо фиксированной паузы.
+
+        :param condition: Условие WebDriverWait (expected_conditions или функция).
+        :param timeout: Таймаут этапа в секундах.
+        :param description: Описание этапа для сообщения об ошибке.
+        :return: Результат условия.
+        :raises TimeoutException: Если условие не выполнено за timeout.
+        """
+        return await self.browser.wait(
+            condition,
+            timeout,
+            message=f'Таймаут этапа "{description}" ({timeout} с)'
+        )
+
     async def is_logged_in_elsewhere(self) -> bool:
         """
         Проверяет, отображается ли на странице сообщение о входе в другом месте.
@@ -321,11 +512,13 @@ class FetchAkty:
         :return: True, если сообщение отображается, иначе False.
         """
         try:
-            message_element = self.driver.find_element(By.CSS_SELECTOR,
-                                                       ".ant-mowin-s2-messageBox")
-            if message_element and "账户在其它地方登录" in message_element.text:
-                print(message_element.text())
-                return True
+            message_element = await self.browser.find_element(
+                By.CSS_SELECTOR, ".ant-mowin-s2-messageBox")
+            if message_element:
+                text = await self.browser.call(getattr, message_element, 'text')
+                if "账户在其它地方登录" in text:
+                    print(text)
+                    return True
         except NoSuchElementException:
             return False
         return False
@@ -345,29 +538,27 @@ class FetchAkty:
 
     async def check_changed_dict(
             self,
-            existing_list: List[Dict[str, Any]],
-            game_info: Dict[str, Any],
+            previous_index: GameIndex,
+            game_info: GameSnapshot,
             liga_name: str,
     ) -> bool | None:
         """
-        Проверяет и обновляет список словарей, если конкретный словарь изменился, или добавляет его, если его нет.
+        Проверяет, изменились ли коэффициенты игры по сравнению со
+        снимком прошлого такта, и сохраняет изменившуюся игру.
 
-        :param existing_list: Список существующих словарей.
-        :param game_info: Новый словарь для добавления или обновления.
+        :param previous_index: Индекс игр прошлого такта.
+        :param game_info: Новый словарь игры.
         :param liga_name: Наименование лиги.
-        :return: True, если данные изменились и были сохранены, иначе False.
-        """
-        new_dict = copy.deepcopy(game_info)
-        for existing_dict in existing_list:
-            if (existing_dict['opponent_0'] == new_dict['opponent_0'] and
-                    existing_dict['opponent_1'] == new_dict['opponent_1']):
-                if (existing_dict['rate'] != new_dict['rate']) and (
-                        existing_dict['opponent_0'] != existing_dict[
-                    'opponent_1']):
-                    await self.save_games(new_dict, liga_name)
-                    return True
-                return False
-        return True
+        :return: True, если игра новая или данные изменились и были
+            сохранены, иначе False.
+        """
+        if previous_index.get(liga_name, game_info) is None:
+            return True
+        if (previous_index.rate_changed(liga_name, game_info) and
+                game_info['opponent_0'] != game_info['opponent_1']):
+            await self.save_games(game_info, liga_name)
+            return True
+        return False
 
     async def authorization(
             self
@@ -376,18 +567,34 @@ class FetchAkty:
         Авторизация на странице.
         """
         await self.get_url(self.url)
-        login_input = await self.wait_for_element(By.CSS_SELECTOR,
-                                            "input[placeholder*='账号']",
-                                            timeout=60)
-        await asyncio.sleep(15)
-        login_input.send_keys(LOGIN)
+        await self.wait_for_element(By.CSS_SELECTOR,
+                                    LOGIN_INPUT,
+                                    timeout=60)
+        # Форма готова, когда поле логина доступно для ввода
+        login_input = await self.wait_until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, LOGIN_INPUT)),
+            NAVIGATION_TIMEOUTS['login_form'],
+            'форма входа'
+        )
+        self.startup_timer.mark('page_load')
+        await self.browser.call(login_input.send_keys, LOGIN)
         password_input = await self.wait_for_element(By.CSS_SELECTOR,
                                                "input[placeholder='密码']")
-        password_input.clear()
-        password_input.send_keys(PASSWORD)
-        await asyncio.sleep(3)
-        password_input.send_keys(Keys.ENTER)
-        password_input.send_keys(Keys.ENTER)
+        await self.browser.call(password_input.clear)
+        await self.browser.call(password_input.send_keys, PASSWORD)
+        await self.wait_until(
+            lambda driver: password_input.get_attribute('value') == PASSWORD,
+            NAVIGATION_TIMEOUTS['login_form'],
+            'ввод пароля'
+        )
+        await self.browser.call(password_input.send_keys, Keys.ENTER)
+        await self.browser.call(password_input.send_keys, Keys.ENTER)
+        await self.wait_until(
+            EC.invisibility_of_element_located((By.CSS_SELECTOR, LOGIN_INPUT)),
+            NAVIGATION_TIMEOUTS['login'],
+            'вход в систему'
+        )
+        self.startup_timer.mark('login')
         await self.send_to_logs('Авторизация успешно пройдена')
 
     async def translate_and_cache(self, text: str) -> str:
@@ -395,38 +602,75 @@ class FetchAkty:
         Перевод строки на русский язык с кэшированием результата.
 
         Если строка пустая или после очистки становится пустой, возвращает исходную строку.
+        Если перевода нет в кэше, строка ставится в очередь фонового
+        перевода и до его получения возвращается без изменений.
         """
         try:
             if not text:
                 return text
 
-            sanitized_name = text.translate(
-                str.maketrans('', '', ' (),女')).strip().lower()
+            sanitized_name = sanitize_name(text)
 
             if not sanitized_name:  # Проверяем, не стала ли строка пустой после очистки
                 return text
 
-            for key in self.translate_cash:
-                if key in sanitized_name:
-                    return self.translate_cash[key]
+            # Ключ словаря, содержащийся в названии
+            cached = self.translate_index.find_within(sanitized_name)
+            if cached is None:
+                # Перевод мог добавить парсер другого сайта
+                self.translate_index.update(self.translate_store.refresh())
+                cached = self.translate_index.find_within(sanitized_name)
+            if cached is not None:
+                return cached
 
-            translation = self.translator.translate(sanitized_name,
-                                                    "english").result.lower()
-            self.translate_cash = load_translate_cash()
-            self.translate_cash[sanitized_name] = translation
-            save_translate_cash(self.translate_cash)
+            self.translate_queue.request(sanitized_name, text)
+            return text
 
+        except Exception as e:
             await self.send_to_logs(
-                f"Перевод текста: '{sanitized_name}' перевод: '{translation}'"
+                f"Ошибка при переводе: {e}, текст: '{sanitized_name}'"
             )
+            return text
+
+    def translate_text(self, text: str) -> str:
+        """
+        Перевод очищенного названия (блокирующий сетевой вызов,
+        выполняется в фоне через self.translate_queue).
 
-            return translation
+        :param text: Очищенное название.
+        :return: Перевод в нижнем регистре.
+        """
+        return self.translator.translate(text, "english").result.lower()
 
-        except Exception as e:
+    async def apply_translations(self) -> List[LifecycleEvent]:
+        """
+        Применяет завершённые фоновые переводы: перевод сохраняется
+        в словарь, а игры, показанные под названием со страницы,
+        переносятся под перевод - со следующего такта они идут под ним.
+
+        :return: События 'renamed' для игр с временными названиями.
+        """
+        events = []
+        for result in self.translate_queue.drain():
+            if result.translation is None:
+                await self.send_to_logs(
+                    f"Ошибка при переводе: {result.error}, "
+                    f"текст: '{result.name}'"
+                )
+                continue
+            self.translate_store.add(result.name, result.translation)
+            self.translate_index.add(result.name, result.translation)
             await self.send_to_logs(
-                f"Ошибка при переводе: {e}, текст: '{sanitized_name}'"
+                f"Перевод текста: '{result.name}' "
+                f"перевод: '{result.translation}'"
             )
-            return text
+            for raw_name in result.raw_names:
+                if raw_name != result.translation:
+                    events.extend(self.lifecycle.rename_team(
+                        raw_name, result.translation))
+            # Карточки с названием со страницы разбираются заново
+            self.card_cache.clear()
+        return events
 
     async def main_page(
             self
@@ -439,47 +683,54 @@ class FetchAkty:
         """
         max_retries = 3
 
+        def hover_sport_menu(driver):
+            # Наводим курсор, пока меню не раскроется и пункт не станет кликабельным
+            ActionChains(driver).move_to_element(span_element).perform()
+            elements = driver.find_elements(By.XPATH, SPORT_MENU_XPATH)
+            if elements and elements[0].is_displayed() and elements[0].is_enabled():
+                return elements[0]
+            return False
+
         for attempt in range(max_retries):
             try:
-                await asyncio.sleep(15)
                 ul_element = await self.wait_for_element(
                     By.CLASS_NAME,
                     "header__venue__3IZlT",
                     timeout=30
                 )
                 if ul_element:
-                    span_element = ul_element.find_element(
+                    span_element = await self.browser.call(
+                        ul_element.find_element,
                         By.XPATH,
                         ".//span[text()='体育']"
                     )
-                    self.action.move_to_element(span_element).perform()
-                    await asyncio.sleep(2)
-                    # Проверка кликабельности элемента
-
-                    h4_element = await self.wait_for_element(
-                        By.XPATH,
-                        "//img[@src='https://senbackkg.m42i79a.com/main-consumer-web/assets-oss/ak/images/header/ty-hq.862daf053a4b08ea6650a4e85ece1711.webp?x-oss-process=image/resize,w_210,h_210/quality,Q_100/sharpen,100/format,webp']"
+                    h4_element = await self.wait_until(
+                        hover_sport_menu,
+                        NAVIGATION_TIMEOUTS['sport_menu'],
+                        'меню спорта'
                     )
-
-                    if h4_element.is_displayed() and h4_element.is_enabled():
-                        h4_element.click()
-                        return
-                    else:
-                        # Если элемент не кликабелен, перезагружаем страницу и повторяем
-                        self.driver.refresh()
-                        await asyncio.sleep(5)
-                        continue
-                else:
-                    self.driver.refresh()
-                    await asyncio.sleep(5)
-                    continue
+                    await self.browser.call(h4_element.click)
+                    self.startup_timer.mark('sport_menu')
+                    return
+
+                await self.browser.refresh()
+                await self.wait_until(
+                    document_ready,
+                    NAVIGATION_TIMEOUTS['page_load'],
+                    'загрузка страницы'
+                )
 
             except Exception as e:
                 logger.error(
                     f"Попытка {attempt + 1}/{max_retries} не удалась: {str(e)}")
                 if attempt < max_retries - 1:
-                    self.driver.refresh()
-                    await asyncio.sleep(5)
+                    # Если элемент не кликабелен, перезагружаем страницу и повторяем
+                    await self.browser.refresh()
+                    await self.wait_until(
+                        document_ready,
+                        NAVIGATION_TIMEOUTS['page_load'],
+                        'загрузка страницы'
+                    )
                 else:
                     raise e
 
@@ -501,31 +752,139 @@ class FetchAkty:
             "iframe[title='venuIframe']",
             timeout=60
         )
-        await asyncio.sleep(20)
-        self.driver.switch_to.frame(iframe_element)
+        self.venue_url = await self.browser.call(
+            iframe_element.get_attribute, 'src')
+        await self.wait_until(
+            EC.frame_to_be_available_and_switch_to_it(iframe_element),
+            NAVIGATION_TIMEOUTS['iframe'],
+            'iframe площадки'
+        )
         basketball_element = await self.wait_for_element(
-            By.XPATH, '//span[@class="menu-text" and text()="篮球"]',
+            By.XPATH, BASKETBALL_MENU_XPATH,
             timeout=60
         )
         if basketball_element:
-            basketball_element.click()
+            basketball_element = await self.wait_until(
+                EC.element_to_be_clickable(basketball_element),
+                NAVIGATION_TIMEOUTS['basketball_menu'],
+                'меню баскетбола'
+            )
+            await self.browser.call(basketball_element.click)
+            self.startup_timer.mark('iframe_ready')
         else:
-            window_size = self.driver.get_window_size()
+            window_size = await self.browser.call(self.driver.get_window_size)
             window_width = window_size['width']
             # Вычисляем координаты для клика в правый верхний угол
             right_upper_x = window_width - 1  # 1 пиксель левее правой границы
             right_upper_y = 1
-            self.actions.move_by_offset(right_upper_x, right_upper_y).click().perform()
+            await self.browser.call(self.action.move_by_offset(
+                right_upper_x, right_upper_y).click().perform)
             await self.aggregator_page()
 
         await self.send_to_logs('Успешный переход в раздел баскетбола')
 
+    async def save_session(self) -> None:
+        """
+        Сохраняет снимок авторизованной сессии: cookies всех доменов,
+        адрес iframe площадки и его localStorage.
+        Вызывается, когда драйвер уже находится внутри iframe.
+        """
+        if not self.venue_url:
+            return
+        try:
+            session = {
+                'venue_url': self.venue_url,
+                'cookies': (await self.browser.execute_cdp_cmd(
+                    'Network.getAllCookies', {}))['cookies'],
+                'local_storage': await self.browser.execute_script(
+                    'return Object.assign({}, window.localStorage);'),
+                'saved_at': datetime.now(
+                    tz=ZoneInfo("Europe/Moscow")).isoformat(),
+            }
+            os.makedirs(AKTY_PROFILE_DIR, exist_ok=True)
+            with open(SESSION_FILE, 'w', encoding='utf-8') as file:
+                json.dump(session, file, ensure_ascii=False)
+            await self.send_to_logs('Сессия сохранена')
+        except Exception as e:
+            await self.send_to_logs(f'Не удалось сохранить сессию: {e}')
+
+    async def restore_session(
+            self,
+            timeout: int = 30
+    ) -> bool:
+        """
+        Быстрый вход: восстанавливает сохранённую сессию и открывает
+        iframe площадки напрямую, минуя авторизацию и главную страницу.
+
+        :param timeout: Время ожидания меню баскетбола в секундах.
+        :return: True, если сессия действительна и открыт раздел баскетбола.
+        """
+        if not os.path.exists(SESSION_FILE):
+            return False
+        try:
+            with open(SESSION_FILE, encoding='utf-8') as file:
+                session = json.load(file)
+            cookies = [
+                {field: cookie[field] for field in COOKIE_FIELDS
+                 if field in cookie}
+                for cookie in session.get('cookies', [])
+            ]
+            await self.browser.execute_cdp_cmd('Network.enable', {})
+            await self.browser.execute_cdp_cmd(
+                'Network.setCookies', {'cookies': cookies})
+            await self.browser.get(session['venue_url'])
+            await self.browser.execute_script(
+                'for (const [key, value] of Object.entries(arguments[0])) {'
+                '    window.localStorage.setItem(key, value);'
+                '}',
+                session.get('local_storage', {})
+            )
+            await self.browser.refresh()
+            self.startup_timer.mark('page_load')
+
+            # Не используем wait_for_element: при таймауте он закрывает драйвер
+            basketball_element = await self.wait_until(
+                EC.element_to_be_clickable((By.XPATH, BASKETBALL_MENU_XPATH)),
+                timeout,
+                'меню баскетбола'
+            )
+            if await self.is_logged_in_elsewhere():
+                raise TimeoutException('Сессия открыта в другом месте')
+            await self.browser.call(basketball_element.click)
+            self.startup_timer.mark('iframe_ready')
+            self.venue_url = session['venue_url']
+            await self.send_to_logs(
+                f"Сессия от {session.get('saved_at')} восстановлена, "
+                f"переход в раздел баскетбола без авторизации")
+            return True
+        except Exception as e:
+            await self.send_to_logs(
+                f'Сохранённая сессия недействительна ({e}), полный вход')
+            os.remove(SESSION_FILE)
+            return False
+
     async def change_zoom(
             self
     ):
-        self.driver.get('chrome://settings/appearance')
-        self.driver.execute_script(
-            'chrome.settingsPrivate.setDefaultZoom(0.25);'
+        """
+        Уменьшает масштаб вкладки до PAGE_ZOOM, чтобы на экран
+        помещалось больше карточек.
+
+        Масштаб задаётся эмуляцией размеров окна только для этой
+        вкладки: страница раскладывается в окне в 1/PAGE_ZOOM раз больше
+        и отрисовывается с плотностью пикселей PAGE_ZOOM, как при
+        масштабе браузера. Масштаб по умолчанию в chrome://settings
+        изменил бы все вкладки общего браузера (BROWSER_HOST).
+        """
+        size = await self.browser.call(self.driver.get_window_size)
+        await self.browser.execute_cdp_cmd(
+            'Emulation.setDeviceMetricsOverride',
+            {
+                'width': round(size['width'] / PAGE_ZOOM),
+                'height': round(size['height'] / PAGE_ZOOM),
+                'deviceScaleFactor': PAGE_ZOOM,
+                'mobile': False,
+            }
         )
 
     async def get_content(
@@ -534,7 +893,7 @@ class FetchAkty:
         """
         Получение контента с страницы с 5 попытками.
 
-        :return: Объект BeautifulSoup с содержимым HTML или None, если контент не найден.
+        :return: Разобранный HTML (см. parse_html) или None, если контент не найден.
         """
         max_attempts = 6
         attempt = 0
@@ -547,8 +906,8 @@ class FetchAkty:
             )
 
             if element:
-                html = element.get_attribute('outerHTML')
-                soup = BeautifulSoup(html, 'html.parser')
+                html = await self.browser.outer_html(element)
+                soup = parse_html(html)
                 return soup
             logger.info(
                 f"Внимание! Отсутствие контента на странице,"
@@ -566,13 +925,25 @@ class FetchAkty:
 
     async def get_container_hash(self) -> str:
         """
-        Получение хэш-суммы контейнера с играми.
+        Получение отпечатка контейнера с играми.
+
+        Отпечаток считается внутри страницы и возвращает несколько байт.
+        Если контейнер не найден, HTML загружается через get_content,
+        а разобранное дерево сохраняется в self.container_soup для
+        повторного использования в extract_league_data.
         :return: str
         """
+        self.container_soup = None
+        fingerprint = await self.browser.execute_script(
+            AKTY_CONTAINER_FINGERPRINT_JS)
+        if fingerprint:
+            return fingerprint
+
         soup = await self.get_content()
 
         if not soup:
             return ''
+        self.container_soup = soup
         return hashlib.md5(str(soup).encode('utf-8')).hexdigest()
 
     async def click_element_by_text(self, card) -> None:
@@ -588,16 +959,17 @@ class FetchAkty:
                 card_style = card['style']
 
                 # Если есть скрытые элементы (высота 37px), нажимаем кнопку для изменения состояния
-                if re.search(r'height:\s*37px;', card_style):
+                if COLLAPSED_STYLE.search(card_style):
                     spoiler_button = await self.wait_for_element(
                         By.CSS_SELECTOR,
                         "div[class*='match-type']",
                         timeout=30)
-                    current_style = spoiler_button.get_attribute('style')
+                    current_style = await self.browser.call(
+                        spoiler_button.get_attribute, 'style')
 
                     # Нажимаем на кнопку, если она в состоянии скрытия элементов
-                    if re.search(r'height:\s*37px;', current_style):
-                        spoiler_button.click()
+                    if COLLAPSED_STYLE.search(current_style):
+                        await self.browser.call(spoiler_button.click)
                         await asyncio.sleep(5)
                         await self.send_to_logs(
                             'Переключение видимости лиг произошло успешно')
@@ -611,6 +983,179 @@ class FetchAkty:
             await self.send_to_logs(f'При переключении произошла ошибка: {e}')
             await self.run()
 
+    @staticmethod
+    def card_row_key(card) -> str:
+        """
+        Ключ содержимого карточки для кэша разобранных строк.
+
+        Состоит из текста карточки без игрового таймера, который меняется
+        каждую секунду и не влияет на сравнение коэффициентов.
+
+        :param card: HTML-элемент карточки с матчами.
+        :return: Ключ карточки.
+        """
+        text = card.get_text('\x1f')
+        for timer in card.find_all('span', class_='timer-layout2'):
+            text = text.replace(timer.get_text(), '', 1)
+        return text
+
+    def match_time_game(self, list_mid_element) -> str:
+        """
+        Период и игровое время матча вида 'II 05:32'.
+
+        :param list_mid_element: HTML-элемент матча (c-match-item).
+        :return: Строка time_game.
+        """
+        process_time_span = list_mid_element.find('span',
+                                                  class_='timer-layout2')
+        process_time = process_time_span.get_text() if process_time_span else ""
+
+        process_time_div_text = list_mid_element.find('div',
+                                                      class_='process_name')
+        process_time_text = self.time_game_translate.get(
+            process_time_div_text.get_text().strip(),
+            ''
+        ) if process_time_div_text else ""
+        return f'{process_time_text} {process_time}'
+
+    def drained_clocks(
+            self,
+            clocks: Dict[str, List[str]]
+    ) -> Dict[str, str]:
+        """
+        Игровое время матчей из AKTY_DRAIN_OBSERVER_JS в виде time_game,
+        как в match_time_game.
+
+        :param clocks: Ключ матча -> [период, таймер] со страницы.
+        :return: Ключ матча -> time_game.
+        """
+        return {
+            key: f'{self.time_game_translate.get(period, "")} {timer}'
+            for key, (period, timer) in clocks.items()
+        }
+
+    def refresh_card_games(
+            self,
+            card,
+            games: List[GameSnapshot],
+            tick: Tick
+    ) -> List[GameSnapshot]:
+        """
+        Обновляет у разобранных ранее игр карточки игровое время и такт,
+        которые не входят в ключ кэша (см. card_row_key).
+
+        :param card: HTML-элемент карточки с матчами.
+        :param games: Игры карточки из кэша, в порядке parse_match_card.
+        :param tick: Такт извлечения.
+        :return: Игры с текущими time_game и tick.
+        """
+        match_items = [
+            list_mid_element
+            for list_mid_element in card.find_all('div',
+                                                  class_='c-match-item')
+            if list_mid_element.find('div', class_='row-item team-item') and
+            list_mid_element.find('div', class_='row-item team-item soon')
+        ]
+        return [
+            game_info.replace(
+                time_game=self.match_time_game(list_mid_element),
+                tick=tick)
+            for game_info, list_mid_element in zip(games, match_items)
+        ]
+
+    async def parse_match_card(
+            self,
+            card,
+            league_name: str,
+            tick: Tick = None
+    ) -> List[GameSnapshot]:
+        """
+        Извлечение данных матчей из одной карточки лиги.
+
+        :param card: HTML-элемент карточки с матчами.
+        :param league_name: Переведённое наименование лиги.
+        :param tick: Такт извлечения, по умолчанию текущий момент.
+        :return: Список записей матчей.
+        """
+        if tick is None:
+            tick = Tick.now()
+        games = []
+        list_mid_elements = card.find_all('div',
+                                          class_='c-match-item')
+        for list_mid_element in list_mid_elements:
+            opponent_0 = list_mid_element.find('div',
+                                               class_='row-item team-item')
+            opponent_1 = list_mid_element.find('div',
+                                               class_='row-item team-item soon')
+
+            if opponent_0 and opponent_1:
+                opponent_0_name = opponent_0.find('div',
+                                                  class_=TEAM_NAME_CLASS).get_text()
+                translate_opponent_0_name = await self.translate_and_cache(
+                    opponent_0_name) if opponent_0_name != '' else ''
+                opponent_1_name = opponent_1.find('div',
+                                                  class_=TEAM_NAME_CLASS).get_text()
+                translate_opponent_1_name = await self.translate_and_cache(
+                    opponent_1_name) if opponent_1_name != '' else ''
+
+                opponent_0_score_div = opponent_0.find('div',
+                                                       class_='score')
+                opponent_0_score = opponent_0_score_div.find(
+                    'span').get_text() if opponent_0_score_div else ""
+                opponent_1_score_div = opponent_1.find('div',
+                                                       class_='score')
+                opponent_1_score = opponent_1_score_div.find(
+                    'span').get_text() if opponent_1_score_div else ""
+
+                bet_divs = card.find_all('div', class_='handicap-col')
+                handicap_bet_div = bet_divs[1].find_all('span',
+                                                        class_='highlight-odds')
+                handicap_point_divs = bet_divs[1].find_all('div',
+                                                           class_='handicap-value-text')
+
+                opponent_0_handicap_bet = handicap_bet_div[
+                    0].get_text().replace("EU ", "") if len(handicap_bet_div) > 0 else ""
+                opponent_0_handicap_point = handicap_point_divs[
+                    0].get_text().strip() if len(
+                    handicap_point_divs) > 0 else ""
+                opponent_1_handicap_bet = handicap_bet_div[
+                    1].get_text().replace("EU ", "") if len(handicap_bet_div) > 1 else ""
+                opponent_1_handicap_point = handicap_point_divs[
+                    1].get_text().strip() if len(
+                    handicap_point_divs) > 1 else ""
+
+                total_bet_div = bet_divs[2].find_all('span',
+                                                     class_='highlight-odds')
+                total_point_divs = bet_divs[2].find_all('div',
+                                                        class_='handicap-value-text')
+
+                opponent_0_total_bet = total_bet_div[
+                    0].get_text().replace("EU ", "") if len(total_bet_div) > 0 else ""
+                opponent_0_total_point = total_point_divs[
+                    0].get_text().strip() if len(
+                    total_point_divs) > 0 else ""
+                opponent_1_total_bet = total_bet_div[
+                    1].get_text().replace("EU ", "") if len(total_bet_div) > 1 else ""
+
+                games.append(GameSnapshot(
+                    league=league_name,
+                    opponent_0=translate_opponent_0_name,
+                    opponent_1=translate_opponent_1_name,
+                    score_game=f'{opponent_0_score}:{opponent_1_score}',
+                    time_game=self.match_time_game(list_mid_element),
+                    rate={
+                        'total_point': opponent_0_total_point,
+                        'total_bet_0': opponent_0_total_bet,
+                        'total_bet_1': opponent_1_total_bet,
+                        'handicap_point_0': opponent_0_handicap_point,
+                        'handicap_bet_0': opponent_0_handicap_bet,
+                        'handicap_point_1': opponent_1_handicap_point,
+                        'handicap_bet_1': opponent_1_handicap_bet,
+                    },
+                    tick=tick,
+                ))
+        return games
+
     async def extract_league_data(
             self,
             target_leagues: dict
@@ -620,9 +1165,11 @@ class FetchAkty:
         :param target_leagues: dict
         :return: dict
         """
-        soup = await self.get_content()
+        # Используем дерево, уже загруженное в get_container_hash
+        soup = self.container_soup or await self.get_content()
+        self.container_soup = None
         leagues_data = {NAME_BOOKMAKER: {}}
-        previous_leagues_data = {NAME_BOOKMAKER: {}}
+        current_index = GameIndex()
         scroll_content = soup.find('div',
                                    class_='v-scroll-content relative-position')
 
@@ -631,11 +1178,12 @@ class FetchAkty:
 
         cards = scroll_content.find_all(
             'div',
-            class_=re.compile(
-                'list-card-wrap v-scroll-item relative-position'),
+            class_=CARD_CLASS,
             recursive=False
         )
 
+        tick = Tick.now()
+        clocks = {}
         league_name = None
         for card in cards:
             div_name_liga = card.find('span',
@@ -646,207 +1194,302 @@ class FetchAkty:
                     await self.click_element_by_text(card)
             elif league_name and league_name in target_leagues.keys():
                 league_name = target_leagues[league_name]
-                list_mid_elements = card.find_all('div',
-                                                  class_='c-match-item')
-                for list_mid_element in list_mid_elements:
-                    opponent_0 = list_mid_element.find('div',
-                                                       class_='row-item team-item')
-                    opponent_1 = list_mid_element.find('div',
-                                                       class_='row-item team-item soon')
-
-                    if opponent_0 and opponent_1:
-                        opponent_0_name = opponent_0.find('div',
-                                                          class_=re.compile(
-                                                              'allow-user-select')).get_text()
-                        translate_opponent_0_name = await self.translate_and_cache(
-                            opponent_0_name) if opponent_0_name != '' else ''
-                        opponent_1_name = opponent_1.find('div',
-                                                          class_=re.compile(
-                                                              'allow-user-select')).get_text()
-                        translate_opponent_1_name = await self.translate_and_cache(
-                            opponent_1_name) if opponent_1_name != '' else ''
-
-                        opponent_0_score_div = opponent_0.find('div',
-                                                               class_='score')
-                        opponent_0_score = opponent_0_score_div.find(
-                            'span').get_text() if opponent_0_score_div else ""
-                        opponent_1_score_div = opponent_1.find('div',
-                                                               class_='score')
-                        opponent_1_score = opponent_1_score_div.find(
-                            'span').get_text() if opponent_1_score_div else ""
-
-                        bet_divs = card.find_all('div', class_='handicap-col')
-                        handicap_bet_div = bet_divs[1].find_all('span',
-                                                                class_='highlight-odds')
-                        handicap_point_divs = bet_divs[1].find_all('div',
-                                                                   class_='handicap-value-text')
-
-                        opponent_0_handicap_bet = handicap_bet_div[
-                            0].get_text().replace("EU ", "") if len(handicap_bet_div) > 0 else ""
-                        opponent_0_handicap_point = handicap_point_divs[
-                            0].get_text().strip() if len(
-                            handicap_point_divs) > 0 else ""
-                        opponent_1_handicap_bet = handicap_bet_div[
-                            1].get_text().replace("EU ", "") if len(handicap_bet_div) > 1 else ""
-                        opponent_1_handicap_point = handicap_point_divs[
-                            1].get_text().strip() if len(
-                            handicap_point_divs) > 1 else ""
-
-                        total_bet_div = bet_divs[2].find_all('span',
-                                                             class_='highlight-odds')
-                        total_point_divs = bet_divs[2].find_all('div',
-                                                                class_='handicap-value-text')
-
-                        opponent_0_total_bet = total_bet_div[
-                            0].get_text().replace("EU ", "") if len(total_bet_div) > 0 else ""
-                        opponent_0_total_point = total_point_divs[
-                            0].get_text().strip() if len(
-                            total_point_divs) > 0 else ""
-                        opponent_1_total_bet = total_bet_div[
-                            1].get_text().replace("EU ", "") if len(total_bet_div) > 1 else ""
-
-                        process_time_span = list_mid_element.find('span',
-                                                                  class_='timer-layout2')
-                        process_time = process_time_span.get_text() if process_time_span else ""
-
-                        process_time_div_text = list_mid_element.find('div',
-                                                                      class_='process_name')
-                        process_time_text = self.time_game_translate.get(
-                            process_time_div_text.get_text().strip(),
-                            ''
-                        ) if process_time_div_text else ""
-
-                        server_time = datetime.now(
-                            tz=ZoneInfo("Europe/Moscow")).strftime("%H:%M:%S")
-
-                        game_info = {
-                            'opponent_0': translate_opponent_0_name,
-                            'opponent_1': translate_opponent_1_name,
-                            'score_game': f'{opponent_0_score}:{opponent_1_score}',
-                            'time_game': f'{process_time_text} {process_time}',
-                            'rate': {
-                                'total_point': opponent_0_total_point,
-                                'total_bet_0': opponent_0_total_bet,
-                                'total_bet_1': opponent_1_total_bet,
-                                'handicap_point_0': opponent_0_handicap_point,
-                                'handicap_bet_0': opponent_0_handicap_bet,
-                                'handicap_point_1': opponent_1_handicap_point,
-                                'handicap_bet_1': opponent_1_handicap_bet,
-                            },
-                            'server_time': server_time,
-                        }
-
-                        if league_name not in leagues_data[NAME_BOOKMAKER]:
-                            leagues_data[NAME_BOOKMAKER][league_name] = []
-                            previous_leagues_data[NAME_BOOKMAKER][
-                                league_name] = []
-
-                        if (
-                                self.previous_data and league_name in self.previous_data.get(
-                                NAME_BOOKMAKER, {})):
-                            changed_data = await self.check_changed_dict(
-                                self.previous_data[NAME_BOOKMAKER][league_name],
-                                game_info,
-                                league_name
-                            )
-                            if changed_data:
-                                leagues_data[NAME_BOOKMAKER][
-                                    league_name].append(game_info)
-
-                        previous_leagues_data[NAME_BOOKMAKER][
+                # Неизменившиеся карточки не разбираются заново
+                card_key = (league_name, self.card_row_key(card))
+                games = self.card_cache.get(card_key)
+                if games is None:
+                    games = await self.parse_match_card(
+                        card, league_name, tick)
+                else:
+                    games = self.refresh_card_games(card, games, tick)
+                self.card_cache.put(card_key, games)
+                for game_info in games:
+                    if league_name not in leagues_data[NAME_BOOKMAKER]:
+                        leagues_data[NAME_BOOKMAKER][league_name] = []
+
+                    if league_name in self.previous_data:
+                        changed_data = await self.check_changed_dict(
+                            self.previous_data,
+                            game_info,
+                            league_name
+                        )
+                        if changed_data:
+                            leagues_data[NAME_BOOKMAKER][
                                 league_name].append(game_info)
-        # Обновляем завершённые игры перед заменой previous_data
-        await self.update_ended_games(leagues_data, previous_leagues_data)
-        self.previous_data = previous_leagues_data
+
+                    current_index.put(league_name, game_info)
+                    clocks[game_key(game_info)] = game_info.time_game
+                    await self.track_game(league_name, game_info)
+        self.card_cache.end_tick()
+        self.previous_data = current_index
+        self.game_clocks = clocks
+        await self.flush_games()
         leagues_data[NAME_BOOKMAKER] = {
             k: v for k, v in leagues_data[NAME_BOOKMAKER].items() if v
         }
         if any(leagues_data[NAME_BOOKMAKER].values()):
             return leagues_data
 
-    async def update_ended_games(self, leagues_data: dict,
-                                 previous_leagues_data: dict) -> None:
-        """
-        Обновление словаря self.ended_games для отслеживания завершённых игр.
-
-        Если игра отсутствует в новом словаре leagues_data,
-        но присутствует в previous_leagues_data,
-        она добавляется в self.ended_games.
-        Если игра отсутствует в течение 2000 итераций,
-        то устанавливается флаг 'is_end_game' в True,
-        и игра удаляется из self.ended_games.
-
-        :param leagues_data: dict - Текущие данные игр, полученные с сайта.
-        :param previous_leagues_data: dict - Предыдущие данные игр.
-        """
-        for league, games in previous_leagues_data[NAME_BOOKMAKER].items():
-            for game_info in games:
-                opponent_0 = game_info['opponent_0']
-                opponent_1 = game_info['opponent_1']
-                unique_key = (league, opponent_0,
-                              opponent_1)
-                if league not in leagues_data[
-                    NAME_BOOKMAKER] or game_info not in \
-                        leagues_data[NAME_BOOKMAKER][league]:
-                    if unique_key not in self.ended_games:
-                        self.ended_games[unique_key] = {'info': game_info,
-                                                        'count': 0}
-                    else:
-                        self.ended_games[unique_key]['count'] += 1
-
-                        if self.ended_games[unique_key]['count'] >= 2000:
-                            leagues_data[NAME_BOOKMAKER][league][game_info][
-                                'is_end_game'] = True
-                            await self.send_to_logs(
-                                f"Игра окончательно завершена: \n"
-                                f" {leagues_data[NAME_BOOKMAKER][game_info]}"
-                            )
-                            await self.delete_games(
-                                leagues_data[NAME_BOOKMAKER][league][game_info],
-                                league
-                            )
-                            del self.ended_games[unique_key]
-                else:
-                    if unique_key in self.ended_games:
-                        del self.ended_games[unique_key]
+    async def install_observer(
+            self,
+            target_leagues: dict
+    ) -> bool:
+        """
+        Устанавливает на странице MutationObserver, который копит
+        изменившиеся карточки матчей целевых лиг.
+
+        :param target_leagues: Словарь с данными целевых лиг.
+        :return: True, если наблюдатель установлен.
+        """
+        return bool(await self.browser.execute_script(
+            AKTY_INSTALL_OBSERVER_JS,
+            list(target_leagues.keys())
+        ))
+
+    async def merge_changed_games(
+            self,
+            league_name: str,
+            games: List[GameSnapshot],
+            leagues_data: dict
+    ) -> None:
+        """
+        Сравнивает частично обновлённые игры лиги с previous_data,
+        добавляет изменившиеся в leagues_data и обновляет previous_data.
+
+        :param league_name: Переведённое наименование лиги.
+        :param games: Новые game_info этой лиги.
+        :param leagues_data: Накопитель изменившихся игр.
+        """
+        for game_info in games:
+            changed_data = await self.check_changed_dict(
+                self.previous_data,
+                game_info,
+                league_name
+            )
+            if changed_data:
+                leagues_data[NAME_BOOKMAKER].setdefault(
+                    league_name, []).append(game_info)
+            # Заменяем предыдущее состояние игры новым
+            self.previous_data.put(league_name, game_info)
+            await self.track_game(league_name, game_info)
+
+    async def extract_changed_rows(
+            self,
+            rows: List[Dict[str, str]],
+            target_leagues: dict
+    ) -> dict | None:
+        """
+        Извлечение данных только из изменившихся карточек,
+        переданных наблюдателем.
+
+        :param rows: Список {'league': ..., 'html': ...} из очереди наблюдателя.
+        :param target_leagues: Словарь с данными целевых лиг.
+        :return: Изменившиеся игры в формате extract_league_data или None.
+        """
+        leagues_data = {NAME_BOOKMAKER: {}}
+        tick = Tick.now()
+
+        for row in rows:
+            league_name = target_leagues.get(row['league'])
+            if not league_name:
+                continue
+            card = parse_html(row['html']).find('div')
+            if not card:
+                continue
+            await self.merge_changed_games(
+                league_name,
+                await self.parse_match_card(card, league_name, tick),
+                leagues_data
+            )
+        await self.flush_games()
+
+        if any(leagues_data[NAME_BOOKMAKER].values()):
+            return leagues_data
+        return None
+
+    async def feed_record_to_game_info(
+            self,
+            record: Dict[str, Any],
+            league_name: str,
+            tick: Tick = None
+    ) -> GameSnapshot:
+        """
+        Преобразует запись матча из сетевого фида в запись того же
+        вида, что строит parse_match_card.
+
+        :param record: Запись матча из FeedDecoder.
+        :param league_name: Переведённое наименование лиги.
+        :param tick: Такт извлечения, по умолчанию текущий момент.
+        :return: Запись матча.
+        """
+        if tick is None:
+            tick = Tick.now()
+        opponent_0 = record.get('opponent_0', '')
+        opponent_1 = record.get('opponent_1', '')
+        period = record.get('period', '')
+        return GameSnapshot(
+            league=league_name,
+            opponent_0=await self.translate_and_cache(
+                opponent_0) if opponent_0 != '' else '',
+            opponent_1=await self.translate_and_cache(
+                opponent_1) if opponent_1 != '' else '',
+            score_game=f"{record.get('score_0', '')}:{record.get('score_1', '')}",
+            time_game=f"{self.time_game_translate.get(period, period)} "
+                      f"{record.get('clock', '')}",
+            rate={
+                field: record['rate'].get(field, '').replace("EU ", "")
+                for field in RATE_FIELDS
+            },
+            tick=tick,
+        )
+
+    async def extract_feed_data(
+            self,
+            target_leagues: dict
+    ) -> dict | None:
+        """
+        Извлечение данных лиг из сетевого фида страницы, без разбора HTML.
+
+        :param target_leagues: Словарь с данными целевых лиг.
+        :return: Изменившиеся игры в формате extract_league_data или None.
+        """
+        leagues_data = {NAME_BOOKMAKER: {}}
+        records = self.feed_decoder.feed(
+            await self.browser.call(self.network_tap.read_payloads))
+        tick = Tick.now()
+
+        for record in records:
+            league_name = target_leagues.get(record['league'])
+            if not league_name:
+                continue
+            await self.merge_changed_games(
+                league_name,
+                [await self.feed_record_to_game_info(
+                    record, league_name, tick)],
+                leagues_data
+            )
+        await self.flush_games()
+        self.game_clocks = {
+            match_id: f"{self.time_game_translate.get(period, period)} {clock}"
+            for match_id, (period, clock) in self.feed_decoder.clocks(
+                target_leagues).items()
+        }
+
+        if any(leagues_data[NAME_BOOKMAKER].values()):
+            return leagues_data
+        return None
+
+    async def track_game(
+            self,
+            league_name: str,
+            game_info: GameSnapshot
+    ) -> None:
+        """
+        Отмечает игру как присутствующую на странице
+        (продлевает её срок жизни в self.lifecycle).
+
+        :param league_name: Переведённое наименование лиги.
+        :param game_info: Словарь игры.
+        """
+        event = self.lifecycle.seen(league_name, game_info)
+        if event:
+            await self.send_to_logs(
+                f"Новая игра: {league_name}, "
+                f"{game_info['opponent_0']} - {game_info['opponent_1']}")
+
+    async def collect_ended_games(self) -> dict | None:
+        """
+        Обрабатывает события окончания игр из self.lifecycle и игры
+        с временными названиями после перевода. Завершённая игра
+        помечается флагом 'is_end_game', её снимок удаляется из индекса
+        игр, а ключи - из Redis. Игра с временным названием переносится
+        под перевод в индексе игр и в Redis, подписчики получают
+        переименование и игру под новым названием (renamed_games).
+
+        :return: Завершённые и переименованные игры в формате
+            extract_league_data или None.
+        """
+        ended_data = {NAME_BOOKMAKER: {}}
+        # Матчи, пропавшие из сетевого фида, забываются вместе с играми
+        self.feed_decoder.expire(GAME_END_TTL)
+        events = await self.apply_translations()
+        for event in events + self.lifecycle.expire():
+            games = ended_data[NAME_BOOKMAKER].setdefault(event.league, [])
+            if event.kind == 'renamed':
+                await self.rename_games(
+                    event.game, event.renamed_to, event.league)
+                self.previous_data.pop(event.league, game_key(event.game))
+                self.previous_data.put(event.league, event.renamed_to)
+                games.extend(renamed_games(event.game, event.renamed_to))
+                continue
+            game_info = event.game.to_dict()
+            game_info['is_end_game'] = True
+            await self.send_to_logs(
+                f"Игра окончательно завершена: \n {game_info}")
+            await self.delete_games(game_info, event.league)
+            self.previous_data.pop(event.league, game_key(game_info))
+            games.append(game_info)
+        if ended_data[NAME_BOOKMAKER]:
+            return ended_data
+        return None
 
     async def delete_games(self, data: dict, liga_name: str):
         """
-        Удаляет игры по ключам из Redis.
+        Удаляет данные игры из Redis.
 
         Args:
             data (dict): Данные с информацией о ключах для удаления.
             liga_name (str): Наименование лиги для удаления данных в Redis.
         """
         try:
-            # Получаем оппонентов и преобразуем их к нижнему регистру
-            opponent_0 = data.get('opponent_0', '').lower()
-            opponent_1 = data.get('opponent_1', '').lower()
-            liga_name_lower = liga_name.lower()
-
-            # Базовая часть ключей
-            base_key = f"{liga_name_lower}, {opponent_0}, {opponent_1}"
-
-            # Генерируем ключи с использованием замены части строки
-            keys = [
-                f"akty.com, {base_key}",
-                f"akty.com_all_data, {base_key}",
-                f"fb.com, {base_key}",
-                f"fb.com_all_data, {base_key}"
-            ]
+            keys = GameKeys(
+                NAME_BOOKMAKER, liga_name,
+                data.get('opponent_0', ''), data.get('opponent_1', ''))
 
             if not self.debug:
-                # Удаляем данные из Redis по ключам
-                for key in keys:
-                    await self.redis_client.delete_data(key)
+                # Данные игры на обоих сайтах и записи в индексах
+                await self.redis_client.delete_game(keys)
 
             # Логируем успешное удаление
             await self.send_to_logs(
-                f"Данные для ключей '{', '.join(keys)}' успешно удалены.")
+                f"Данные игры '{keys.id}' успешно удалены.")
 
         except Exception as e:
             await self.send_to_logs(f'Ошибка при удалении данных: {e}')
 
+    async def rename_games(
+            self,
+            data: dict,
+            renamed: GameSnapshot,
+            liga_name: str
+    ):
+        """
+        Переносит данные игры в Redis под новые названия команд.
+
+        Args:
+            data (Mapping): Игра под прежними названиями.
+            renamed (GameSnapshot): Та же игра под новыми названиями.
+            liga_name (str): Наименование лиги.
+        """
+        try:
+            old = GameKeys(
+                NAME_BOOKMAKER, liga_name,
+                data.get('opponent_0', ''), data.get('opponent_1', ''))
+            new = GameKeys(
+                NAME_BOOKMAKER, liga_name,
+                renamed.opponent_0, renamed.opponent_1)
+
+            if not self.debug:
+                await self.redis_client.rename_game(old, new)
+
+            await self.send_to_logs(
+                f"Игра {old.opponent_0} - {old.opponent_1} "
+                f"переименована: {new.opponent_0} - {new.opponent_1}, "
+                f"данные '{old.id}' перенесены в '{new.id}'.")
+
+        except Exception as e:
+            await self.send_to_logs(f'Ошибка при переносе данных: {e}')
+
     async def monitor_leagues(
         self,
         target_leagues: dict,
@@ -856,37 +1499,167 @@ class FetchAkty:
         Мониторинг данных лиг.
 
         :param target_leagues: Словарь с данными целевых лиг.
-        :param check_interval: Интервал проверки в секундах.
+        :param check_interval: Интервал проверки во время игровых четвертей
+            в секундах; между четвертями и без матчей опрос реже
+            (см. PollScheduler).
         """
         previous_hash = await self.get_container_hash()
-        unchanged_count = 0
-        max_unchanged_checks = 3600
+        self.startup_timer.finish('first_tick')
+        scheduler = PollScheduler(live_interval=check_interval)
+        unchanged_time = 0
+        max_unchanged_time = 3600
 
         while True:
-            await asyncio.sleep(check_interval)
+            await asyncio.sleep(scheduler.interval)
             current_hash = await self.get_container_hash()
+            changed = current_hash != previous_hash
 
-            if current_hash != previous_hash:
+            if changed:
                 try:
                     leagues_data = await self.extract_league_data(target_leagues)
                     previous_hash = current_hash
-                    unchanged_count = 0
+                    unchanged_time = 0
                     if leagues_data:
-                        await self.send_data(leagues_data)
+                        await self.publish(leagues_data)
                 except Exception:
                     await self.send_to_logs(f'Ошибка: {traceback.format_exc()}')
             else:
-                unchanged_count += 1
+                unchanged_time += scheduler.interval
+            scheduler.observe(self.game_clocks, changed)
+
+            ended_data = await self.collect_ended_games()
+            if ended_data:
+                await self.publish(ended_data)
+
+            # Если данные не изменялись дольше max_unchanged_time секунд
+            if unchanged_time >= max_unchanged_time:
+                await self.send_to_logs(
+                    f"Данные не изменились более {max_unchanged_time} секунд. Перезапуск."
+                )
+                self.restart_required = True  # Устанавливаем флаг для перезапуска
+                break
+
+    async def monitor_leagues_push(
+        self,
+        target_leagues: dict,
+        check_interval: int = 1
+    ) -> None:
+        """
+        Мониторинг данных лиг по событиям MutationObserver.
+
+        Вместо полной выгрузки контейнера каждую секунду забирает из
+        страницы только изменившиеся карточки. Полное извлечение
+        выполняется при изменении структуры списка, потере наблюдателя
+        и раз в FULL_RESYNC_INTERVAL секунд.
+
+        :param target_leagues: Словарь с данными целевых лиг.
+        :param check_interval: Интервал опроса очереди во время игровых
+            четвертей в секундах (см. PollScheduler).
+        """
+        scheduler = PollScheduler(live_interval=check_interval)
+        unchanged_time = 0
+        max_unchanged_time = 3600
+        last_resync = None
+
+        while True:
+            try:
+                now = asyncio.get_running_loop().time()
+                changes = None
+                if last_resync is not None:
+                    changes = await self.browser.execute_script(
+                        AKTY_DRAIN_OBSERVER_JS)
+
+                if (changes is None or changes.get('resync') or
+                        now - last_resync >= FULL_RESYNC_INTERVAL):
+                    # Наблюдатель ставится до извлечения, чтобы
+                    # изменения во время него не потерялись
+                    if not await self.install_observer(target_leagues):
+                        await self.send_to_logs(
+                            'Не удалось установить наблюдатель, контейнер с играми не найден')
+                    leagues_data = await self.extract_league_data(target_leagues)
+                    self.startup_timer.finish('first_tick')
+                    if changes is None or changes.get('resync'):
+                        unchanged_time = 0
+                    last_resync = now
+                elif changes.get('rows'):
+                    leagues_data = await self.extract_changed_rows(
+                        changes['rows'], target_leagues)
+                    unchanged_time = 0
+                else:
+                    leagues_data = None
+                    unchanged_time += scheduler.interval
+
+                # Без наблюдателя (первый такт, перезагрузка страницы)
+                # время остаётся из полного извлечения
+                if changes is not None:
+                    self.game_clocks = self.drained_clocks(changes['clocks'])
+                if leagues_data:
+                    await self.publish(leagues_data)
+                scheduler.observe(self.game_clocks, bool(leagues_data))
+            except Exception:
+                await self.send_to_logs(f'Ошибка: {traceback.format_exc()}')
+
+            ended_data = await self.collect_ended_games()
+            if ended_data:
+                await self.publish(ended_data)
+
+            # Если данные не изменялись дольше max_unchanged_time секунд
+            if unchanged_time >= max_unchanged_time:
+                await self.send_to_logs(
+                    f"Данные не изменились более {max_unchanged_time} секунд. Перезапуск."
+                )
+                self.restart_required = True  # Устанавливаем флаг для перезапуска
+                break
 
-            # Если данные не изменялись в течение max_unchanged_checks раз
-            if unchanged_count >= max_unchanged_checks:
+            await asyncio.sleep(scheduler.interval)
+
+    async def monitor_leagues_network(
+        self,
+        target_leagues: dict,
+        check_interval: int = 1
+    ) -> None:
+        """
+        Мониторинг данных лиг по сетевому фиду букмекера.
+
+        :param target_leagues: Словарь с данными целевых лиг.
+        :param check_interval: Интервал чтения событий CDP во время игровых
+            четвертей в секундах (см. PollScheduler).
+        """
+        scheduler = PollScheduler(live_interval=check_interval)
+        unchanged_time = 0
+        max_unchanged_time = 3600
+
+        while True:
+            await asyncio.sleep(scheduler.interval)
+            try:
+                leagues_data = await self.extract_feed_data(target_leagues)
+                self.startup_timer.finish('first_tick')
+                if leagues_data:
+                    unchanged_time = 0
+                    await self.publish(leagues_data)
+                else:
+                    unchanged_time += scheduler.interval
+                scheduler.observe(self.game_clocks, bool(leagues_data))
+            except Exception:
+                await self.send_to_logs(f'Ошибка: {traceback.format_exc()}')
+
+            ended_data = await self.collect_ended_games()
+            if ended_data:
+                await self.publish(ended_data)
+
+            # Если данные не изменялись дольше max_unchanged_time секунд
+            if unchanged_time >= max_unchanged_time:
                 await self.send_to_logs(
-                    f"Данные не изменились более {max_unchanged_checks} раз. Перезапуск."
+                    f"Данные не изменились более {max_unchanged_time} секунд. Перезапуск."
                 )
                 self.restart_required = True  # Устанавливаем флаг для перезапуска
                 break
 
     async def close(self):
+        self.translate_queue.cancel()
+        if self.listen_task:
+            self.listen_task.cancel()
+        self.browser.shutdown()
         if self.driver:
             self.driver.quit()
             await self.send_to_logs("Драйвер был закрыт принудительно")
@@ -905,29 +1678,43 @@ class FetchAkty:
             **kwargs: Именованные аргументы.
         """
         leagues = kwargs.get('leagues', LEAGUES)
+        mode = kwargs.get('mode', MONITOR_MODE)
+        if mode == 'network':
+            # Без карты полей фид не даёт записей: ошибка сразу, без повторов
+            check_feed_fields(FEED_FIELDS, 'AKTY_FEED_FIELDS')
         attempt = 0
         max_retries = 5
 
         while attempt < max_retries:
             try:
+                if attempt:
+                    self.startup_timer.reset()
                 if not self.debug:
                     self.redis_client = RedisClient()
                     await self.redis_client.connect()
-                await self.change_zoom()
                 await self.init_async_components()
-
-                # Начинаем с авторизации, если требуется перезапуск
-                if self.restart_required:
-                    self.restart_required = False  # Сбрасываем флаг
-                    await self.authorization()
-                    await self.main_page()
-                    await self.aggregator_page()
-                else:
+                if mode == 'network':
+                    # Фид слушаем с самого входа, чтобы поймать начальный снимок
+                    self.network_tap = NetworkTap(
+                        self.driver, FEED_URL_PATTERNS)
+                    self.network_tap.start()
+
+                self.restart_required = False  # Сбрасываем флаг
+                # Масштаб нужен и при восстановлении сессии, и при полном входе
+                await self.change_zoom()
+                # Полный вход только если сохранённая сессия недействительна
+                if not await self.restore_session():
                     await self.authorization()
                     await self.main_page()
                     await self.aggregator_page()
+                    await self.save_session()
 
-                await self.monitor_leagues(leagues)
+                if mode == 'push':
+                    await self.monitor_leagues_push(leagues)
+                elif mode == 'network':
+                    await self.monitor_leagues_network(leagues)
+                else:
+                    await self.monitor_leagues(leagues)
                 break
 
             except Exception as e:
@@ -0,0 +1,84 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
+
+
+class AsyncDriver:
+    """
+    Адаптер WebDriver для asyncio.
+
+    Блокирующие вызовы Selenium (загрузка страниц, execute_script,
+    outerHTML, page_source, ожидания WebDriverWait) выполняются в
+    отдельном потоке, пока цикл событий обслуживает Redis, Socket.IO
+    и Telegram. Поток один: WebDriver не рассчитан на параллельные
+    команды, поэтому вызовы выполняются строго по очереди.
+    """
+
+    def __init__(self, driver=None, name: str = 'webdriver'):
+        """
+        :param driver: WebDriver, которым управляет адаптер.
+        :param name: Префикс имени потока (для логов и отладки).
+        """
+        self.driver = driver
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=name)
+
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Выполняет блокирующую функцию в потоке драйвера.
+
+        :param func: Функция или метод WebDriver.
+        :return: Результат функции.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs))
+
+    async def get(self, url: str) -> None:
+        await self.call(self.driver.get, url)
+
+    async def refresh(self) -> None:
+        await self.call(self.driver.refresh)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.call(self.driver.execute_script, script, *args)
+
+    async def execute_cdp_cmd(self, cmd: str, params: dict) -> Any:
+        return await self.call(self.driver.execute_cdp_cmd, cmd, params)
+
+    async def find_element(self, by: str, value: str) -> WebElement:
+        return await self.call(self.driver.find_element, by, value)
+
+    async def page_source(self) -> str:
+        return await self.call(lambda: self.driver.page_source)
+
+    async def outer_html(self, element: WebElement) -> str:
+        return await self.call(element.get_attribute, 'outerHTML')
+
+    async def wait(
+            self,
+            condition: Callable,
+            timeout: float,
+            message: str = '',
+            until_not: bool = False
+    ) -> Any:
+        """
+        Ожидание WebDriverWait в потоке драйвера.
+
+        :param condition: Условие (expected_conditions или функция).
+        :param timeout: Таймаут в секундах.
+        :param message: Сообщение TimeoutException.
+        :param until_not: Ждать, пока условие перестанет выполняться.
+        :return: Результат условия.
+        :raises TimeoutException: Если условие не выполнено за timeout.
+        """
+        wait = WebDriverWait(self.driver, timeout)
+        method = wait.until_not if until_not else wait.until
+        return await self.call(method, condition, message)
+
+    def shutdown(self) -> None:
+        """Останавливает поток драйвера, не дожидаясь очереди."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,221 @@
+import os
+import json
+import time
+import fcntl
+import urllib.request
+import undetected_chromedriver as uc
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from app.logging import setup_logger
+
+# Настройка логгера
+logger = setup_logger('browser_host', 'browser_host.log')
+
+# Общий Chrome для всех парсеров: по вкладке на букмекера
+BROWSER_HOST = bool(int(os.getenv('BROWSER_HOST', '0')))
+BROWSER_HOST_ADDRESS = os.getenv('BROWSER_HOST_ADDRESS', '127.0.0.1:9333')
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BROWSER_HOST_DIR = os.getenv(
+    'BROWSER_HOST_DIR',
+    os.path.join(PROJECT_DIR, 'browser_profiles', 'host')
+)
+BROWSER_HOST_START_TIMEOUT = 30
+# Время появления новой вкладки в window_handles, секунды
+TAB_HANDLE_TIMEOUT = 10
+
+# Фоновые вкладки не должны замедляться браузером
+HOST_ARGUMENTS = (
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+)
+
+
+def get_host_version(address: str = BROWSER_HOST_ADDRESS) -> dict | None:
+    """
+    Запрашивает у общего браузера информацию о версии.
+
+    :param address: Адрес отладки host:port.
+    :return: Ответ /json/version или None, если браузер не запущен.
+    """
+    try:
+        with urllib.request.urlopen(
+                f'http://{address}/json/version', timeout=2) as response:
+            return json.loads(response.read())
+    except (OSError, ValueError):
+        return None
+
+
+def launch_host(headless: bool, address: str = BROWSER_HOST_ADDRESS) -> None:
+    """
+    Запускает общий браузер отдельным процессом, который переживает
+    перезапуски парсеров.
+
+    :param headless: Запуск браузера в headless режиме.
+    :param address: Адрес отладки host:port.
+    """
+    host, port = address.split(':')
+    arguments = [
+        f'--remote-debugging-host={host}',
+        f'--remote-debugging-port={port}',
+        f"--user-data-dir={os.path.join(BROWSER_HOST_DIR, 'profile')}",
+        *HOST_ARGUMENTS,
+    ]
+    if headless:
+        arguments.append('--headless=new')
+    uc.dprocess.start_detached(
+        uc.find_chrome_executable(), *arguments, 'about:blank')
+
+    deadline = time.monotonic() + BROWSER_HOST_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if get_host_version(address):
+            logger.info(f'Общий браузер запущен на {address}')
+            return
+        time.sleep(0.5)
+    raise RuntimeError(f'Общий браузер не запустился на {address}')
+
+
+def ensure_host(headless: bool) -> dict:
+    """
+    Возвращает версию общего браузера, запуская его при необходимости.
+    Запуск защищён файловой блокировкой от гонки между процессами парсеров.
+
+    :param headless: Запуск браузера в headless режиме.
+    :return: Ответ /json/version.
+    """
+    os.makedirs(BROWSER_HOST_DIR, exist_ok=True)
+    with open(os.path.join(BROWSER_HOST_DIR, 'host.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        version = get_host_version()
+        if not version:
+            launch_host(headless)
+            version = get_host_version()
+    return version
+
+
+class HostedTab(webdriver.Chrome):
+    """
+    Сессия WebDriver, подключённая к общему браузеру и работающая в
+    собственной вкладке. Для вкладки с прокси создаётся отдельный
+    контекст браузера. quit() закрывает только свою вкладку.
+    """
+
+    def __init__(self, name: str, proxy: str = None, **kwargs):
+        """
+        :param name: Имя вкладки (по одной на букмекера).
+        :param proxy: Прокси для контекста вкладки.
+        :param kwargs: Аргументы webdriver.Chrome.
+        """
+        super().__init__(**kwargs)
+        self.tab_name = name
+        self.browser_context_id = None
+        self.close_stale_tab()
+
+        target = {'url': 'about:blank'}
+        if proxy:
+            self.browser_context_id = self.execute_cdp_cmd(
+                'Target.createBrowserContext',
+                {'proxyServer': proxy}
+            )['browserContextId']
+            target['browserContextId'] = self.browser_context_id
+        self.target_id = self.execute_cdp_cmd(
+            'Target.createTarget', target)['targetId']
+        # Вкладка записывается сразу, чтобы её закрыл следующий запуск,
+        # если ожидание дескриптора завершится ошибкой
+        with open(self.tab_file, 'w') as file:
+            file.write(self.target_id)
+        self.switch_to.window(self.wait_for_handle())
+
+    def wait_for_handle(self, timeout: float = TAB_HANDLE_TIMEOUT) -> str:
+        """
+        Ждёт, пока созданная вкладка появится в window_handles:
+        chromedriver узнаёт о новой цели не сразу после Target.createTarget.
+
+        :param timeout: Время ожидания в секундах.
+        :return: Дескриптор окна вкладки.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            handle = next((
+                handle for handle in self.window_handles
+                if self.target_id.lower() in handle.lower()
+            ), None)
+            if handle is not None:
+                return handle
+            if time.monotonic() >= deadline:
+                raise WebDriverException(
+                    f'Вкладка {self.tab_name} ({self.target_id}) не появилась '
+                    f'в window_handles за {timeout} с')
+            time.sleep(0.2)
+
+    @property
+    def tab_file(self) -> str:
+        return os.path.join(BROWSER_HOST_DIR, f'{self.tab_name}.tab')
+
+    def close_stale_tab(self) -> None:
+        """
+        Закрывает вкладку, оставшуюся от процесса парсера,
+        который был остановлен без вызова quit().
+        """
+        if not os.path.exists(self.tab_file):
+            return
+        with open(self.tab_file) as file:
+            target_id = file.read().strip()
+        try:
+            urllib.request.urlopen(
+                f'http://{BROWSER_HOST_ADDRESS}/json/close/{target_id}',
+                timeout=2).close()
+            logger.info(f'Закрыта брошенная вкладка {self.tab_name}')
+        except OSError:
+            pass
+
+    def quit(self) -> None:
+        try:
+            self.execute_cdp_cmd(
+                'Target.closeTarget', {'targetId': self.target_id})
+            if self.browser_context_id:
+                self.execute_cdp_cmd(
+                    'Target.disposeBrowserContext',
+                    {'browserContextId': self.browser_context_id}
+                )
+            if os.path.exists(self.tab_file):
+                os.remove(self.tab_file)
+        except Exception as e:
+            logger.info(f'Ошибка при закрытии вкладки {self.tab_name}: {e}')
+        finally:
+            # Сессия подключена к чужому браузеру, сам браузер не закрывается
+            super().quit()
+
+
+def open_tab(
+        name: str,
+        options: uc.ChromeOptions = None,
+        proxy: str = None,
+        headless: bool = True
+) -> HostedTab:
+    """
+    Открывает вкладку общего браузера для парсера.
+
+    :param name: Имя вкладки (по одной на букмекера).
+    :param options: Опции драйвера (capabilities); аргументы запуска
+        браузера к общему браузеру не применяются.
+    :param proxy: Прокси для вкладки.
+    :param headless: Запуск общего браузера в headless режиме.
+    :return: WebDriver, работающий в своей вкладке.
+    """
+    version = ensure_host(headless)
+    version_main = int(version['Browser'].split('/')[1].split('.')[0])
+    patcher = uc.Patcher(version_main=version_main)
+    patcher.auto()
+
+    options = options or uc.ChromeOptions()
+    options.debugger_address = BROWSER_HOST_ADDRESS
+    return HostedTab(
+        name=name,
+        proxy=proxy,
+        service=Service(executable_path=patcher.executable_path),
+        options=options
+    )
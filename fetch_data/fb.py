@@ -1,25 +1,42 @@
 import os
 import re
-import copy
 import socketio
 import json
 import asyncio
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from datetime import datetime
 from dotenv import load_dotenv
-from zoneinfo import ZoneInfo
 from translatepy import Translator
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from app.logging import setup_logger
 from transfer_data.redis_client import RedisClient
+from transfer_data.key_schema import GameKeys
+from transfer_data.odds_codec import encode_point
+from transfer_data.delta_protocol import (
+    DeltaEncoder, SOCKET_PROTOCOL, renamed_games
+)
 from transfer_data.telegram_bot import send_message_to_telegram
-from scripts.translate_cash_load import save_translate_cash, load_translate_cash
+from scripts.translate_cash_load import TranslateStore
+from fetch_data.page_scripts import FB_EXTRACT_MATCHES_JS
+from fetch_data.html_parser import parse_html, compile_selector
+from fetch_data.row_cache import RowCache
+from fetch_data.browser_host import BROWSER_HOST, open_tab
+from fetch_data.navigation import StartupTimer, document_ready
+from fetch_data.resource_blocking import block_resources
+from fetch_data.async_driver import AsyncDriver
+from fetch_data.poll_scheduler import PollScheduler
+from fetch_data.game_index import GameIndex, game_key
+from fetch_data.lifecycle import GameLifecycle, LifecycleEvent, GAME_END_TTL
+from fetch_data.game_snapshot import GameSnapshot, Tick, snapshot_json
+from fetch_data.translate_index import TranslateIndex, sanitize_name
+from fetch_data.translate_queue import TranslateQueue
+from fetch_data.network_tap import (
+    NetworkTap, FeedDecoder, RATE_FIELDS, enable_performance_log,
+    load_feed_fields, check_feed_fields
+)
 
 # Загрузка переменных окружения из .env файла
 load_dotenv()
@@ -36,6 +53,39 @@ REDIS_URL = os.getenv('REDIS_URL')
 SOCKETIO_URL = os.getenv('SOCKETIO_URL')
 SOCKET_KEY = os.getenv('SOCKET_KEY')
 HEADLESS = True
+# Источник данных: 'script' - извлечение JS внутри страницы,
+# 'dom' - разбор page_source, 'network' - сетевой фид через CDP
+EXTRACT_MODE = os.getenv('FB_EXTRACT_MODE', 'script')
+FEED_URL_PATTERNS = ('f66b88sport.com',)
+# Карта полей фида, уточняется по кадрам из NETWORK_TAP_DUMP
+FEED_FIELDS = load_feed_fields('FB_FEED_FIELDS', {'id': 'id'})
+
+# Ресурсы, без которых не работает навигация: не блокируются
+ALLOWED_URLS = ('*sport-svg/*',)
+# Таймауты этапов навигации, секунды
+NAVIGATION_TIMEOUTS = {
+    'page_load': 30,
+    'loading_overlay': 10,
+}
+LOADING_OVERLAY = 'div.q-loading.fullscreen.column.flex-center.z-max.text-black'
+
+# Символы, которые убираются из значения тотала
+TOTAL_POINT_NOISE = re.compile(r'[大小 ]')
+
+# Предкомпилированные селекторы разбора страницы
+# (те же, что в FB_EXTRACT_MATCHES_JS)
+MATCH_GROUP_SELECTOR = compile_selector('.home-match-list-box .group-matches')
+LEAGUE_NAME_SELECTOR = compile_selector('.league-name')
+MATCH_SELECTOR = compile_selector('.home-match-list__item.home-match-info')
+TEAM_NAME_SELECTOR = compile_selector('.match-teams-name .team-name')
+SCORE_SELECTOR = compile_selector('.match-score p span')
+TIME_SELECTOR = compile_selector('.time')
+PERIOD_SELECTOR = compile_selector('.match-left-text.font-din')
+CLOCK_SELECTOR = compile_selector('.match-left-time.font-din')
+ODDS_BOX_SELECTOR = compile_selector('.home-match-odds-box')
+ODDS_VALUE_SELECTOR = compile_selector('.team-odds-list .value.font-din')
+ODDS_POINT_SELECTOR = compile_selector(
+    '.team-odds-list .prefix-text.text-grey-disable')
 
 # Настройка логгера
 logger = setup_logger('fb', 'fb_debug.log')
@@ -56,11 +106,15 @@ class OddsFetcher:
         self.url = URL
         self.sio = socketio.AsyncSimpleClient()
         self.redis_client = None
+        self.startup_timer = StartupTimer('fb', logger)
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self.driver_fb = self.loop.run_until_complete(
             self.get_driver(headless=HEADLESS)
         )
+        # Блокирующие вызовы WebDriver выполняются в отдельном потоке
+        self.browser = AsyncDriver(self.driver_fb, name='fb-driver')
+        self.startup_timer.mark('driver_launch')
         self.time_game_translate = {
             '第一节': 'I',
             '第二节': 'II',
@@ -70,11 +124,26 @@ class OddsFetcher:
         self.debug = LOCAL_DEBUG
         self.actions = None
         self.translator = Translator()
-        self.previous_data = {}
-        self.translate_cash = load_translate_cash()
-        self.ended_games = {}
+        self.previous_data = GameIndex()
+        self.translate_store = TranslateStore()
+        self.translate_index = TranslateIndex(self.translate_store.load())
+        self.translate_queue = TranslateQueue(self.translate_text)
+        self.lifecycle = GameLifecycle()
+        self.delta_encoder = DeltaEncoder("fb.com")
         self.connection_error_count = 0
         self.max_connection_errors = 5
+        self.network_tap = None
+        self.feed_decoder = FeedDecoder(FEED_FIELDS)
+        self.record_cache = RowCache()
+        # Игровое время матчей, прочитанное в последнем такте
+        # (вход для PollScheduler)
+        self.game_clocks: Dict[Any, str] = {}
+        # Изменившиеся игры такта для записи в Redis: (лига, игра)
+        self.pending_games = []
+        self.publish_task = None
+        # Отправки из цикла тактов и из listen_server идут по очереди
+        self.publish_lock = asyncio.Lock()
+        self.listen_task = None
 
     async def get_driver(
             self,
@@ -84,7 +153,16 @@ class OddsFetcher:
         Инициализирует и возвращает WebDriver для браузера Chrome.
         :param headless: Запуск браузера в headless режиме.
         """
-        return uc.Chrome(options=uc.ChromeOptions(), headless=headless)
+        options = uc.ChromeOptions()
+        if EXTRACT_MODE == 'network':
+            enable_performance_log(options)
+        if BROWSER_HOST:
+            # Вкладка в общем браузере вместо отдельного Chrome
+            driver = open_tab('fb', options=options, headless=headless)
+        else:
+            driver = uc.Chrome(options=options, headless=headless)
+        block_resources(driver, ALLOWED_URLS)
+        return driver
 
     async def get_url(
             self
@@ -94,7 +172,7 @@ class OddsFetcher:
 
         :param url: URL страницы для загрузки.
         """
-        self.driver_fb.get(self.url)
+        await self.browser.get(self.url)
 
     async def get_page(self):
         """
@@ -108,15 +186,20 @@ class OddsFetcher:
             try:
                 # Перезагрузка страницы
                 await self.get_url()
-                await asyncio.sleep(5)  # Ожидание перед проверкой
+                # Ожидание загрузки документа вместо фиксированной паузы
+                await self.wait_until(
+                    document_ready,
+                    NAVIGATION_TIMEOUTS['page_load'],
+                    'загрузка страницы'
+                )
                 # Проверка наличия элемента загрузки
                 try:
-                    loading_element = WebDriverWait(self.driver_fb,
-                                                    wait_time).until(
+                    loading_element = await self.browser.wait(
                         EC.presence_of_element_located((
                             By.CSS_SELECTOR,
-                            'div.q-loading.fullscreen.column.flex-center.z-max.text-black'
-                        ))
+                            LOADING_OVERLAY
+                        )),
+                        wait_time
                     )
                     await self.send_to_logs(
                         f"Элемент загрузки найден на странице {self.url} (попытка {attempt + 1})")
@@ -128,8 +211,10 @@ class OddsFetcher:
 
                 # Ожидание исчезновения элемента загрузки
                 try:
-                    WebDriverWait(self.driver_fb, wait_time).until_not(
-                        EC.visibility_of(loading_element)
+                    await self.browser.wait(
+                        EC.visibility_of(loading_element),
+                        wait_time,
+                        until_not=True
                     )
                     await self.send_to_logs(
                         f"Элемент загрузки исчез, страница загружена {self.url} (попытка {attempt + 1})")
@@ -139,7 +224,7 @@ class OddsFetcher:
                     # Элемент загрузки не исчез
                     await self.send_to_logs(
                         f"Элемент загрузки не исчез на странице {self.url}, перезагрузка страницы... (попытка {attempt + 1})")
-                    self.driver_fb.refresh()
+                    await self.browser.refresh()
                     continue  # Повторная попытка загрузки страницы
 
             except Exception as e:
@@ -154,114 +239,124 @@ class OddsFetcher:
                 f"Не удалось загрузить страницу без элемента загрузки после {max_retries} попыток")
             raise Exception(
                 "Не удалось загрузить страницу без элемента загрузки.")
+        self.startup_timer.mark('page_load')
 
-    async def save_games(self, data: dict, liga_name: str):
+    async def save_games(self, data: GameSnapshot, liga_name: str):
         """
-        Сохраняет игры по отдельным ключам в Redis.
+        Ставит изменившуюся игру в пакет записи такта. Пакет
+        отправляется в Redis одним запросом в flush_games.
 
         Args:
-            data (dict): Данные в формате JSON для сохранения.
+            data (GameSnapshot): Данные игры для сохранения.
             liga_name (str): Наименование лиги для сохранения в Redis.
         """
+        self.pending_games.append((liga_name, data))
+
+    async def flush_games(self):
+        """
+        Сохраняет игры такта по отдельным ключам в Redis одним
+        pipeline: история, списки по порогу коэффициентов и чтение
+        последних данных akty.com для уведомлений в Telegram.
+        """
+        games, self.pending_games = self.pending_games, []
+        if not games or self.debug:
+            return
         try:
-            rate_bets = [
-                'total_bet_0',
-                'total_bet_1',
-                'handicap_bet_0',
-                'handicap_bet_1'
-            ]
-            data_rate = data.get('rate', {})
-
-            # Преобразуем значения в data_rate
-            for rate_bet in rate_bets:
-                value = data_rate.get(rate_bet, '0')
-                if value in ('-', '', None):
-                    data_rate[rate_bet] = 0.0
-                else:
-                    try:
-                        data_rate[rate_bet] = float(value)
-                    except (ValueError, TypeError):
-                        data_rate[rate_bet] = 0.0
-
-            # Проверяем, нужно ли сохранять данные в Redis
-            is_save = any(0 < data_rate[rate_bet] <= 1.73 for rate_bet in (
-                    rate_bets))
-            opponent_0 = data.get('opponent_0', '')
-            opponent_1 = data.get('opponent_1', '')
-
-            data_rate['server_time'] = data.get('server_time', '')
-            data_rate['time_game'] = data.get('time_game', '')
-            json_data = json.dumps(data_rate, ensure_ascii=False)
-            key_for_all_data = (f"fb.com_all_data, {liga_name.lower()}, "
-                            f"{opponent_0.lower()}, {opponent_1.lower()}")
-            key_for_save = (f"fb.com, {liga_name.lower()}, "
-                   f"{opponent_0.lower()}, {opponent_1.lower()}")
-            if not self.debug:
-                await self.redis_client.add_to_list(key_for_all_data, json_data)
+            batch = self.redis_client.batch()
+            messages = {}
+            for liga_name, data in games:
+                # Коэффициенты уже разобраны в числа при извлечении
+                bets = data.bets()
+                data_rate = dict(data.rate)
+                data_rate.update(bets)
+
+                # Проверяем, нужно ли сохранять данные в Redis
+                is_save = any(0 < bet <= 1.73 for bet in bets.values())
+                opponent_0 = data.opponent_0
+                opponent_1 = data.opponent_1
+
+                data_rate['server_time'] = data.server_time
+                data_rate['time_game'] = data.time_game
+                point = encode_point(
+                    data_rate, data.time_game, data.tick.epoch_ms,
+                    data.server_time)
+                keys = GameKeys('fb.com', liga_name, opponent_0, opponent_1)
+                batch.add_history(keys, point, data.tick.epoch_ms)
                 if is_save:
-                    await self.redis_client.add_to_list(
-                        key_for_save,
-                        json_data
-                    )
+                    batch.add_alert(keys, point)
                 # Проверяем, нужно ли отправить данные в Telegram
-            is_send_tg = any(0 <
-                data_rate[rate_bet] <= 1.68 for rate_bet in rate_bets)
-
-            if is_send_tg:
-                key_akty = (f"akty.com_all_data, {liga_name.lower()}, "
-                       f"{opponent_0.lower()}, {opponent_1.lower()}")
-                # Получаем данные из Redis
-                data_akty = await self.redis_client.get_last_item(key_akty)
+                if any(0 < bet <= 1.68 for bet in bets.values()):
+                    game = (liga_name, opponent_0, opponent_1)
+                    batch.get_last_history(keys.on('akty.com'), game)
+                    data_rate.update({
+                        'opponent_0': opponent_0,
+                        'opponent_1': opponent_1,
+                        'liga': liga_name,
+                        'site': 'FB'
+                    })
+                    messages[game] = data_rate
+
+            # Данные akty.com по играм такта
+            last_items = await batch.execute()
+            for game, data_rate in messages.items():
+                data_akty = last_items.get(game)
                 if data_akty:
                     data_akty['site'] = 'OB'
-                data_rate.update({
-                    'opponent_0': opponent_0,
-                    'opponent_1': opponent_1,
-                    'liga': liga_name,
-                    'site': 'FB'
-                })
-                if not self.debug:
-                    await send_message_to_telegram(
-                        data_rate,
-                        data_akty
-                    )
+                await send_message_to_telegram(
+                    data_rate,
+                    data_akty
+                )
 
         except Exception as e:
             await self.send_to_logs(f'Ошибка при сохранении данных: {str(e)}')
 
     async def delete_games(self, data: dict, liga_name: str):
         """
-        Удаляет игры по ключам из Redis.
+        Удаляет данные игры из Redis.
 
         Args:
             data (dict): Данные с информацией о ключах для удаления.
             liga_name (str): Наименование лиги для удаления данных в Redis.
         """
         try:
-            # Получаем оппонентов и преобразуем их к нижнему регистру
-            opponent_0 = data.get('opponent_0', '').lower()
-            opponent_1 = data.get('opponent_1', '').lower()
-            liga_name_lower = liga_name.lower()
-
-            # Базовая часть ключей
-            base_key = f"{liga_name_lower}, {opponent_0}, {opponent_1}"
-
-            # Генерируем ключи с использованием замены части строки
-            keys = [
-                f"akty.com, {base_key}",
-                f"akty.com_all_data, {base_key}",
-                f"fb.com, {base_key}",
-                f"fb.com_all_data, {base_key}"
-            ]
+            keys = GameKeys(
+                'fb.com', liga_name,
+                data.get('opponent_0', ''), data.get('opponent_1', ''))
 
             if not self.debug:
-                # Удаляем данные из Redis по ключам
-                for key in keys:
-                    await self.redis_client.delete_data(key)
+                # Данные игры на обоих сайтах и записи в индексах
+                await self.redis_client.delete_game(keys)
 
         except Exception as e:
             await self.send_to_logs(f'Ошибка при удалении данных: {e}')
 
+    async def rename_games(
+            self,
+            data: dict,
+            renamed: GameSnapshot,
+            liga_name: str
+    ):
+        """
+        Переносит данные игры в Redis под новые названия команд.
+
+        Args:
+            data (Mapping): Игра под прежними названиями.
+            renamed (GameSnapshot): Та же игра под новыми названиями.
+            liga_name (str): Наименование лиги.
+        """
+        try:
+            old = GameKeys(
+                'fb.com', liga_name,
+                data.get('opponent_0', ''), data.get('opponent_1', ''))
+            new = GameKeys(
+                'fb.com', liga_name, renamed.opponent_0, renamed.opponent_1)
+
+            if not self.debug:
+                await self.redis_client.rename_game(old, new)
+
+        except Exception as e:
+            await self.send_to_logs(f'Ошибка при переносе данных: {e}')
+
     async def send_data(
             self,
             data: dict,
@@ -281,12 +376,71 @@ class OddsFetcher:
             )
             return
         try:
-            json_data = json.dumps(data, ensure_ascii=False)
+            if SOCKET_PROTOCOL == 'delta':
+                data = self.encode_delta(data)
+                if data is None:
+                    return
+            json_data = json.dumps(
+                data, ensure_ascii=False, default=snapshot_json)
             # Отправляем данные на Socket.IO сервер напрямую
             await self.sio.emit('message', json_data)
         except Exception as e:
+            # Подписчики пропустили сообщение: следующим идёт снапшот
+            self.delta_encoder.needs_snapshot = True
             await self.send_to_logs(f'Ошибка при отправке данных: {str(e)}')
 
+    def encode_delta(
+            self,
+            data: dict
+    ) -> dict | None:
+        """
+        Кодирует данные такта в сообщение протокола дельт. Если
+        подписчики могли пропустить сообщения (первая отправка, сбой,
+        переподключение), вместо дельты отправляется снапшот всех игр.
+
+        :param data: Данные такта.
+        :return: Сообщение delta/snapshot или None, если изменений нет.
+        """
+        if self.delta_encoder.needs_snapshot:
+            return self.delta_encoder.snapshot({
+                league: list(games.values())
+                for league, games in self.previous_data.items()
+            })
+        return self.delta_encoder.encode(data)
+
+    async def publish(
+            self,
+            data: dict
+    ) -> None:
+        """
+        Отправляет данные такта в фоне, чтобы извлечение следующего
+        такта шло параллельно с отправкой текущего. Перед запуском
+        новой отправки дожидается предыдущей, порядок тактов сохраняется.
+
+        :param data: Данные для отправки.
+        """
+        async with self.publish_lock:
+            if self.publish_task:
+                await self.publish_task
+            self.publish_task = asyncio.create_task(self.send_data(data))
+
+    async def listen_server(self) -> None:
+        """
+        Обрабатывает события сервера Socket.IO. По событию 'resync'
+        (у сервера нет полного состояния игр, например после его
+        перезапуска, или он пропустил сообщение) сразу отправляет
+        снапшот всех игр. Рассылка сообщений подписчикам, которую
+        получает и парсер, пропускается.
+        """
+        while True:
+            try:
+                event, *_ = await self.sio.receive()
+            except socketio.exceptions.DisconnectedError:
+                return
+            if event == 'resync':
+                self.delta_encoder.needs_snapshot = True
+                await self.publish({"fb.com": {}})
+
     async def init_async_components(self):
         """
         Инициализация асинхронных компонентов, таких как Redis клиент и подключение к Socket.IO.
@@ -303,6 +457,10 @@ class OddsFetcher:
             )
             if not self.sio.connected:
                 await self.sio.connect(SOCKETIO_URL, auth={'socket_key': SOCKET_KEY})
+                # Новое подключение начинается со снапшота
+                self.delta_encoder.needs_snapshot = True
+            if self.listen_task is None or self.listen_task.done():
+                self.listen_task = asyncio.create_task(self.listen_server())
         except Exception as e:
             print(f"Error initializing async components: {e}")
             raise
@@ -337,13 +495,35 @@ class OddsFetcher:
         если элемент не был найден в течение заданного времени.
         """
         try:
-            element = WebDriverWait(self.driver_fb, timeout).until(
-                EC.presence_of_element_located((by, value))
+            element = await self.browser.wait(
+                EC.presence_of_element_located((by, value)),
+                timeout
             )
             return element
         except TimeoutException:
             return None
 
+    async def wait_until(
+            self,
+            condition,
+            timeout: int,
+            description: str
+    ):
+        """
+        Ожидает выполнения условия вместо фиксированной паузы.
+
+        :param condition: Условие WebDriverWait (expected_conditions или функция).
+        :param timeout: Таймаут этапа в секундах.
+        :param description: Описание этапа для сообщения об ошибке.
+        :return: Результат условия.
+        :raises TimeoutException: Если условие не выполнено за timeout.
+        """
+        return await self.browser.wait(
+            condition,
+            timeout,
+            message=f'Таймаут этапа "{description}" ({timeout} с)'
+        )
+
     async def main_page(
             self
     ) -> None:
@@ -355,17 +535,23 @@ class OddsFetcher:
                 # Ожидаем исчезновения элемента загрузки
                 loading_element = await self.wait_for_element(
                     By.CSS_SELECTOR,
-                    'div.q-loading.fullscreen.column.flex-center.z-max.text-black',
+                    LOADING_OVERLAY,
                     timeout=10
                 )
                 if loading_element:
                     await self.send_to_logs(
                         f"Элемент загрузки найден на странице (попытка {attempt + 1}). Ожидание его исчезновения..."
                     )
-                    await asyncio.sleep(
-                        5)  # Ждем некоторое время перед повторной попыткой
-                    attempt += 1
-                    continue
+                    try:
+                        await self.wait_until(
+                            EC.invisibility_of_element_located(
+                                (By.CSS_SELECTOR, LOADING_OVERLAY)),
+                            NAVIGATION_TIMEOUTS['loading_overlay'],
+                            'исчезновение элемента загрузки'
+                        )
+                    except TimeoutException:
+                        attempt += 1
+                        continue
 
                 # Ищем и кликаем на кнопку баскетбола
                 basketball_button = await self.wait_for_element(
@@ -374,7 +560,8 @@ class OddsFetcher:
                     timeout=30
                 )
                 if basketball_button:
-                    basketball_button.click()
+                    await self.browser.call(basketball_button.click)
+                    self.startup_timer.mark('sport_menu')
                     await self.send_to_logs(
                         'Успешный переход в баскетбольную лигу')
                     return
@@ -383,8 +570,12 @@ class OddsFetcher:
                 logger.info(
                     f"Внимание! Отсутствие контента на странице, попытка {attempt + 1} из {max_attempts} получить контент.")
                 attempt += 1
-                self.driver_fb.refresh()
-                await asyncio.sleep(10)
+                await self.browser.refresh()
+                await self.wait_until(
+                    document_ready,
+                    NAVIGATION_TIMEOUTS['page_load'],
+                    'загрузка страницы'
+                )
 
             except Exception as e:
                 await self.send_to_logs(
@@ -403,7 +594,8 @@ class OddsFetcher:
         Получает полное название команды, используя кэш или выполнив перевод текста на английский.
 
         Если частичное совпадение с ключом найдено, возвращает значение.
-        Если перевод не найден, переводит текст на английский и добавляет в кэш.
+        Если перевод не найден, ставит текст в очередь фонового перевода
+        и до его получения возвращает короткое название без изменений.
 
         Args:
             short_name (str): Короткое название команды.
@@ -415,249 +607,424 @@ class OddsFetcher:
             return short_name
 
         # Убираем символы из short_name
-        sanitized_name = short_name.translate(
-            str.maketrans('', '', ' (),女')).strip().lower()
+        sanitized_name = sanitize_name(short_name)
 
         if not sanitized_name:
             return short_name
 
-        # Ищем частичное совпадение
-        for key in self.translate_cash:
-            if sanitized_name in key:
-                return self.translate_cash[key]
+        # Ищем частичное совпадение: название внутри ключа словаря
+        cached = self.translate_index.find_containing(sanitized_name)
+        if cached is None:
+            # Перевод мог добавить парсер другого сайта
+            self.translate_index.update(self.translate_store.refresh())
+            cached = self.translate_index.find_containing(sanitized_name)
+        if cached is not None:
+            return cached
 
-        # Если совпадение не найдено, выполняем перевод
-        try:
-            translation = self.translator.translate(sanitized_name,
-                                                    "english").result.lower()
-            self.translate_cash = load_translate_cash()
-            self.translate_cash[sanitized_name] = translation
-            save_translate_cash(self.translate_cash)
+        # Если совпадение не найдено, переводим в фоне
+        self.translate_queue.request(sanitized_name, short_name)
+        return short_name
 
-            # Логируем новый перевод
-            await self.send_to_logs(
-                f"Перевод текста: '{sanitized_name}', перевод: '{translation}'"
-            )
+    def translate_text(self, text: str) -> str:
+        """
+        Перевод очищенного названия (блокирующий сетевой вызов,
+        выполняется в фоне через self.translate_queue).
 
-            return translation
+        :param text: Очищенное название.
+        :return: Перевод в нижнем регистре.
+        """
+        return self.translator.translate(text, "english").result.lower()
 
-        except Exception as e:
-            # Логируем ошибку перевода
+    async def apply_translations(self) -> List[LifecycleEvent]:
+        """
+        Применяет завершённые фоновые переводы: перевод сохраняется
+        в словарь, а игры, показанные под коротким названием,
+        переносятся под перевод - со следующего такта они идут под ним.
+
+        :return: События 'renamed' для игр с временными названиями.
+        """
+        events = []
+        for result in self.translate_queue.drain():
+            if result.translation is None:
+                # Логируем ошибку перевода
+                await self.send_to_logs(
+                    f"Ошибка перевода текста: '{result.name}', "
+                    f"ошибка: {str(result.error)}"
+                )
+                continue
+            self.translate_store.add(result.name, result.translation)
+            self.translate_index.add(result.name, result.translation)
+            # Логируем новый перевод
             await self.send_to_logs(
-                f"Ошибка перевода текста: '{short_name}', ошибка: {str(e)}"
+                f"Перевод текста: '{result.name}', "
+                f"перевод: '{result.translation}'"
             )
-            return short_name
+            for raw_name in result.raw_names:
+                if raw_name != result.translation:
+                    events.extend(self.lifecycle.rename_team(
+                        raw_name, result.translation))
+            # Матчи с коротким названием собираются заново
+            self.record_cache.clear()
+        return events
 
     async def check_changed_dict(
             self,
-            existing_list: List[Dict[str, Any]],
-            game_info: Dict[str, Any],
+            previous_index: GameIndex,
+            game_info: GameSnapshot,
             liga_name: str
     ) -> bool:
         """
-        Проверяет и обновляет список словарей, если конкретный словарь изменился, или добавляет его, если его нет.
+        Проверяет, изменились ли коэффициенты игры по сравнению со
+        снимком прошлого такта, и сохраняет изменившуюся игру.
 
-        :param existing_list: Список существующих словарей.
-        :param game_info: Новый словарь для добавления или обновления.
+        :param previous_index: Индекс игр прошлого такта.
+        :param game_info: Новый словарь игры.
         :param liga_name: Наименование лиги.
         :return: True, если данные изменились и были сохранены, иначе False.
         """
-        new_dict = copy.deepcopy(game_info)
-        opponent_0 = game_info['opponent_0']
-        opponent_1 = game_info['opponent_1']
-
-        # Проверка существования игры в списке существующих
-        for existing_dict in existing_list:
-            if (existing_dict['opponent_0'] == opponent_0 and
-                    existing_dict['opponent_1'] == opponent_1):
-                if (existing_dict['rate'] != new_dict['rate']) and (
-                        existing_dict['opponent_0'] != existing_dict['opponent_1']):
-                    await self.save_games(new_dict, liga_name)
-                    return True
-                return False
+        if previous_index.get(liga_name, game_info) is None:
+            return False
+        if (previous_index.rate_changed(liga_name, game_info) and
+                game_info['opponent_0'] != game_info['opponent_1']):
+            await self.save_games(game_info, liga_name)
+            return True
         return False
 
-    async def collect_odds_data(self, target_leagues: dict):
+    async def extract_matches_from_soup(
+            self,
+            target_leagues: dict
+    ) -> List[Dict[str, Any]]:
+        """
+        Извлечение матчей целевых лиг из HTML всей страницы.
+
+        :param target_leagues: dict, содержащий целевые лиги для извлечения данных.
+        :return: Список записей матчей (см. FB_EXTRACT_MATCHES_JS).
+        """
+        html = await self.browser.page_source()
+        return self.parse_match_records(parse_html(html), target_leagues)
+
+    @staticmethod
+    def parse_match_records(
+            soup,
+            target_leagues: dict
+    ) -> List[Dict[str, Any]]:
+        """
+        Разбор матчей целевых лиг из дерева страницы.
+
+        :param soup: Разобранный HTML страницы (см. parse_html).
+        :param target_leagues: dict, содержащий целевые лиги для извлечения данных.
+        :return: Список записей матчей (см. FB_EXTRACT_MATCHES_JS).
+        """
+        records = []
+        match_groups = soup.select(MATCH_GROUP_SELECTOR)
+
+        for group in match_groups:
+            league_name_element = group.select_one(LEAGUE_NAME_SELECTOR)
+            if league_name_element is None:
+                continue
+            league_name = league_name_element.text
+            if league_name not in target_leagues:
+                continue
+
+            matches = group.select(MATCH_SELECTOR)
+            for match in matches:
+                team_names = match.select(TEAM_NAME_SELECTOR)
+                if len(team_names) != 2:
+                    continue
+
+                scores = match.select(SCORE_SELECTOR)
+                if len(scores) != 2:
+                    continue
+
+                record = {
+                    'league': league_name,
+                    'opponent_0': team_names[0].text.strip(),
+                    'opponent_1': team_names[1].text.strip(),
+                    'score_0': scores[0].text,
+                    'score_1': scores[1].text,
+                    'period': '',
+                    'clock': '',
+                    'rate': {},
+                }
+
+                process_time_elements = match.select(TIME_SELECTOR)
+                if process_time_elements:
+                    process_time_text_element = process_time_elements[
+                        0].select_one(PERIOD_SELECTOR)
+                    record['period'] = process_time_text_element.get_text(
+                    ).strip() if process_time_text_element else ''
+                    process_time_element = process_time_elements[
+                        0].select_one(CLOCK_SELECTOR)
+                    record['clock'] = process_time_element.text.strip(
+                    ) if process_time_element else ''
+
+                odds_boxes = match.select(ODDS_BOX_SELECTOR)
+                found_handicap = False
+                found_ou = False
+                for odds_box in odds_boxes:
+                    category = odds_box.get('class', '')
+                    odds_items = odds_box.select(ODDS_VALUE_SELECTOR)
+                    odds_points = odds_box.select(ODDS_POINT_SELECTOR)
+                    if 'match-full-odds-handicap' in category and not found_handicap:
+                        found_handicap = True
+                        if len(odds_items) >= 2:
+                            record['rate']['handicap_bet_0'] = odds_items[0].text
+                            record['rate']['handicap_bet_1'] = odds_items[1].text
+                        if len(odds_points) >= 2:
+                            record['rate']['handicap_point_0'] = odds_points[0].text
+                            record['rate']['handicap_point_1'] = odds_points[1].text
+                    elif 'match-full-odds-total' in category and not found_ou:
+                        found_ou = True
+                        if len(odds_items) >= 2:
+                            record['rate']['total_bet_0'] = odds_items[0].text
+                            record['rate']['total_bet_1'] = odds_items[1].text
+                        if len(odds_points) >= 2:
+                            record['rate']['total_point'] = odds_points[0].text
+
+                records.append(record)
+        return records
+
+    async def extract_matches_from_script(
+            self,
+            target_leagues: dict
+    ) -> List[Dict[str, Any]]:
+        """
+        Извлечение матчей целевых лиг одним execute_script внутри страницы,
+        без передачи и разбора page_source.
+
+        :param target_leagues: dict, содержащий целевые лиги для извлечения данных.
+        :return: Список записей матчей (см. FB_EXTRACT_MATCHES_JS).
+        """
+        return await self.browser.execute_script(
+            FB_EXTRACT_MATCHES_JS,
+            list(target_leagues.keys())
+        ) or []
+
+    @staticmethod
+    def record_row_key(record: Dict[str, Any]) -> tuple:
+        """
+        Ключ содержимого записи матча для кэша построенных game_info.
+
+        Игровые часы в ключ не входят: они меняются каждую секунду
+        и не влияют на сравнение коэффициентов.
+
+        :param record: Запись матча.
+        :return: Ключ записи.
+        """
+        return (
+            record['league'],
+            record.get('opponent_0', ''),
+            record.get('opponent_1', ''),
+            record.get('score_0', ''),
+            record.get('score_1', ''),
+            record.get('period', ''),
+            tuple(sorted(record['rate'].items())),
+        )
+
+    @staticmethod
+    def record_time_game(record: Dict[str, Any]) -> str:
+        """
+        Период и игровое время матча вида 'II 05:32'.
+
+        :param record: Запись матча, period уже в виде 'I'..'IV'.
+        :return: Строка time_game.
+        """
+        time_game = record.get('period', '')
+        if record.get('clock'):
+            time_game += ' ' + record['clock']
+        return time_game
+
+    async def build_game_info(
+            self,
+            record: Dict[str, Any],
+            liga_name: str,
+            tick: Tick = None
+    ) -> GameSnapshot:
+        """
+        Строит запись матча, полученного из страницы или фида.
+
+        :param record: Запись матча, period уже в виде 'I'..'IV'.
+        :param liga_name: Переведённое наименование лиги.
+        :param tick: Такт извлечения, по умолчанию текущий момент.
+        :return: Запись матча.
+        """
+        if tick is None:
+            tick = Tick.now()
+        opponent_0 = record.get('opponent_0', '')
+        opponent_1 = record.get('opponent_1', '')
+        rate = {field: record['rate'].get(field, '') for field in RATE_FIELDS}
+        rate['total_point'] = TOTAL_POINT_NOISE.sub('', rate['total_point'])
+        return GameSnapshot(
+            league=liga_name,
+            opponent_0=await self.get_translate(
+                opponent_0) if opponent_0 != '' else '',
+            opponent_1=await self.get_translate(
+                opponent_1) if opponent_1 != '' else '',
+            score_game=f"{record.get('score_0', '')}:{record.get('score_1', '')}",
+            time_game=self.record_time_game(record),
+            rate=rate,
+            tick=tick,
+            is_end_game=False,
+        )
+
+    async def collect_odds_data(self, target_leagues: dict) -> bool:
         """
         Сбор данных о коэффициентах для заданных лиг.
 
         :param target_leagues: dict, содержащий целевые лиги для извлечения данных.
+        :return: True, если такт принёс изменения.
         """
         active_matches = {"fb.com": {}}
-        previous_leagues_data = {"fb.com": {}}
+        current_index = GameIndex()
         try:
-            html = self.driver_fb.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            match_groups = soup.select('.home-match-list-box .group-matches')
-
-            for group in match_groups:
-                league_name_element = group.select_one('.league-name')
-                if league_name_element is None:
-                    continue
-                league_name = league_name_element.text
-                if league_name in target_leagues:
-                    liga_name_translate = target_leagues[league_name]
-                    if liga_name_translate not in active_matches["fb.com"]:
-                        active_matches["fb.com"][liga_name_translate] = []
-
-                    matches = group.select(
-                        '.home-match-list__item.home-match-info')
-
-                    for match in matches:
-                        team_names = match.select(
-                            '.match-teams-name .team-name')
-                        if len(team_names) != 2:
-                            continue
-
-                        short_team1_name = team_names[0].text.strip()
-                        short_team2_name = team_names[1].text.strip()
-                        translate_opponent_0_name = await self.get_translate(
-                            short_team1_name) if short_team1_name != '' else ''
-                        translate_opponent_1_name = await self.get_translate(
-                            short_team2_name) if short_team2_name != '' else ''
-
-                        scores = match.select('.match-score p span')
-                        if len(scores) != 2:
-                            continue
-
-                        opponent_0_score = scores[0].text
-                        opponent_1_score = scores[1].text
-
-                        game_info = {
-                            'opponent_0': translate_opponent_0_name,
-                            'opponent_1': translate_opponent_1_name,
-                            'score_game': f'{opponent_0_score}:{opponent_1_score}',
-                            'time_game': '',
-                            'rate': {
-                                'total_point': '',
-                                'total_bet_0': '',
-                                'total_bet_1': '',
-                                'handicap_point_0': '',
-                                'handicap_bet_0': '',
-                                'handicap_point_1': '',
-                                'handicap_bet_1': '',
-                            },
-                            'server_time': '',
-                            'is_end_game': False
-                        }
-
-                        process_time_elements = match.select('.time')
-                        if process_time_elements:
-                            process_time_text_element = process_time_elements[
-                                0].select_one('.match-left-text.font-din')
-                            process_time_text = self.time_game_translate.get(
-                                process_time_text_element.get_text().strip(),
-                                '') if process_time_text_element else ""
-                            game_info['time_game'] += process_time_text
-
-                            process_time_element = process_time_elements[
-                                0].select_one('.match-left-time.font-din')
-                            if process_time_element and process_time_element.text.strip():
-                                process_time = process_time_element.text.strip()
-                                game_info['time_game'] += ' ' + process_time
-
-                        game_info['server_time'] = datetime.now(
-                            tz=ZoneInfo("Europe/Moscow")
-                        ).strftime("%H:%M:%S")
-
-                        odds_boxes = match.select('.home-match-odds-box')
-                        found_handicap = False
-                        found_ou = False
-                        for odds_box in odds_boxes:
-                            category = odds_box.get('class', '')
-                            if 'match-full-odds-handicap' in category and not found_handicap:
-                                found_handicap = True
-                                odds_items = odds_box.select(
-                                    '.team-odds-list .value.font-din')
-                                if len(odds_items) >= 2:
-                                    game_info['rate']['handicap_bet_0'] = \
-                                    odds_items[0].text
-                                    game_info['rate']['handicap_bet_1'] = \
-                                    odds_items[1].text
-                                handicap_points = odds_box.select(
-                                    '.team-odds-list .prefix-text.text-grey-disable')
-                                if len(handicap_points) >= 2:
-                                    game_info['rate']['handicap_point_0'] = \
-                                    handicap_points[0].text
-                                    game_info['rate']['handicap_point_1'] = \
-                                    handicap_points[1].text
-                            elif 'match-full-odds-total' in category and not found_ou:
-                                found_ou = True
-                                odds_items = odds_box.select(
-                                    '.team-odds-list .value.font-din')
-                                if len(odds_items) >= 2:
-                                    game_info['rate']['total_bet_0'] = \
-                                    odds_items[0].text
-                                    game_info['rate']['total_bet_1'] = \
-                                    odds_items[1].text
-                                total_points = odds_box.select(
-                                    '.team-odds-list .prefix-text.text-grey-disable')
-                                if len(total_points) >= 2:
-                                    point_0 = total_points[0].text
-                                    point_0_cleared = re.sub(r'[大小 ]', '',
-                                                             point_0)
-                                    game_info['rate'][
-                                        'total_point'] = point_0_cleared if point_0_cleared else \
-                                    game_info['rate']['total_point']
-
-                        if (
-                                self.previous_data and liga_name_translate in self.previous_data.get(
-                                "fb.com", {})):
-                            changed_data = await self.check_changed_dict(
-                                self.previous_data["fb.com"][
-                                    liga_name_translate],
-                                game_info,
-                                liga_name_translate
-                            )
-                            if changed_data:
-                                active_matches["fb.com"][
-                                    liga_name_translate].append(game_info)
-                        else:
-                            active_matches["fb.com"][
-                                liga_name_translate].append(game_info)
-
-                        # Обновляем previous_leagues_data после каждой итерации
-                        if liga_name_translate not in previous_leagues_data[
-                            "fb.com"]:
-                            previous_leagues_data["fb.com"][
-                                liga_name_translate] = []
-                        previous_leagues_data["fb.com"][
+            if EXTRACT_MODE == 'script':
+                records = await self.extract_matches_from_script(
+                    target_leagues)
+            else:
+                records = await self.extract_matches_from_soup(
+                    target_leagues)
+            tick = Tick.now()
+            clocks = {}
+
+            for record in records:
+                liga_name_translate = target_leagues[record['league']]
+                if liga_name_translate not in active_matches["fb.com"]:
+                    active_matches["fb.com"][liga_name_translate] = []
+                record['period'] = self.time_game_translate.get(
+                    record['period'], '')
+                clocks[(record['league'], record['opponent_0'],
+                        record['opponent_1'])] = self.record_time_game(record)
+                # Неизменившиеся матчи не переводятся и не собираются заново
+                record_key = self.record_row_key(record)
+                game_info = self.record_cache.get(record_key)
+                if game_info is None:
+                    game_info = await self.build_game_info(
+                        record, liga_name_translate, tick)
+                else:
+                    # Игровые часы и такт в ключ не входят
+                    game_info = game_info.replace(
+                        time_game=self.record_time_game(record), tick=tick)
+                self.record_cache.put(record_key, game_info)
+
+                if liga_name_translate in self.previous_data:
+                    changed_data = await self.check_changed_dict(
+                        self.previous_data,
+                        game_info,
+                        liga_name_translate
+                    )
+                    if changed_data:
+                        active_matches["fb.com"][
                             liga_name_translate].append(game_info)
-                        # Проверка завершенных игр перед обновлением данных
-            await self.check_finished_games(
-                previous_leagues_data,
-                active_matches,
-            )
-
-            self.previous_data = previous_leagues_data
+                else:
+                    active_matches["fb.com"][
+                        liga_name_translate].append(game_info)
+
+                # Обновляем индекс текущего такта после каждой итерации
+                current_index.put(liga_name_translate, game_info)
+                await self.track_game(liga_name_translate, game_info)
+            self.record_cache.end_tick()
+            self.previous_data = current_index
+            self.game_clocks = clocks
+            await self.flush_games()
+            # Проверка завершенных игр после обновления данных
+            await self.collect_ended_games(active_matches)
 
             # Удаляем пустые словари перед отправкой
             active_matches["fb.com"] = {k: v for k, v in
                                         active_matches["fb.com"].items() if v}
 
             # Отправляем данные, только если они изменились
-            if any(active_matches["fb.com"].values()):
-                await self.send_data(active_matches)
+            changed = any(active_matches["fb.com"].values())
+            if changed:
+                await self.publish(active_matches)
             self.connection_error_count = 0
+            return changed
         except Exception as e:
-            logger.error(f"Error in collect_odds_data: {str(e)}")
-            if "Connection refused" in str(
-                    e) or "Max retries exceeded with url" in str(e):
-                self.connection_error_count += 1  # Увеличиваем счетчик
-                await self.send_to_logs(
-                    f"Ошибка подключения: {str(e)}. Попытка {self.connection_error_count} из {self.max_connection_errors}.")
+            await self.handle_collect_error('collect_odds_data', e)
+        return False
 
-                if self.connection_error_count >= self.max_connection_errors:
-                    await self.send_to_logs(
-                        "Превышено максимальное количество попыток восстановления соединения. Перезапуск процесса.")
-                    await self.restart_fetcher()
-                else:
-                    await asyncio.sleep(10)  # Пауза перед повторной попыткой
-            else:
-                # Если другая ошибка, логируем и перезапускаем весь процесс
+    async def collect_feed_data(self, target_leagues: dict) -> bool:
+        """
+        Сбор данных о коэффициентах из сетевого фида страницы,
+        без выгрузки и разбора HTML.
+
+        :param target_leagues: dict, содержащий целевые лиги для извлечения данных.
+        :return: True, если такт принёс изменения.
+        """
+        active_matches = {"fb.com": {}}
+        try:
+            records = self.feed_decoder.feed(
+                await self.browser.call(self.network_tap.read_payloads))
+            tick = Tick.now()
+
+            for record in records:
+                liga_name_translate = target_leagues.get(record['league'])
+                if not liga_name_translate:
+                    continue
+                period = record.get('period', '')
+                record['period'] = self.time_game_translate.get(period, period)
+                game_info = await self.build_game_info(
+                    record, liga_name_translate, tick)
+                is_new = self.previous_data.get(
+                    liga_name_translate, game_info) is None
+                changed_data = await self.check_changed_dict(
+                    self.previous_data,
+                    game_info,
+                    liga_name_translate
+                )
+                if changed_data or is_new:
+                    active_matches["fb.com"].setdefault(
+                        liga_name_translate, []).append(game_info)
+                # Заменяем предыдущее состояние игры новым
+                self.previous_data.put(liga_name_translate, game_info)
+                await self.track_game(liga_name_translate, game_info)
+            await self.flush_games()
+            self.game_clocks = {
+                match_id: self.record_time_game({
+                    'period': self.time_game_translate.get(period, period),
+                    'clock': clock,
+                })
+                for match_id, (period, clock) in self.feed_decoder.clocks(
+                    target_leagues).items()
+            }
+            await self.collect_ended_games(active_matches)
+
+            changed = any(active_matches["fb.com"].values())
+            if changed:
+                await self.publish(active_matches)
+            self.connection_error_count = 0
+            return changed
+        except Exception as e:
+            await self.handle_collect_error('collect_feed_data', e)
+        return False
+
+    async def handle_collect_error(self, source: str, e: Exception) -> None:
+        """
+        Обработка ошибки такта сбора данных: при ошибках подключения
+        повтор после паузы (перезапуск после max_connection_errors
+        подряд), при остальных ошибках - перезапуск.
+
+        :param source: Метод сбора данных, в котором произошла ошибка.
+        :param e: Исключение.
+        """
+        logger.error(f"Error in {source}: {str(e)}")
+        if "Connection refused" in str(
+                e) or "Max retries exceeded with url" in str(e):
+            self.connection_error_count += 1  # Увеличиваем счетчик
+            await self.send_to_logs(
+                f"Ошибка подключения: {str(e)}. Попытка {self.connection_error_count} из {self.max_connection_errors}.")
+
+            if self.connection_error_count >= self.max_connection_errors:
                 await self.send_to_logs(
-                    f"Произошла ошибка: {str(e)}. Перезапуск.")
+                    "Превышено максимальное количество попыток восстановления соединения. Перезапуск процесса.")
                 await self.restart_fetcher()
+            else:
+                await asyncio.sleep(10)  # Пауза перед повторной попыткой
+        else:
+            # Если другая ошибка, логируем и перезапускаем весь процесс
+            await self.send_to_logs(
+                f"Произошла ошибка: {str(e)}. Перезапуск.")
+            await self.restart_fetcher()
 
     async def restart_fetcher(self):
         """
@@ -669,71 +1036,70 @@ class OddsFetcher:
 
         # Инициализируем драйвер заново и сбрасываем счетчик ошибок
         self.driver_fb = await self.get_driver(headless=HEADLESS)
+        self.browser.driver = self.driver_fb
         self.connection_error_count = 0  # Сброс счетчика ошибок
 
         # Повторно запускаем процесс
         await self.run(leagues=LEAGUES)
 
-    async def check_finished_games(self, current_data: Dict[str, Any],
-                                   active_matches: Dict[str, Any]) -> None:
+    async def track_game(
+            self,
+            liga_name: str,
+            game_info: GameSnapshot
+    ) -> None:
         """
-        Проверяет и отмечает завершенные игры, которые пропали из текущих данных.
+        Отмечает игру как присутствующую на странице
+        (продлевает её срок жизни в self.lifecycle).
 
-        :param current_data: Текущие данные о лигах и играх.
-        :param active_matches: Словарь с активными матчами, куда добавляются завершенные игры.
+        :param liga_name: Переведённое наименование лиги.
+        :param game_info: Словарь игры.
         """
-        for site, leagues in self.previous_data.items():
-            for league, games in leagues.items():
-                for game in games:
-                    # Проверка на наличие лиги в текущих данных
-                    if league not in current_data.get(site, {}):
-                        await self._mark_game_as_ended(site, league, game)
-                        continue
-
-                    # Проверка на наличие игры в текущих данных
-                    if game not in current_data[site][league]:
-                        await self._mark_game_as_ended(site, league, game)
-
-        # Обработка завершенных игр с учетом счетчика
-        for game_key, game_info in list(self.ended_games.items()):
-            if game_info['counter'] >= 2000:
-                game = game_info['game']
-                game['is_end_game'] = True
-                league = game.get('league_name')
-                if league:
-                    active_matches["fb.com"].setdefault(league, []).append(game)
-                    await self.delete_games(game, league)
-                del self.ended_games[game_key]
-
-    async def _mark_game_as_ended(self, site: str, league: str,
-                                  game: dict) -> None:
-        """
-        Отмечает игру как завершенную или увеличивает счетчик завершенных игр.
-
-        :param site: Название сайта.
-        :param league: Название лиги.
-        :param game: Данные игры.
-        """
-        game_key = await self._generate_game_key(site, league, game)
-        if game_key in self.ended_games:
-            self.ended_games[game_key]['counter'] += 1
-        else:
-            game['league_name'] = league
-            self.ended_games[game_key] = {'game': game, 'counter': 1}
+        event = self.lifecycle.seen(liga_name, game_info)
+        if event:
+            await self.send_to_logs(
+                f"Новая игра: {liga_name}, "
+                f"{game_info['opponent_0']} - {game_info['opponent_1']}")
 
-    async def _generate_game_key(self, site: str, league: str,
-                           game: Dict[str, Any]) -> str:
+    async def collect_ended_games(
+            self,
+            active_matches: Dict[str, Any]
+    ) -> None:
         """
-        Генерирует уникальный ключ для игры на основе сайта, лиги и имен команд.
+        Обрабатывает события окончания игр из self.lifecycle: игра,
+        не появлявшаяся на странице GAME_END_TTL секунд или
+        показанная под названием до перевода, помечается флагом
+        'is_end_game', её ключи удаляются из Redis. Игра с названием до
+        перевода переносится под перевод в индексе игр и в Redis, в
+        active_matches попадают переименование и игра под новым
+        названием (renamed_games).
 
-        :param site: Название сайта, откуда получены данные.
-        :param league: Название лиги.
-        :param game: Данные о конкретной игре.
-        :return: Уникальный строковый ключ для игры.
+        :param active_matches: Словарь с активными матчами, куда добавляются завершенные игры.
         """
-        return f"{site}_{league}_{game['opponent_0']}_{game['opponent_1']}"
+        # Матчи, пропавшие из сетевого фида, забываются вместе с играми
+        self.feed_decoder.expire(GAME_END_TTL)
+        events = await self.apply_translations()
+        for event in events + self.lifecycle.expire():
+            games = active_matches["fb.com"].setdefault(event.league, [])
+            if event.kind == 'renamed':
+                await self.rename_games(
+                    event.game, event.renamed_to, event.league)
+                # Игра под переводом сравнивается со снимком переноса,
+                # а не считается новой
+                self.previous_data.pop(event.league, game_key(event.game))
+                self.previous_data.put(event.league, event.renamed_to)
+                games.extend(renamed_games(event.game, event.renamed_to))
+                continue
+            game = event.game.to_dict()
+            game.update(league_name=event.league, is_end_game=True)
+            games.append(game)
+            self.previous_data.pop(event.league, game_key(game))
+            await self.delete_games(game, event.league)
 
     async def close(self):
+        self.translate_queue.cancel()
+        if self.listen_task:
+            self.listen_task.cancel()
+        self.browser.shutdown()
         if self.driver_fb:
             self.driver_fb.quit()
             await self.send_to_logs("Драйвер был закрыт принудительно")
@@ -748,22 +1114,38 @@ class OddsFetcher:
         Основной метод для запуска парсера с перезапуском при ошибках.
         """
         leagues = kwargs.get('leagues', LEAGUES)
+        if EXTRACT_MODE == 'network':
+            # Без карты полей фид не даёт записей: ошибка сразу, без повторов
+            check_feed_fields(FEED_FIELDS, 'FB_FEED_FIELDS')
         attempt = 0
         max_retries = 5
 
         while attempt < max_retries:
             try:
+                if attempt:
+                    self.startup_timer.reset()
                 if not self.debug:
                     self.redis_client = RedisClient()
                     await self.redis_client.connect()
 
                 await self.init_async_components()
+                if EXTRACT_MODE == 'network':
+                    self.network_tap = NetworkTap(
+                        self.driver_fb, FEED_URL_PATTERNS)
+                    self.network_tap.start()
                 await self.get_page()
                 await self.main_page()
 
+                scheduler = PollScheduler()
                 while True:
-                    await self.collect_odds_data(leagues)
-                    await asyncio.sleep(1)  # Пауза между циклами сбора данных
+                    if self.network_tap:
+                        changed = await self.collect_feed_data(leagues)
+                    else:
+                        changed = await self.collect_odds_data(leagues)
+                    self.startup_timer.finish('first_tick')
+                    # Пауза между циклами сбора данных зависит от состояния игр
+                    await asyncio.sleep(scheduler.observe(
+                        self.game_clocks, changed))
             except Exception as e:
                 if self.driver_fb and self.driver_fb.session_id:
                     self.driver_fb.save_screenshot(
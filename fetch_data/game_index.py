@@ -0,0 +1,103 @@
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+from fetch_data.game_snapshot import GameSnapshot
+
+# Ключ игры внутри лиги: (opponent_0, opponent_1)
+GameKey = Tuple[str, str]
+
+
+def game_key(game: Mapping[str, Any]) -> GameKey:
+    """
+    Ключ игры внутри лиги.
+
+    :param game: Словарь game_info.
+    :return: (opponent_0, opponent_1).
+    """
+    return game['opponent_0'], game['opponent_1']
+
+
+def freeze_game(game: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Неизменяемый снимок game_info. GameSnapshot сохраняется как есть,
+    у словаря копируется только верхний уровень и rate (значения в
+    game_info плоские), без deepcopy.
+
+    :param game: Словарь game_info.
+    :return: Снимок только для чтения.
+    """
+    if isinstance(game, (MappingProxyType, GameSnapshot)):
+        return game
+    snapshot = dict(game)
+    snapshot['rate'] = MappingProxyType(dict(game.get('rate', {})))
+    return MappingProxyType(snapshot)
+
+
+class GameIndex:
+    """
+    Состояние игр с прошлого такта: лига -> (opponent_0, opponent_1) ->
+    неизменяемый снимок game_info. Поиск игры и сравнение
+    коэффициентов выполняются за O(1) вместо обхода списка лиги.
+    """
+
+    def __init__(self):
+        self.leagues: Dict[str, Dict[GameKey, Mapping[str, Any]]] = {}
+
+    def get(
+            self,
+            league: str,
+            game: Mapping[str, Any]
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Возвращает снимок той же игры (по паре команд).
+
+        :param league: Наименование лиги.
+        :param game: Словарь game_info.
+        :return: Снимок или None, если игры не было.
+        """
+        return self.leagues.get(league, {}).get(game_key(game))
+
+    def put(self, league: str, game: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Сохраняет снимок игры, заменяя предыдущий.
+
+        :param league: Наименование лиги.
+        :param game: Словарь game_info.
+        :return: Сохранённый снимок.
+        """
+        snapshot = freeze_game(game)
+        self.leagues.setdefault(league, {})[game_key(snapshot)] = snapshot
+        return snapshot
+
+    def pop(self, league: str, key: GameKey) -> Optional[Mapping[str, Any]]:
+        games = self.leagues.get(league)
+        if games is None:
+            return None
+        snapshot = games.pop(key, None)
+        if not games:
+            del self.leagues[league]
+        return snapshot
+
+    def rate_changed(self, league: str, game: Mapping[str, Any]) -> bool:
+        """
+        Сравнивает коэффициенты игры со снимком.
+
+        :param league: Наименование лиги.
+        :param game: Словарь game_info.
+        :return: True, если игры не было или изменился rate.
+        """
+        previous = self.get(league, game)
+        return previous is None or previous['rate'] != game['rate']
+
+    def items(self) -> Iterator[Tuple[str, Dict[GameKey, Mapping[str, Any]]]]:
+        return iter(self.leagues.items())
+
+    def games(self) -> Iterator[Mapping[str, Any]]:
+        """Все снимки игр всех лиг."""
+        for games in self.leagues.values():
+            yield from games.values()
+
+    def __contains__(self, league: str) -> bool:
+        return league in self.leagues
+
+    def __len__(self) -> int:
+        return sum(len(games) for games in self.leagues.values())
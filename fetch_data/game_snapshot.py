@@ -0,0 +1,208 @@
+import sys
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from types import MappingProxyType
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+from fetch_data.network_tap import RATE_FIELDS
+
+MOSCOW = ZoneInfo("Europe/Moscow")
+
+# Коэффициенты, по которым принимаются решения о сохранении и отправке
+RATE_BETS = (
+    'total_bet_0',
+    'total_bet_1',
+    'handicap_bet_0',
+    'handicap_bet_1'
+)
+
+# Ключи game_info, доступные через интерфейс Mapping; is_end_game - последний,
+# его нет у записей без признака завершения
+GAME_FIELDS = (
+    'opponent_0',
+    'opponent_1',
+    'score_game',
+    'time_game',
+    'rate',
+    'server_time',
+    'is_end_game'
+)
+
+_RATE_INDEX = {field: index for index, field in enumerate(RATE_FIELDS)}
+
+# Поля, которые можно заменить в копии записи без повторного разбора rate
+REPLACEABLE_FIELDS = frozenset((
+    'opponent_0', 'opponent_1', 'score_game', 'time_game', 'tick',
+    'is_end_game'
+))
+
+
+def parse_number(value: Any) -> float:
+    """
+    Разбор коэффициента или линии со страницы: '-', '' и
+    неразборчивые значения дают 0.0.
+
+    :param value: Строка со страницы.
+    :return: Число.
+    """
+    if value in ('-', '', None):
+        return 0.0
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+class Tick:
+    """
+    Момент такта: одна метка времени на все матчи такта.
+    server_time форматируется один раз, а не для каждого матча.
+    """
+
+    __slots__ = ('epoch_ms', 'server_time')
+
+    def __init__(self, epoch_ms: int):
+        self.epoch_ms = epoch_ms
+        self.server_time = datetime.fromtimestamp(
+            epoch_ms / 1000, tz=MOSCOW).strftime("%H:%M:%S")
+
+    @classmethod
+    def now(cls) -> 'Tick':
+        return cls(time.time_ns() // 1_000_000)
+
+
+class GameSnapshot(Mapping):
+    """
+    Запись матча, создаётся один раз при извлечении и дальше не
+    изменяется.
+
+    Хранит строки коэффициентов в том виде, в каком они на странице
+    (для сравнения и отправки подписчикам), и уже разобранные числа
+    (для Redis и Telegram), интернированные названия команд и лиги и
+    общий для такта Tick. Для совместимости поддерживает чтение как
+    словарь game_info: snapshot['rate'], snapshot.get('time_game').
+    """
+
+    __slots__ = (
+        'league', 'opponent_0', 'opponent_1', 'score_game', 'time_game',
+        'rate', 'numbers', 'tick', 'is_end_game'
+    )
+
+    def __init__(
+            self,
+            league: str,
+            opponent_0: str,
+            opponent_1: str,
+            score_game: str,
+            time_game: str,
+            rate: Dict[str, str],
+            tick: Tick,
+            is_end_game: Optional[bool] = None
+    ):
+        """
+        :param league: Переведённое наименование лиги.
+        :param opponent_0: Первая команда.
+        :param opponent_1: Вторая команда.
+        :param score_game: Счёт вида '10:12'.
+        :param time_game: Период и время вида 'II 05:32'.
+        :param rate: Строки коэффициентов по RATE_FIELDS.
+        :param tick: Такт, в котором матч извлечён.
+        :param is_end_game: Признак завершённой игры; None - поля нет в
+            game_info сайта (akty), ключ не попадает в словарь.
+        """
+        self.league = sys.intern(league)
+        self.opponent_0 = sys.intern(opponent_0)
+        self.opponent_1 = sys.intern(opponent_1)
+        self.score_game = score_game
+        self.time_game = time_game
+        self.rate = MappingProxyType(
+            {field: rate.get(field, '') for field in RATE_FIELDS})
+        self.numbers = tuple(
+            parse_number(self.rate[field]) for field in RATE_FIELDS)
+        self.tick = tick
+        self.is_end_game = is_end_game
+
+    @property
+    def server_time(self) -> str:
+        return self.tick.server_time
+
+    def replace(self, **changes: Any) -> 'GameSnapshot':
+        """
+        Копия записи с заменёнными полями, например свежими time_game
+        и tick для строки из кэша разбора. Коэффициенты и их разобранные
+        значения не копируются заново.
+
+        :param changes: Новые значения полей из REPLACEABLE_FIELDS.
+        :return: Новая запись.
+        """
+        unknown = changes.keys() - REPLACEABLE_FIELDS
+        if unknown:
+            raise TypeError(
+                f'GameSnapshot.replace: нельзя заменить {sorted(unknown)}')
+        snapshot = object.__new__(GameSnapshot)
+        for field in self.__slots__:
+            setattr(snapshot, field, changes.get(field, getattr(self, field)))
+        for field in ('opponent_0', 'opponent_1'):
+            if field in changes:
+                setattr(snapshot, field, sys.intern(changes[field]))
+        return snapshot
+
+    def number(self, field: str) -> float:
+        """
+        Разобранное значение поля rate.
+
+        :param field: Поле из RATE_FIELDS.
+        :return: Число (0.0 для пустых значений).
+        """
+        return self.numbers[_RATE_INDEX[field]]
+
+    def bets(self) -> Dict[str, float]:
+        """Коэффициенты RATE_BETS в виде чисел."""
+        return {field: self.number(field) for field in RATE_BETS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Прежний формат game_info для JSON."""
+        game = {
+            'opponent_0': self.opponent_0,
+            'opponent_1': self.opponent_1,
+            'score_game': self.score_game,
+            'time_game': self.time_game,
+            'rate': dict(self.rate),
+            'server_time': self.server_time,
+        }
+        if self.is_end_game is not None:
+            game['is_end_game'] = self.is_end_game
+        return game
+
+    def _fields(self) -> Tuple[str, ...]:
+        if self.is_end_game is None:
+            return GAME_FIELDS[:-1]
+        return GAME_FIELDS
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields())
+
+    def __len__(self) -> int:
+        return len(self._fields())
+
+    def __repr__(self) -> str:
+        return f'GameSnapshot({self.league!r}, {self.to_dict()!r})'
+
+
+def snapshot_json(value: Any) -> Optional[Dict[str, Any]]:
+    """
+    Хук default для json.dumps: сериализует GameSnapshot в game_info.
+
+    :param value: Объект, который json не умеет сериализовать.
+    :return: Словарь game_info.
+    """
+    if isinstance(value, GameSnapshot):
+        return value.to_dict()
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable')
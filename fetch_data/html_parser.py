@@ -0,0 +1,189 @@
+import os
+import re
+from typing import Any, Iterator, List, Optional, Union
+import soupsieve
+from bs4 import BeautifulSoup
+
+# Бэкенд разбора HTML: 'html.parser', 'lxml' или 'selectolax'
+HTML_PARSER = os.getenv('HTML_PARSER', 'html.parser')
+HTML_PARSERS = ('html.parser', 'lxml', 'selectolax')
+
+# Пробельные символы и теги, в которых BeautifulSoup сохраняет пробелы
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+PRESERVE_WHITESPACE_TAGS = frozenset(('pre', 'textarea'))
+
+
+def parse_html(html: str, backend: str = HTML_PARSER):
+    """
+    Разбирает HTML выбранным бэкендом.
+
+    Все бэкенды возвращают объект с одинаковым подмножеством API
+    BeautifulSoup, которое используют парсеры: find, find_all, select,
+    select_one, get_text, text, get, attrs и доступ к атрибутам по ключу.
+
+    :param html: Строка HTML (страница целиком или outerHTML элемента).
+    :param backend: Имя бэкенда из HTML_PARSERS.
+    :return: Корень разобранного документа.
+    """
+    if backend == 'selectolax':
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise RuntimeError(
+                "Бэкенд 'selectolax' требует пакет selectolax") from e
+        return SelectolaxNode(LexborHTMLParser(html).root)
+    if backend not in HTML_PARSERS:
+        raise ValueError(f"Неизвестный бэкенд разбора HTML: {backend}")
+    return BeautifulSoup(html, backend)
+
+
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    Предкомпилирует CSS-селектор для повторного использования в select
+    и select_one любого бэкенда: BeautifulSoup принимает
+    скомпилированный селектор, SelectolaxNode - его исходный текст.
+
+    :param selector: CSS-селектор.
+    :return: Скомпилированный селектор.
+    """
+    return soupsieve.compile(selector)
+
+
+def _selector_text(selector: Union[str, soupsieve.SoupSieve]) -> str:
+    """Текст селектора для selectolax, который компилирует его сам."""
+    if isinstance(selector, soupsieve.SoupSieve):
+        return selector.pattern
+    return selector
+
+
+def _text_content(node) -> str:
+    """
+    Текст текстового узла selectolax в том виде, в каком его хранит
+    BeautifulSoup: строка только из пробелов вне pre и textarea
+    заменяется на перевод строки (если он в ней есть) или пробел.
+    """
+    text = node.text_content or ''
+    if text.strip(ASCII_SPACES):
+        return text
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in PRESERVE_WHITESPACE_TAGS:
+            return text
+        parent = parent.parent
+    if not text:
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _class_matches(class_attr: Optional[str], class_: Any) -> bool:
+    """
+    Проверка класса по правилам BeautifulSoup: строка совпадает с одним
+    из классов или со всем атрибутом целиком, регулярное выражение
+    ищется в каждом классе и во всём атрибуте.
+    """
+    if class_ is None:
+        return True
+    if class_attr is None:
+        return False
+    classes = class_attr.split()
+    if isinstance(class_, re.Pattern):
+        return any(class_.search(value) for value in classes) or bool(
+            class_.search(class_attr))
+    return class_ in classes or class_ == class_attr
+
+
+class SelectolaxNode:
+    """
+    Обёртка над узлом selectolax с API, совместимым с BeautifulSoup
+    в объёме, который нужен парсерам.
+    """
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def _children(self) -> Iterator[Any]:
+        return self.node.iter(include_text=False)
+
+    def _descendants(self) -> Iterator[Any]:
+        stack = list(self._children())
+        stack.reverse()
+        while stack:
+            node = stack.pop()
+            yield node
+            children = list(node.iter(include_text=False))
+            children.reverse()
+            stack.extend(children)
+
+    def find_all(
+            self,
+            name: str = None,
+            class_: Any = None,
+            recursive: bool = True
+    ) -> List['SelectolaxNode']:
+        nodes = self._descendants() if recursive else self._children()
+        return [
+            SelectolaxNode(node) for node in nodes
+            if (name is None or node.tag == name) and
+            _class_matches(node.attributes.get('class'), class_)
+        ]
+
+    def find(
+            self,
+            name: str = None,
+            class_: Any = None,
+            recursive: bool = True
+    ) -> Optional['SelectolaxNode']:
+        nodes = self._descendants() if recursive else self._children()
+        for node in nodes:
+            if (name is None or node.tag == name) and _class_matches(
+                    node.attributes.get('class'), class_):
+                return SelectolaxNode(node)
+        return None
+
+    def select(
+            self,
+            selector: Union[str, soupsieve.SoupSieve]
+    ) -> List['SelectolaxNode']:
+        return [
+            SelectolaxNode(node)
+            for node in self.node.css(_selector_text(selector))
+        ]
+
+    def select_one(
+            self,
+            selector: Union[str, soupsieve.SoupSieve]
+    ) -> Optional['SelectolaxNode']:
+        node = self.node.css_first(_selector_text(selector))
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, separator: str = '') -> str:
+        return separator.join(
+            _text_content(node)
+            for node in self.node.traverse(include_text=True)
+            if node.tag == '-text'
+        )
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    @property
+    def attrs(self) -> dict:
+        attrs = {
+            key: value if value is not None else ''
+            for key, value in self.node.attributes.items()
+        }
+        if 'class' in attrs:
+            attrs['class'] = attrs['class'].split()
+        return attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.attrs[key]
+
+    def __str__(self) -> str:
+        return self.node.html or ''
@@ -0,0 +1,125 @@
+import os
+import time
+import heapq
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from fetch_data.game_index import GameKey, game_key
+
+# Игра считается завершённой, если не появлялась на странице столько
+# секунд (прежние 2000 пропусков при опросе раз в секунду)
+GAME_END_TTL = float(os.getenv('GAME_END_TTL', '2000'))
+
+
+class LifecycleEvent(NamedTuple):
+    """
+    Событие жизненного цикла игры: 'started', 'ended' или 'renamed'
+    (для 'renamed' game - запись под прежним названием команды,
+    renamed_to - та же игра под новым).
+    """
+    kind: str
+    league: str
+    game: Mapping[str, Any]
+    renamed_to: Optional[Mapping[str, Any]] = None
+
+
+class GameLifecycle:
+    """
+    Отслеживание начала и окончания игр по времени.
+
+    Каждая игра получает срок жизни GAME_END_TTL секунд с момента,
+    когда её видели последний раз. Сроки хранятся в куче: при
+    наступлении срока игра, которую за это время видели снова,
+    переставляется в куче на новый срок, иначе выдаётся событие
+    'ended'. Обработка события - O(log n), момент окончания не
+    зависит от частоты опроса.
+    """
+
+    def __init__(self, ttl: float = GAME_END_TTL):
+        """
+        :param ttl: Срок жизни игры без обновлений в секундах.
+        """
+        self.ttl = ttl
+        # (лига, ключ игры) -> (время последнего появления, game_info)
+        self.games: Dict[Tuple[str, GameKey],
+                         Tuple[float, Mapping[str, Any]]] = {}
+        self.deadlines: List[Tuple[float, str, GameKey]] = []
+
+    def seen(
+            self,
+            league: str,
+            game: Mapping[str, Any],
+            now: float = None
+    ) -> Optional[LifecycleEvent]:
+        """
+        Отмечает, что игра присутствует на странице.
+
+        :param league: Наименование лиги.
+        :param game: Словарь game_info.
+        :param now: Текущее время (time.monotonic), по умолчанию сейчас.
+        :return: Событие 'started' для новой игры, иначе None.
+        """
+        now = time.monotonic() if now is None else now
+        key = game_key(game)
+        is_new = (league, key) not in self.games
+        self.games[(league, key)] = (now, game)
+        if is_new:
+            heapq.heappush(self.deadlines, (now + self.ttl, league, key))
+            return LifecycleEvent('started', league, game)
+        return None
+
+    def expire(self, now: float = None) -> List[LifecycleEvent]:
+        """
+        Выдаёт события 'ended' для игр, срок жизни которых истёк.
+
+        :param now: Текущее время (time.monotonic), по умолчанию сейчас.
+        :return: Список событий в порядке истечения сроков.
+        """
+        now = time.monotonic() if now is None else now
+        events = []
+        while self.deadlines and self.deadlines[0][0] <= now:
+            _, league, key = heapq.heappop(self.deadlines)
+            entry = self.games.get((league, key))
+            if entry is None:
+                continue
+            last_seen, game = entry
+            if last_seen + self.ttl > now:
+                # Игру видели после постановки срока - продлеваем
+                heapq.heappush(
+                    self.deadlines, (last_seen + self.ttl, league, key))
+                continue
+            del self.games[(league, key)]
+            events.append(LifecycleEvent('ended', league, game))
+        return events
+
+    def rename_team(self, name: str, new_name: str) -> List[LifecycleEvent]:
+        """
+        Переносит игры команды под новое название (например, перевод
+        временного названия со страницы). Время последнего появления
+        игры сохраняется, срок жизни не сбрасывается.
+
+        :param name: Прежнее название команды.
+        :param new_name: Новое название.
+        :return: События 'renamed'; если игра под новым названием уже
+            отслеживается - событие 'ended' для записи под прежним.
+        """
+        events = []
+        for (league, key), (last_seen, game) in list(self.games.items()):
+            if name not in key:
+                continue
+            del self.games[(league, key)]
+            renamed = game.replace(**{
+                field: new_name
+                for field, team in zip(('opponent_0', 'opponent_1'), key)
+                if team == name
+            })
+            new_key = game_key(renamed)
+            if (league, new_key) in self.games:
+                events.append(LifecycleEvent('ended', league, game))
+                continue
+            self.games[(league, new_key)] = (last_seen, renamed)
+            heapq.heappush(
+                self.deadlines, (last_seen + self.ttl, league, new_key))
+            events.append(LifecycleEvent('renamed', league, game, renamed))
+        return events
+
+    def __len__(self) -> int:
+        return len(self.games)
@@ -0,0 +1,79 @@
+import os
+import json
+import time
+import logging
+from typing import Dict
+
+# Бюджет времени от запуска драйвера до первых коэффициентов, секунды
+STARTUP_BUDGET = float(os.getenv('STARTUP_BUDGET', '60'))
+
+
+def document_ready(driver) -> bool:
+    """
+    Условие для WebDriverWait: документ полностью загружен.
+
+    :param driver: WebDriver.
+    :return: True, если document.readyState == 'complete'.
+    """
+    return driver.execute_script(
+        'return document.readyState') == 'complete'
+
+
+class StartupTimer:
+    """
+    Замер этапов холодного старта парсера.
+
+    Каждый вызов mark() фиксирует длительность этапа с предыдущей
+    отметки, finish() пишет в лог структурированный отчёт одной
+    JSON-строкой и сравнивает общее время с STARTUP_BUDGET.
+    """
+
+    def __init__(self, parser_name: str, logger: logging.Logger):
+        """
+        :param parser_name: Имя парсера для отчёта.
+        :param logger: Логгер парсера.
+        """
+        self.parser_name = parser_name
+        self.logger = logger
+        self.reset()
+
+    def reset(self) -> None:
+        """Начинает новый замер (например, при повторной попытке запуска)."""
+        self.started = time.monotonic()
+        self.last = self.started
+        self.steps: Dict[str, float] = {}
+        self.finished = False
+
+    def mark(self, step: str) -> None:
+        """
+        Фиксирует окончание этапа.
+
+        :param step: Название этапа.
+        """
+        now = time.monotonic()
+        self.steps[step] = round(
+            self.steps.get(step, 0) + now - self.last, 3)
+        self.last = now
+
+    def finish(self, step: str = 'first_tick') -> None:
+        """
+        Фиксирует последний этап и пишет отчёт. Повторные вызовы
+        игнорируются до следующего reset().
+
+        :param step: Название последнего этапа.
+        """
+        if self.finished:
+            return
+        self.mark(step)
+        self.finished = True
+        total = round(self.last - self.started, 3)
+        report = {
+            'event': 'startup',
+            'parser': self.parser_name,
+            'steps': self.steps,
+            'total': total,
+            'budget': STARTUP_BUDGET,
+            'over_budget': total > STARTUP_BUDGET,
+        }
+        level = logging.WARNING if report['over_budget'] else logging.INFO
+        self.logger.log(level, json.dumps(report, ensure_ascii=False))
@@ -0,0 +1,352 @@
+import os
+import re
+import json
+import time
+import base64
+from typing import Any, Container, Dict, Iterable, List, Optional, Tuple
+from app.logging import setup_logger
+
+# Настройка логгера
+logger = setup_logger('network_tap', 'network_tap.log')
+
+# Запись всех пойманных кадров в лог для сверки карты полей
+NETWORK_TAP_DUMP = bool(int(os.getenv('NETWORK_TAP_DUMP', '0')))
+
+# Поля матча, которые декодер собирает из фида
+MATCH_FIELDS = (
+    'league',
+    'opponent_0',
+    'opponent_1',
+    'score_0',
+    'score_1',
+    'period',
+    'clock',
+)
+RATE_FIELDS = (
+    'total_point',
+    'total_bet_0',
+    'total_bet_1',
+    'handicap_point_0',
+    'handicap_bet_0',
+    'handicap_point_1',
+    'handicap_bet_1',
+)
+
+# Поля, без которых декодер не собирает ни одной записи матча
+REQUIRED_FEED_FIELDS = ('id', 'league', 'opponent_0', 'opponent_1')
+
+# Путь вида "a.b.0.c" или "mg[mty=1005].op.0.od":
+# сегмент name[key=value] выбирает первый элемент списка name,
+# у которого key равен value.
+_SEGMENT_FILTER = re.compile(r'^(?P<name>[^\[]*)\[(?P<key>[^=]+)=(?P<value>[^\]]*)\]$')
+
+
+def enable_performance_log(options) -> None:
+    """
+    Включает журнал производительности Chrome, через который
+    драйвер получает события CDP Network.
+
+    :param options: uc.ChromeOptions, которые будут переданы драйверу.
+    """
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def load_feed_fields(env_name: str, default: Dict[str, str]) -> Dict[str, str]:
+    """
+    Загружает карту полей фида из переменной окружения (JSON),
+    дополняя ею карту по умолчанию.
+
+    :param env_name: Имя переменной окружения.
+    :param default: Карта полей по умолчанию.
+    :return: Итоговая карта полей.
+    """
+    fields = dict(default)
+    raw = os.getenv(env_name)
+    if raw:
+        fields.update(json.loads(raw))
+    return fields
+
+
+def check_feed_fields(fields: Dict[str, str], env_name: str) -> None:
+    """
+    Проверяет, что карта полей фида позволяет собрать записи матчей.
+    Без неё сетевой режим работает, но не выдаёт ни одной записи.
+
+    :param fields: Карта полей фида.
+    :param env_name: Переменная окружения с картой (для сообщения).
+    :raises ValueError: Если для обязательных полей нет путей.
+    """
+    missing = [field for field in REQUIRED_FEED_FIELDS if not fields.get(field)]
+    if missing:
+        raise ValueError(
+            f"Сетевой режим требует карту полей фида в {env_name}: "
+            f"нет путей для {', '.join(missing)}")
+
+
+def get_by_path(obj: Any, path: str) -> Any:
+    """
+    Достаёт значение из вложенных словарей и списков по пути.
+
+    :param obj: Объект из фида.
+    :param path: Путь через точку.
+    :return: Значение или None, если путь не найден.
+    """
+    current = obj
+    for segment in path.split('.'):
+        if current is None:
+            return None
+        match = _SEGMENT_FILTER.match(segment)
+        if match:
+            if match['name']:
+                current = current.get(match['name']) if isinstance(
+                    current, dict) else None
+            if not isinstance(current, list):
+                return None
+            current = next(
+                (item for item in current if isinstance(item, dict) and
+                 str(item.get(match['key'])) == match['value']),
+                None
+            )
+        elif isinstance(current, list):
+            try:
+                current = current[int(segment)]
+            except (ValueError, IndexError):
+                return None
+        elif isinstance(current, dict):
+            current = current.get(segment)
+        else:
+            return None
+    return current
+
+
+class NetworkTap:
+    """
+    Чтение сетевых ответов страницы через CDP.
+
+    Собирает JSON из XHR-ответов и websocket-кадров, URL которых
+    совпадает с одним из шаблонов, без разбора DOM.
+    """
+
+    def __init__(
+            self,
+            driver,
+            url_patterns: Iterable[str]
+    ):
+        """
+        :param driver: WebDriver с включённым журналом производительности.
+        :param url_patterns: Подстроки URL, ответы которых нужно читать.
+        """
+        self.driver = driver
+        self.url_patterns = tuple(url_patterns)
+        self.sockets = set()
+        self.pending_responses = set()
+
+    def matches(self, url: str) -> bool:
+        # Без шаблонов читаются все JSON-ответы и сокеты страницы
+        if not self.url_patterns:
+            return True
+        return any(pattern in url for pattern in self.url_patterns)
+
+    def start(self) -> None:
+        """Включает события Network в текущей вкладке."""
+        self.driver.execute_cdp_cmd('Network.enable', {})
+
+    def read_payloads(self) -> List[Any]:
+        """
+        Забирает накопившиеся события и возвращает разобранные JSON-данные.
+
+        :return: Список объектов из ответов и кадров.
+        """
+        payloads = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+
+            if method == 'Network.webSocketCreated':
+                if self.matches(params.get('url', '')):
+                    self.sockets.add(request_id)
+            elif method == 'Network.webSocketClosed':
+                self.sockets.discard(request_id)
+            elif method == 'Network.webSocketFrameReceived':
+                if request_id in self.sockets:
+                    self._append_payload(
+                        payloads, params['response'].get('payloadData', ''))
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                if (self.matches(response.get('url', '')) and
+                        'json' in response.get('mimeType', '')):
+                    self.pending_responses.add(request_id)
+            elif method == 'Network.loadingFinished':
+                if request_id in self.pending_responses:
+                    self.pending_responses.discard(request_id)
+                    self._append_payload(payloads, self._response_body(request_id))
+            elif method == 'Network.loadingFailed':
+                self.pending_responses.discard(request_id)
+        return payloads
+
+    def _response_body(self, request_id: str) -> str:
+        try:
+            body = self.driver.execute_cdp_cmd(
+                'Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            logger.info(f'Не удалось получить тело ответа {request_id}: {e}')
+            return ''
+        if body.get('base64Encoded'):
+            return base64.b64decode(body['body']).decode('utf-8', 'replace')
+        return body.get('body', '')
+
+    @staticmethod
+    def _append_payload(payloads: List[Any], text: str) -> None:
+        if NETWORK_TAP_DUMP:
+            logger.info(f'Кадр фида: {text}')
+        # Socket.IO/SockJS добавляют к JSON числовой префикс пакета
+        start = min(
+            (index for index in (text.find('{'), text.find('[')) if index >= 0),
+            default=-1
+        )
+        if start < 0:
+            return
+        try:
+            payloads.append(json.loads(text[start:]))
+        except ValueError:
+            pass
+
+
+class FeedDecoder:
+    """
+    Сборка состояния матчей из кадров фида по карте полей.
+
+    Карта полей сопоставляет поле записи (см. MATCH_FIELDS и RATE_FIELDS)
+    с путём внутри объекта матча; ключ 'id' обязателен. Фиды присылают
+    то снимок, то частичные обновления, поэтому записи накапливаются
+    по идентификатору матча. Матчи, пропавшие из фида, удаляются
+    через expire.
+    """
+
+    def __init__(self, fields: Dict[str, str]):
+        """
+        :param fields: Карта полей фида.
+        """
+        self.fields = fields
+        self.matches: Dict[str, Dict[str, Any]] = {}
+        # id матча -> время последнего кадра с ним (time.monotonic)
+        self.last_seen: Dict[str, float] = {}
+
+    def feed(
+            self,
+            payloads: List[Any],
+            now: float = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Обновляет состояние матчей кадрами фида.
+
+        :param payloads: Разобранные кадры из NetworkTap.read_payloads.
+        :param now: Текущее время (time.monotonic), по умолчанию сейчас.
+        :return: Полные записи матчей, затронутых этими кадрами.
+        """
+        now = time.monotonic() if now is None else now
+        touched = {}
+        for payload in payloads:
+            for obj in self._iter_objects(payload):
+                match_id = get_by_path(obj, self.fields['id'])
+                if match_id is None or isinstance(match_id, (dict, list)):
+                    continue
+                record = self._decode(obj)
+                if not record:
+                    continue
+                state = self.matches.setdefault(
+                    str(match_id), {'rate': {}})
+                state['rate'].update(record.pop('rate'))
+                state.update(record)
+                touched[str(match_id)] = state
+                self.last_seen[str(match_id)] = now
+        return [
+            record for record in touched.values()
+            if record.get('league') and record.get('opponent_0') and
+            record.get('opponent_1')
+        ]
+
+    def clocks(self, leagues: Container[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Период и игровые часы всех известных матчей лиг leagues из
+        накопленного состояния фида, а не только затронутых кадрами такта.
+
+        :param leagues: Названия лиг (как в фиде).
+        :return: id матча -> (период, часы).
+        """
+        return {
+            match_id: (record.get('period', ''), record.get('clock', ''))
+            for match_id, record in self.matches.items()
+            if record.get('league') in leagues
+        }
+
+    def forget(self, match_id: str) -> None:
+        self.matches.pop(match_id, None)
+        self.last_seen.pop(match_id, None)
+
+    def expire(self, ttl: float, now: float = None) -> List[str]:
+        """
+        Удаляет матчи, которых не было в кадрах фида ttl секунд
+        (игра завершилась или пропала из фида).
+
+        :param ttl: Срок жизни матча без кадров в секундах.
+        :param now: Текущее время (time.monotonic), по умолчанию сейчас.
+        :return: id удалённых матчей.
+        """
+        now = time.monotonic() if now is None else now
+        stale = [
+            match_id for match_id, last_seen in self.last_seen.items()
+            if now - last_seen >= ttl
+        ]
+        for match_id in stale:
+            self.forget(match_id)
+        return stale
+
+    def _decode(self, obj: dict) -> Optional[Dict[str, Any]]:
+        record = {'rate': {}}
+        for field in MATCH_FIELDS:
+            value = self._value(obj, field)
+            if value is not None:
+                record[field] = value
+        for field in RATE_FIELDS:
+            value = self._value(obj, field)
+            if value is not None:
+                record['rate'][field] = value
+        if len(record) == 1 and not record['rate']:
+            return None
+        return record
+
+    def _value(self, obj: dict, field: str) -> Optional[str]:
+        path = self.fields.get(field)
+        if not path:
+            return None
+        value = get_by_path(obj, path)
+        if value is None or isinstance(value, (dict, list)):
+            return None
+        return str(value)
+
+    def _iter_objects(self, payload: Any):
+        # Объект матча может лежать на любой глубине кадра; его узнаём
+        # по ключу первого сегмента пути id (без фильтра [key=value])
+        segment = self.fields['id'].split('.')[0]
+        match = _SEGMENT_FILTER.match(segment)
+        id_key = match['name'] if match else segment
+        stack = [payload]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                if id_key in current:
+                    yield current
+                    continue
+                stack.extend(
+                    value for value in current.values()
+                    if isinstance(value, (dict, list)))
+            elif isinstance(current, list):
+                stack.extend(
+                    value for value in current
+                    if isinstance(value, (dict, list)))
@@ -0,0 +1,229 @@
+# JavaScript-сниппеты, которые парсеры выполняют внутри страницы
+# через driver.execute_script.
+
+# Устанавливает MutationObserver на контейнер с играми akty.com.
+# Наблюдатель копит изменившиеся карточки матчей целевых лиг (ход
+# игрового таймера изменением не считается), а AKTY_DRAIN_OBSERVER_JS
+# забирает их одним вызовом.
+# arguments[0] - список названий целевых лиг (как на странице).
+AKTY_INSTALL_OBSERVER_JS = """
+const root = document.querySelector(
+    "div[class*='v-scroll-content relative-position']");
+if (!root) {
+    return false;
+}
+if (window.__aktyObserver) {
+    window.__aktyObserver.disconnect();
+}
+const TIMER_SELECTOR = 'span.timer-layout2';
+const state = {
+    root: root,
+    targets: new Set(arguments[0]),
+    dirty: new Set(),
+    resync: false,
+    leagueOf: function (card) {
+        for (let el = card; el; el = el.previousElementSibling) {
+            const name = el.querySelector('span.ellipsis.allow-user-select');
+            if (name) {
+                return el === card ? null : name.textContent;
+            }
+        }
+        return null;
+    }
+};
+const observer = new MutationObserver(function (mutations) {
+    for (const mutation of mutations) {
+        if (mutation.type === 'childList' && mutation.target === root) {
+            state.resync = true;
+            continue;
+        }
+        let el = mutation.target.nodeType === 1
+            ? mutation.target : mutation.target.parentElement;
+        // Игровой таймер меняется каждую секунду, а коэффициенты
+        // карточки при этом не меняются
+        if (el && el.closest(TIMER_SELECTOR)) {
+            continue;
+        }
+        while (el && el.parentElement !== root) {
+            el = el.parentElement;
+        }
+        if (el) {
+            state.dirty.add(el);
+        }
+    }
+});
+observer.observe(root, {
+    subtree: true,
+    childList: true,
+    characterData: true,
+    attributes: true,
+    attributeFilter: ['class', 'style']
+});
+window.__aktyObserver = observer;
+window.__aktyState = state;
+return true;
+"""
+
+# Забирает накопленные наблюдателем изменения и очищает очередь.
+# Возвращает null, если наблюдатель потерян (перезагрузка страницы),
+# иначе {resync: bool, rows: [{league, html}], clocks: {...}}.
+# Ход таймера наблюдатель не отслеживает, поэтому игровое время всех
+# матчей целевых лиг читается при каждом вызове:
+# clocks - "<лига>\x1f<команда 1>\x1f<команда 2>" -> [период, таймер].
+AKTY_DRAIN_OBSERVER_JS = """
+const state = window.__aktyState;
+if (!state || !state.root.isConnected) {
+    return null;
+}
+const result = {resync: state.resync, rows: [], clocks: {}};
+let clockLeague = null;
+for (const card of state.root.children) {
+    const name = card.querySelector('span.ellipsis.allow-user-select');
+    if (name) {
+        clockLeague = name.textContent;
+        continue;
+    }
+    if (!state.targets.has(clockLeague)) {
+        continue;
+    }
+    for (const item of card.querySelectorAll('div.c-match-item')) {
+        const team0 = item.querySelector(
+            'div[class="row-item team-item"] div[class*="allow-user-select"]');
+        const team1 = item.querySelector(
+            'div[class="row-item team-item soon"] div[class*="allow-user-select"]');
+        if (!team0 || !team1) {
+            continue;
+        }
+        const period = item.querySelector('div.process_name');
+        const timer = item.querySelector('span.timer-layout2');
+        result.clocks[[clockLeague, team0.textContent, team1.textContent]
+            .join('\\u001f')] = [
+            period ? period.textContent.trim() : '',
+            timer ? timer.textContent : ''
+        ];
+    }
+}
+for (const card of state.dirty) {
+    if (!card.isConnected) {
+        result.resync = true;
+        continue;
+    }
+    const league = state.leagueOf(card);
+    if (league === null) {
+        // Изменилась шапка лиги (например, свернули список)
+        result.resync = true;
+        continue;
+    }
+    if (state.targets.has(league)) {
+        result.rows.push({league: league, html: card.outerHTML});
+    }
+}
+state.dirty.clear();
+state.resync = false;
+return result;
+"""
+
+# Извлекает матчи целевых лиг fb.com одним вызовом, повторяя
+# селекторы OddsFetcher.extract_matches_from_soup.
+# arguments[0] - список названий целевых лиг (как на странице).
+# Возвращает [{league, opponent_0, opponent_1, score_0, score_1,
+# period, clock, rate: {...}}].
+FB_EXTRACT_MATCHES_JS = """
+const targets = new Set(arguments[0]);
+const result = [];
+const groups = document.querySelectorAll(
+    '.home-match-list-box .group-matches');
+for (const group of groups) {
+    const leagueElement = group.querySelector('.league-name');
+    if (!leagueElement || !targets.has(leagueElement.textContent)) {
+        continue;
+    }
+    const matches = group.querySelectorAll(
+        '.home-match-list__item.home-match-info');
+    for (const match of matches) {
+        const teams = match.querySelectorAll('.match-teams-name .team-name');
+        if (teams.length !== 2) {
+            continue;
+        }
+        const scores = match.querySelectorAll('.match-score p span');
+        if (scores.length !== 2) {
+            continue;
+        }
+        const record = {
+            league: leagueElement.textContent,
+            opponent_0: teams[0].textContent.trim(),
+            opponent_1: teams[1].textContent.trim(),
+            score_0: scores[0].textContent,
+            score_1: scores[1].textContent,
+            period: '',
+            clock: '',
+            rate: {}
+        };
+        const time = match.querySelector('.time');
+        if (time) {
+            const period = time.querySelector('.match-left-text.font-din');
+            record.period = period ? period.textContent.trim() : '';
+            const clock = time.querySelector('.match-left-time.font-din');
+            record.clock = clock ? clock.textContent.trim() : '';
+        }
+        let foundHandicap = false;
+        let foundTotal = false;
+        for (const box of match.querySelectorAll('.home-match-odds-box')) {
+            const values = box.querySelectorAll(
+                '.team-odds-list .value.font-din');
+            const points = box.querySelectorAll(
+                '.team-odds-list .prefix-text.text-grey-disable');
+            if (box.classList.contains('match-full-odds-handicap') &&
+                    !foundHandicap) {
+                foundHandicap = true;
+                if (values.length >= 2) {
+                    record.rate.handicap_bet_0 = values[0].textContent;
+                    record.rate.handicap_bet_1 = values[1].textContent;
+                }
+                if (points.length >= 2) {
+                    record.rate.handicap_point_0 = points[0].textContent;
+                    record.rate.handicap_point_1 = points[1].textContent;
+                }
+            } else if (box.classList.contains('match-full-odds-total') &&
+                    !foundTotal) {
+                foundTotal = true;
+                if (values.length >= 2) {
+                    record.rate.total_bet_0 = values[0].textContent;
+                    record.rate.total_bet_1 = values[1].textContent;
+                }
+                if (points.length >= 2) {
+                    record.rate.total_point = points[0].textContent;
+                }
+            }
+        }
+        result.push(record);
+    }
+}
+return result;
+"""
+
+# Отпечаток контейнера с играми akty.com, считается внутри страницы.
+# Учитывает текст и стиль каждой карточки (стиль нужен для отслеживания
+# свёрнутых лиг). Возвращает "<число карточек>:<FNV-1a>" или null,
+# если контейнер не найден.
+AKTY_CONTAINER_FINGERPRINT_JS = """
+const root = document.querySelector(
+    "div[class*='v-scroll-content relative-position']");
+if (!root) {
+    return null;
+}
+let hash = 0x811c9dc5;
+const feed = function (text) {
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+};
+for (const card of root.children) {
+    feed(card.getAttribute('style') || '');
+    feed('\\u0001');
+    feed(card.textContent);
+    feed('\\u0002');
+}
+return root.children.length + ':' + (hash >>> 0).toString(16);
+"""
@@ -0,0 +1,115 @@
+import os
+import re
+import time
+from typing import Dict, Hashable, Mapping
+
+# Интервалы опроса страницы, секунды
+POLL_MIN_INTERVAL = float(os.getenv('POLL_MIN_INTERVAL', '0.5'))
+POLL_LIVE_INTERVAL = float(os.getenv('POLL_LIVE_INTERVAL', '1'))
+POLL_PAUSE_INTERVAL = float(os.getenv('POLL_PAUSE_INTERVAL', '5'))
+POLL_IDLE_INTERVAL = float(os.getenv('POLL_IDLE_INTERVAL', '30'))
+# Сколько секунд после последнего хода игрового времени опрос
+# остаётся частым (время на странице обновляется не каждый такт)
+LIVE_HOLD = 10
+# Вес последнего такта в скользящей доле тактов с изменениями
+CHANGE_RATE_WEIGHT = 0.2
+
+# time_game вида "II 05:32": переведённый период и игровое время
+TIME_GAME = re.compile(r'^(?P<period>I{1,3}|IV)\s+(?P<clock>\d{1,2}:\d{2})')
+
+
+class PollScheduler:
+    """
+    Адаптивный интервал опроса страницы.
+
+    Интервал выбирается по состоянию игр и частоте изменений:
+    - идёт четверть (игровое время хотя бы одного матча изменилось
+      с прошлого такта) - POLL_LIVE_INTERVAL;
+    - матчи есть, но время стоит (перерыв, тайм-аут, матч не начался) -
+      POLL_PAUSE_INTERVAL;
+    - матчей целевых лиг нет - POLL_IDLE_INTERVAL.
+    Чем чаще такты приносят изменения, тем ближе интервал к
+    POLL_MIN_INTERVAL. Изменение после простоя сразу возвращает
+    частый опрос.
+    """
+
+    def __init__(
+            self,
+            live_interval: float = POLL_LIVE_INTERVAL,
+            pause_interval: float = POLL_PAUSE_INTERVAL,
+            idle_interval: float = POLL_IDLE_INTERVAL,
+            min_interval: float = POLL_MIN_INTERVAL
+    ):
+        """
+        :param live_interval: Интервал во время игровых четвертей.
+        :param pause_interval: Интервал, когда игровое время стоит.
+        :param idle_interval: Интервал, когда матчей нет.
+        :param min_interval: Нижняя граница интервала.
+        """
+        self.live_interval = live_interval
+        self.pause_interval = pause_interval
+        self.idle_interval = idle_interval
+        self.min_interval = min(min_interval, live_interval)
+        self.clocks: Dict[Hashable, str] = {}
+        self.change_rate = 0.0
+        self.last_running = None
+        self.interval = live_interval
+        self.state = 'live'
+
+    def observe(
+            self,
+            time_games: Mapping[Hashable, str],
+            changed: bool
+    ) -> float:
+        """
+        Учитывает результат такта и пересчитывает интервал.
+
+        Игровое время должно быть прочитано со страницы (или из фида)
+        в этом же такте: снимки игр из кэша или previous_data не
+        обновляются, пока не изменятся коэффициенты, и их время стоит.
+
+        :param time_games: Текущие матчи целевых лиг: ключ матча
+            (любой, постоянный между тактами) -> time_game вида 'II 05:32'.
+        :param changed: Принёс ли такт изменения.
+        :return: Интервал до следующего такта в секундах.
+        """
+        clocks = {}
+        has_games = bool(time_games)
+        running = False
+        for key, time_game in time_games.items():
+            match = TIME_GAME.match((time_game or '').strip())
+            if not match:
+                continue
+            clock = match.group(0)
+            clocks[key] = clock
+            if self.clocks.get(key, clock) != clock:
+                running = True
+        self.clocks = clocks
+        now = time.monotonic()
+        if running:
+            self.last_running = now
+
+        self.change_rate += CHANGE_RATE_WEIGHT * (
+            float(changed) - self.change_rate)
+
+        recently_running = (self.last_running is not None and
+                            now - self.last_running < LIVE_HOLD)
+        if ((has_games and recently_running) or
+                (changed and self.state == 'idle')):
+            # Изменение после простоя сразу возвращает частый опрос,
+            # пока не станет ясно состояние матчей
+            self.state = 'live'
+        elif has_games:
+            self.state = 'pause'
+        else:
+            self.state = 'idle'
+
+        base = {
+            'live': self.live_interval,
+            'pause': self.pause_interval,
+            'idle': self.idle_interval,
+        }[self.state]
+        if self.state != 'idle':
+            base -= (base - self.min_interval) * self.change_rate
+        self.interval = max(self.min_interval, base)
+        return self.interval
@@ -0,0 +1,208 @@
+import os
+import math
+import threading
+from fnmatch import fnmatchcase
+from typing import Iterable, List, Optional, Tuple
+import trio
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.bidi import cdp
+from app.logging import setup_logger
+from fetch_data.browser_host import get_host_version
+
+# Настройка логгера
+logger = setup_logger('resource_blocking', 'resource_blocking.log')
+
+# Блокировка лишних запросов страницы (картинки, медиа, шрифты, трекеры)
+BLOCK_RESOURCES = bool(int(os.getenv('BLOCK_RESOURCES', '1')))
+
+# Шаблоны Network.setBlockedURLs: '*' соответствует любой подстроке.
+# Хвостовой '*' нужен, чтобы совпадали адреса с query-параметрами.
+BLOCKED_URL_PATTERNS = (
+    # Изображения (svg не блокируются: на них построены меню)
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.ico*',
+    '*.bmp*', '*.avif*',
+    # Медиа
+    '*.mp4*', '*.webm*', '*.mp3*', '*.ogg*', '*.wav*', '*.m3u8*',
+    # Шрифты
+    '*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*',
+    # Сторонние счётчики и реклама
+    '*google-analytics.com*', '*googletagmanager.com*',
+    '*doubleclick.net*', '*googlesyndication.com*', '*facebook.net*',
+    '*connect.facebook.com*', '*hotjar.com*', '*mc.yandex.ru*',
+    '*hm.baidu.com*', '*cnzz.com*', '*51.la*', '*clarity.ms*',
+)
+
+
+def load_patterns(env_name: str) -> List[str]:
+    """
+    Загружает дополнительные шаблоны из переменной окружения
+    (список через запятую).
+
+    :param env_name: Имя переменной окружения.
+    :return: Список шаблонов.
+    """
+    return [
+        pattern.strip() for pattern in os.getenv(env_name, '').split(',')
+        if pattern.strip()
+    ]
+
+
+def is_allowed(url: str, allowed_urls: Iterable[str]) -> bool:
+    """
+    Проверяет, попадает ли адрес в allow-list.
+
+    :param url: Адрес запроса.
+    :param allowed_urls: Адреса или шаблоны fnmatch разрешённых ресурсов.
+    :return: True, если запрос нельзя блокировать.
+    """
+    return any(url == allowed or fnmatchcase(url, allowed)
+               for allowed in allowed_urls)
+
+
+def build_blocked_urls(
+        allowed_urls: Iterable[str] = ()
+) -> Tuple[List[str], List[str]]:
+    """
+    Собирает блокируемые шаблоны с учётом allow-list.
+
+    Network.setBlockedURLs не поддерживает исключения, поэтому шаблоны,
+    под которые попадает хотя бы один разрешённый адрес, отделяются:
+    их запросы перехватываются через домен Fetch (FetchBlocker), где
+    разрешённые адреса пропускаются, а остальные отклоняются.
+
+    :param allowed_urls: Адреса (или шаблоны) ресурсов, без которых
+        не работает навигация.
+    :return: Шаблоны для Network.setBlockedURLs и шаблоны для
+        перехвата через Fetch.
+    """
+    allowed = list(allowed_urls)
+    patterns = list(BLOCKED_URL_PATTERNS) + load_patterns(
+        'BLOCKED_URL_PATTERNS')
+    blocked, intercepted = [], []
+    for pattern in dict.fromkeys(patterns):
+        if any(fnmatchcase(url, pattern) for url in allowed):
+            intercepted.append(pattern)
+        else:
+            blocked.append(pattern)
+    return blocked, intercepted
+
+
+class FetchBlocker(threading.Thread):
+    """
+    Блокировка запросов с исключениями через домен Fetch.
+
+    Поток открывает собственную CDP-сессию вкладки (события Fetch через
+    execute_cdp_cmd не приходят), включает перехват только для
+    переданных шаблонов и на каждый запрос отвечает continueRequest для
+    разрешённых адресов или failRequest для остальных. Перехват
+    действует, пока открыта сессия: поток завершается вместе с вкладкой
+    или браузером.
+    """
+
+    def __init__(
+            self,
+            driver,
+            patterns: List[str],
+            allowed_urls: List[str]
+    ):
+        """
+        :param driver: WebDriver, вкладку которого нужно перехватывать.
+        :param patterns: Шаблоны перехватываемых запросов.
+        :param allowed_urls: Адреса или шаблоны, которые пропускаются.
+        """
+        super().__init__(name='fetch-blocker', daemon=True)
+        self.address = driver.capabilities[
+            'goog:chromeOptions']['debuggerAddress']
+        self.window_handle = driver.current_window_handle
+        self.patterns = patterns
+        self.allowed_urls = allowed_urls
+        self.ready = threading.Event()
+        self.error: Optional[Exception] = None
+
+    def run(self) -> None:
+        try:
+            trio.run(self.serve)
+        except Exception as e:
+            self.error = e
+            logger.info(f'Перехват запросов через Fetch остановлен: {e}')
+        finally:
+            self.ready.set()
+
+    async def serve(self) -> None:
+        version = get_host_version(self.address)
+        if not version:
+            raise WebDriverException(
+                f'Браузер на {self.address} не отвечает на /json/version')
+        devtools = cdp.import_devtools(
+            version['Browser'].split('/')[1].split('.')[0])
+        async with cdp.open_cdp(version['webSocketDebuggerUrl']) as conn:
+            targets = await conn.execute(devtools.target.get_targets())
+            target_id = next((
+                target.target_id for target in targets
+                if target.target_id.lower() in self.window_handle.lower()
+            ), None)
+            if target_id is None:
+                raise WebDriverException(
+                    f'Вкладка {self.window_handle} не найдена среди целей CDP')
+            async with conn.open_session(target_id) as session:
+                # Без ограничения буфера: пропущенное событие оставило бы
+                # запрос приостановленным навсегда
+                events = session.listen(
+                    devtools.fetch.RequestPaused, buffer_size=math.inf)
+                await session.execute(devtools.fetch.enable(patterns=[
+                    devtools.fetch.RequestPattern(
+                        url_pattern=pattern,
+                        request_stage=devtools.fetch.RequestStage.REQUEST)
+                    for pattern in self.patterns
+                ]))
+                self.ready.set()
+                async for event in events:
+                    if is_allowed(event.request.url, self.allowed_urls):
+                        await session.execute(
+                            devtools.fetch.continue_request(event.request_id))
+                    else:
+                        await session.execute(devtools.fetch.fail_request(
+                            event.request_id,
+                            devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+
+
+def block_resources(
+        driver,
+        allowed_urls: Iterable[str] = (),
+        timeout: float = 10
+) -> Optional[FetchBlocker]:
+    """
+    Включает блокировку лишних запросов в текущей вкладке драйвера.
+    Блокировка действует до закрытия вкладки, в том числе после
+    перезагрузок и переходов.
+
+    :param driver: WebDriver (отдельный Chrome или вкладка общего браузера).
+    :param allowed_urls: Ресурсы, которые нельзя блокировать.
+    :param timeout: Время ожидания включения перехвата Fetch, секунды.
+    :return: Поток перехвата Fetch или None, если он не нужен.
+    """
+    if not BLOCK_RESOURCES:
+        return None
+    allowed = list(allowed_urls) + load_patterns('ALLOWED_URL_PATTERNS')
+    urls, intercepted = build_blocked_urls(allowed)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+        logger.info(f'Блокировка запросов включена: {len(urls)} шаблонов')
+    except WebDriverException as e:
+        # Без блокировки парсер работает, только медленнее
+        logger.error(f'Не удалось включить блокировку запросов: {e}')
+        return None
+    if not intercepted:
+        return None
+    blocker = FetchBlocker(driver, intercepted, allowed)
+    blocker.start()
+    blocker.ready.wait(timeout)
+    if blocker.error is None:
+        logger.info(
+            f'Перехват Fetch включён: {len(intercepted)} шаблонов с исключениями')
+    else:
+        logger.error(
+            f'Не удалось включить перехват Fetch, шаблоны '
+            f'{intercepted} не блокируются: {blocker.error}')
+    return blocker
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Hashable, Optional
+
+
+class RowCache:
+    """
+    Кэш разобранных строк матчей по ключу их содержимого.
+
+    Ключ строится только из данных, влияющих на результат разбора
+    (команды, счёт, коэффициенты), поэтому неизменившиеся строки
+    не разбираются и не переводятся повторно. Игровое время и такт
+    в ключ не входят: для найденной строки их обновляет вызывающий
+    код (GameSnapshot.replace). Записи, не запрошенные за последний
+    такт, удаляются в end_tick.
+    """
+
+    def __init__(self):
+        self.rows: Dict[Hashable, Any] = {}
+        self.seen: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Возвращает сохранённый результат разбора строки.
+
+        :param key: Ключ содержимого строки.
+        :return: Результат или None, если строка изменилась.
+        """
+        value = self.rows.get(key)
+        if value is not None:
+            self.seen[key] = value
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self.seen[key] = value
+
+    def clear(self) -> None:
+        """Сбрасывает кэш (например, после смены перевода названия)."""
+        self.rows = {}
+        self.seen = {}
+
+    def end_tick(self) -> None:
+        """Оставляет в кэше только строки, встреченные за такт."""
+        self.rows = self.seen
+        self.seen = {}
@@ -0,0 +1,111 @@
+from typing import Dict, List, Mapping, Optional
+
+# Символы, удаляемые из названия команды перед поиском перевода
+SANITIZE_TABLE = str.maketrans('', '', ' (),女')
+
+
+def sanitize_name(text: str) -> str:
+    """
+    Очистка названия команды: ключ словаря переводов.
+
+    :param text: Название со страницы.
+    :return: Название без пробелов, скобок, запятых и '女' в нижнем регистре.
+    """
+    return text.translate(SANITIZE_TABLE).strip().lower()
+
+
+class TranslateIndex:
+    """
+    Индекс словаря переводов translate_cash.json.
+
+    Поддерживает оба правила поиска парсеров без обхода всего словаря:
+    - find_within: ключ содержится в названии (akty);
+    - find_containing: название содержится в ключе (fb).
+    Если подходит несколько ключей (в том числе совпадающий с
+    названием), выбирается добавленный раньше всех - как при прежнем
+    обходе словаря по порядку: для названия '北京猛龙' при ключах
+    '北京' и '北京猛龙' (в этом порядке) akty получает перевод '北京'.
+
+    Названия команд короткие, поэтому поиск перебирает подстроки
+    названия (не длиннее самого длинного ключа) по хеш-таблице, а
+    для второго правила заранее построен индекс всех подстрок ключей.
+    Стоимость поиска не зависит от размера словаря, добавление
+    ключа дополняет индекс без перестроения.
+    """
+
+    def __init__(self, entries: Mapping[str, str] = None):
+        """
+        :param entries: Начальный словарь переводов.
+        """
+        self.entries: Dict[str, str] = {}
+        self.keys: List[str] = []
+        # ключ -> порядковый номер добавления
+        self.order: Dict[str, int] = {}
+        # подстрока ключа -> номер первого ключа, который её содержит
+        self.substrings: Dict[str, int] = {}
+        self.max_key_len = 0
+        if entries:
+            self.update(entries)
+
+    def add(self, key: str, value: str) -> None:
+        """
+        Добавляет перевод или заменяет перевод существующего ключа.
+
+        :param key: Очищенное название.
+        :param value: Перевод.
+        """
+        if key not in self.order:
+            index = len(self.keys)
+            self.keys.append(key)
+            self.order[key] = index
+            self.max_key_len = max(self.max_key_len, len(key))
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    # Более ранний ключ с той же подстрокой не заменяется
+                    self.substrings.setdefault(key[start:end], index)
+        self.entries[key] = value
+
+    def update(self, entries: Mapping[str, str]) -> None:
+        """
+        Добавляет переводы, например перечитанные из файла.
+
+        :param entries: Словарь переводов.
+        """
+        for key, value in entries.items():
+            self.add(key, value)
+
+    def find_within(self, name: str) -> Optional[str]:
+        """
+        Перевод ключа, который содержится в названии.
+
+        :param name: Очищенное название.
+        :return: Перевод или None.
+        """
+        best = None
+        for start in range(len(name)):
+            stop = min(len(name), start + self.max_key_len)
+            for end in range(start + 1, stop + 1):
+                index = self.order.get(name[start:end])
+                if index is not None and (best is None or index < best):
+                    best = index
+        if best is None:
+            return None
+        return self.entries[self.keys[best]]
+
+    def find_containing(self, name: str) -> Optional[str]:
+        """
+        Перевод ключа, который содержит название.
+
+        :param name: Очищенное название.
+        :return: Перевод или None.
+        """
+        index = self.substrings.get(name)
+        if index is None:
+            return None
+        return self.entries[self.keys[index]]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
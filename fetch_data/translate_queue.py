@@ -0,0 +1,117 @@
+import os
+import time
+import asyncio
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+# Одновременных запросов к переводчику
+TRANSLATE_CONCURRENCY = int(os.getenv('TRANSLATE_CONCURRENCY', '2'))
+# Попыток перевода одного названия и пауза перед повтором (удваивается)
+TRANSLATE_RETRIES = int(os.getenv('TRANSLATE_RETRIES', '3'))
+TRANSLATE_RETRY_DELAY = float(os.getenv('TRANSLATE_RETRY_DELAY', '2'))
+# Сколько секунд не повторять перевод названия после неудачи
+TRANSLATE_NEGATIVE_TTL = float(os.getenv('TRANSLATE_NEGATIVE_TTL', '600'))
+
+
+class TranslateResult(NamedTuple):
+    """
+    Результат фонового перевода.
+
+    name - очищенное название, translation - перевод (None при
+    неудаче), raw_names - исходные названия, под которыми матчи
+    показывались до перевода, error - последняя ошибка.
+    """
+    name: str
+    translation: Optional[str]
+    raw_names: Set[str]
+    error: Optional[Exception]
+
+
+class TranslateQueue:
+    """
+    Фоновый перевод новых названий команд.
+
+    Промах кэша переводов не останавливает такт: request() ставит
+    название в очередь, а парсер до получения перевода использует
+    исходное название. Переводчик (блокирующий сетевой вызов)
+    выполняется в пуле потоков, одновременно не больше
+    TRANSLATE_CONCURRENCY запросов, с повторами. Название, которое
+    перевести не удалось, TRANSLATE_NEGATIVE_TTL секунд не
+    запрашивается снова. Готовые переводы парсер забирает через
+    drain() в начале обработки такта.
+    """
+
+    def __init__(
+            self,
+            translate: Callable[[str], str],
+            concurrency: int = TRANSLATE_CONCURRENCY,
+            retries: int = TRANSLATE_RETRIES,
+            negative_ttl: float = TRANSLATE_NEGATIVE_TTL
+    ):
+        """
+        :param translate: Блокирующая функция перевода очищенного названия.
+        :param concurrency: Одновременных запросов к переводчику.
+        :param retries: Попыток перевода одного названия.
+        :param negative_ttl: Пауза после неудачного перевода, секунды.
+        """
+        self.translate = translate
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.retries = max(1, retries)
+        self.negative_ttl = negative_ttl
+        # очищенное название -> исходные названия, ждущие перевода
+        self.pending: Dict[str, Set[str]] = {}
+        # очищенное название -> время, до которого перевод не повторяется
+        self.failed: Dict[str, float] = {}
+        self.results: List[TranslateResult] = []
+        self.tasks: Set[asyncio.Task] = set()
+
+    def request(self, name: str, raw_name: str) -> None:
+        """
+        Ставит название в очередь перевода, если его там ещё нет.
+
+        :param name: Очищенное название.
+        :param raw_name: Название со страницы, используемое до перевода.
+        """
+        if name in self.pending:
+            self.pending[name].add(raw_name)
+            return
+        if self.failed.get(name, 0) > time.monotonic():
+            return
+        self.failed.pop(name, None)
+        self.pending[name] = {raw_name}
+        task = asyncio.create_task(self._translate(name))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _translate(self, name: str) -> None:
+        translation = None
+        error = None
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            for attempt in range(self.retries):
+                try:
+                    translation = await loop.run_in_executor(
+                        None, self.translate, name)
+                    break
+                except Exception as e:
+                    error = e
+                    if attempt + 1 < self.retries:
+                        await asyncio.sleep(
+                            TRANSLATE_RETRY_DELAY * 2 ** attempt)
+        if translation is None:
+            self.failed[name] = time.monotonic() + self.negative_ttl
+        self.results.append(TranslateResult(
+            name, translation, self.pending.pop(name, set()), error))
+
+    def drain(self) -> List[TranslateResult]:
+        """
+        Забирает завершённые переводы.
+
+        :return: Результаты в порядке завершения.
+        """
+        results, self.results = self.results, []
+        return results
+
+    def cancel(self) -> None:
+        """Отменяет незавершённые переводы."""
+        for task in list(self.tasks):
+            task.cancel()
@@ -0,0 +1,141 @@
+"""
+Перенос данных игр из прежних ключей Redis в схему key_schema.
+
+Прежние ключи:
+    "<сайт>_all_data, <лига>, <команда 0>, <команда 1>" - история (список);
+    "<сайт>, <лига>, <команда 0>, <команда 1>"          - точки ниже порога;
+    "odds:<хеш сайта, лиги и команд>"                    - история (поток).
+
+Ключи переименовываются (RENAMENX) в odds:hist, odds:alert и
+odds:stream игры; ключ, под которым уже есть данные, не трогается.
+Потоки находятся по названиям из списков той же игры, остальные потоки
+только перечисляются. Перенесённые игры в индексы текущих игр не
+добавляются: идущая игра попадёт в них со следующей точкой парсера.
+Прежние JSON-точки читаются odds_codec.decode_point без изменений.
+
+Примеры:
+    python -m scripts.migrate_keys --dry-run
+    python -m scripts.migrate_keys --redis-url redis://localhost:6379/0
+"""
+import re
+import asyncio
+import argparse
+from typing import List, Optional, Tuple
+from transfer_data.redis_client import RedisClient
+from transfer_data.key_schema import GameKeys, KEY_PREFIX, SITES, short_id
+
+# Суффикс сайта в ключе списка истории
+LEGACY_HISTORY_SUFFIX = '_all_data'
+# Шаблон SCAN прежних ключей: части разделены ", "
+LEGACY_PATTERN = '*, *, *, *'
+LEGACY_STREAM = re.compile(rf'^{KEY_PREFIX}:[0-9a-f]{{16}}$')
+
+
+def parse_legacy_key(key: str) -> Optional[Tuple[str, GameKeys]]:
+    """
+    Разбор прежнего ключа списка.
+
+    :param key: Ключ вида "<сайт>[_all_data], <лига>, <команда 0>, <команда 1>".
+    :return: ('history' или 'alerts', ключи игры) или None, если ключ
+        не разбирается однозначно (например, запятая в названии).
+    """
+    parts = key.split(', ')
+    if len(parts) != 4:
+        return None
+    site, league, opponent_0, opponent_1 = parts
+    kind = 'alerts'
+    if site.endswith(LEGACY_HISTORY_SUFFIX):
+        site = site[:-len(LEGACY_HISTORY_SUFFIX)]
+        kind = 'history'
+    if site not in SITES:
+        return None
+    return kind, GameKeys(site, league, opponent_0, opponent_1)
+
+
+def legacy_stream_key(keys: GameKeys) -> str:
+    """
+    Прежний ключ потока истории игры.
+
+    :param keys: Ключи игры на сайте.
+    :return: Ключ "odds:<хеш сайта, лиги и команд>".
+    """
+    return f'{KEY_PREFIX}:' + short_id(
+        keys.site, keys.league, keys.opponent_0, keys.opponent_1)
+
+
+async def plan_renames(
+        client: RedisClient
+) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
+    """
+    Находит прежние ключи и новые ключи для них.
+
+    :param client: Подключённый RedisClient.
+    :return: Пары (прежний ключ, новый ключ), неразобранные ключи и
+        потоки, для которых не нашлось названий игры.
+    """
+    renames, skipped = [], []
+    streams = set()
+    for key in sorted(await client.scan_keys(LEGACY_PATTERN)):
+        parsed = parse_legacy_key(key)
+        if parsed is None:
+            skipped.append(key)
+            continue
+        kind, keys = parsed
+        renames.append((key, getattr(keys, kind)))
+        stream = legacy_stream_key(keys)
+        if kind == 'history' and stream not in streams:
+            streams.add(stream)
+            if await client.redis.exists(stream):
+                renames.append((stream, keys.stream))
+    orphans = [
+        key for key in sorted(await client.scan_keys(f'{KEY_PREFIX}:*'))
+        if LEGACY_STREAM.match(key) and key not in streams
+    ]
+    return renames, skipped, orphans
+
+
+async def migrate(redis_url: str = None, dry_run: bool = False) -> None:
+    """
+    Переименовывает прежние ключи игр в ключи key_schema.
+
+    :param redis_url: URL Redis, по умолчанию REDIS_URL.
+    :param dry_run: Только показать переименования.
+    """
+    client = RedisClient(redis_url) if redis_url else RedisClient()
+    await client.connect()
+    try:
+        renames, skipped, orphans = await plan_renames(client)
+        moved = exists = 0
+        for old, new in renames:
+            print(f"{old} -> {new}")
+            if dry_run:
+                continue
+            if await client.redis.renamenx(old, new):
+                moved += 1
+            else:
+                exists += 1
+                print(f"  {new} уже есть, {old} не перенесён")
+        for key in skipped:
+            print(f"Не разобран: {key}")
+        for key in orphans:
+            print(f"Поток без названий игры: {key}")
+        print(f"Ключей к переносу: {len(renames)}, перенесено: {moved}, "
+              f"уже занято: {exists}, не разобрано: {len(skipped)}, "
+              f"потоков без названий: {len(orphans)}")
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Перенос данных игр из прежних ключей Redis.')
+    parser.add_argument('--redis-url', default=None,
+                        help='URL Redis, по умолчанию REDIS_URL.')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Только показать переименования.')
+    args = parser.parse_args()
+    asyncio.run(migrate(args.redis_url, args.dry_run))
+
+
+if __name__ == '__main__':
+    main()
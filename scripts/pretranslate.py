@@ -0,0 +1,202 @@
+"""
+Предварительный перевод названий команд.
+
+Собирает названия команд из сохранённых страниц akty/fb и (или) из
+индексов текущих игр в Redis, переводит все названия, которых нет в словаре, и
+добавляет переводы в translate_cash.json до начала игр.
+
+Примеры:
+    python -m scripts.pretranslate --html pages/
+    python -m scripts.pretranslate --redis --output new_translations.json
+"""
+import os
+import re
+import json
+import time
+import asyncio
+import argparse
+from typing import Dict, Iterable, Iterator, Set, Tuple
+from translatepy import Translator
+from fetch_data.html_parser import parse_html, compile_selector
+from fetch_data.translate_index import TranslateIndex, sanitize_name
+from scripts.translate_cash_load import TranslateStore
+
+# Пауза между запросами к переводчику, секунды
+PRETRANSLATE_DELAY = float(os.getenv('PRETRANSLATE_DELAY', '1'))
+PRETRANSLATE_RETRIES = 3
+
+# Разметка страниц, как в FetchAkty.parse_match_card и
+# OddsFetcher.extract_matches_from_soup
+AKTY_MATCH_CLASS = 'c-match-item'
+AKTY_TEAM_CLASSES = ('row-item team-item', 'row-item team-item soon')
+AKTY_TEAM_NAME_CLASS = re.compile('allow-user-select')
+FB_TEAM_NAME_SELECTOR = compile_selector('.match-teams-name .team-name')
+
+# Сайты индексов текущих игр в Redis (key_schema.SITES)
+REDIS_SITES = {'akty.com': 'akty', 'fb.com': 'fb'}
+
+
+def html_team_names(html: str) -> Iterator[Tuple[str, str]]:
+    """
+    Названия команд со страницы akty или fb.
+
+    :param html: HTML страницы.
+    :return: Пары (сайт, название).
+    """
+    soup = parse_html(html)
+    for match in soup.find_all('div', class_=AKTY_MATCH_CLASS):
+        for team_class in AKTY_TEAM_CLASSES:
+            team = match.find('div', class_=team_class)
+            name = team.find('div', class_=AKTY_TEAM_NAME_CLASS) if team else None
+            if name is not None:
+                yield 'akty', name.get_text()
+    for name in soup.select(FB_TEAM_NAME_SELECTOR):
+        yield 'fb', name.text.strip()
+
+
+def directory_team_names(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Названия команд из всех .html файлов каталога (рекурсивно).
+
+    :param path: Каталог со снимками страниц.
+    :return: Пары (сайт, название).
+    """
+    for root, _, files in os.walk(path):
+        for file_name in sorted(files):
+            if not file_name.endswith(('.html', '.htm')):
+                continue
+            with open(os.path.join(root, file_name), 'r',
+                      encoding='utf-8', errors='replace') as file:
+                yield from html_team_names(file.read())
+
+
+async def redis_team_names(redis_url: str = None) -> Set[Tuple[str, str]]:
+    """
+    Названия команд текущих игр из индексов Redis. Переведённые названия
+    хранятся латиницей, поэтому берутся только названия с другими
+    символами (показанные до перевода).
+
+    :param redis_url: URL Redis, по умолчанию REDIS_URL.
+    :return: Пары (сайт, название).
+    """
+    from transfer_data.redis_client import RedisClient
+    client = RedisClient(redis_url) if redis_url else RedisClient()
+    await client.connect()
+    names = set()
+    try:
+        for site_name, site in REDIS_SITES.items():
+            for game in await client.live_games(site_name):
+                for name in (game.get('opponent_0', ''),
+                             game.get('opponent_1', '')):
+                    if name and not name.isascii():
+                        names.add((site, name))
+    finally:
+        await client.close()
+    return names
+
+
+def unknown_names(
+        names: Iterable[Tuple[str, str]],
+        index: TranslateIndex
+) -> Dict[str, str]:
+    """
+    Очищенные названия, для которых парсер не найдёт перевод.
+
+    :param names: Пары (сайт, название).
+    :param index: Индекс текущего словаря.
+    :return: Очищенное название -> первое встреченное исходное.
+    """
+    unknown = {}
+    for site, name in names:
+        sanitized_name = sanitize_name(name)
+        if not sanitized_name or sanitized_name in unknown:
+            continue
+        # Правила поиска те же, что у парсеров сайтов
+        if site == 'akty':
+            cached = index.find_within(sanitized_name)
+        else:
+            cached = index.find_containing(sanitized_name)
+        if cached is None:
+            unknown[sanitized_name] = name
+    return unknown
+
+
+def translate_names(
+        names: Iterable[str],
+        delay: float = PRETRANSLATE_DELAY
+) -> Dict[str, str]:
+    """
+    Переводит названия по одному с паузой между запросами.
+
+    :param names: Очищенные названия.
+    :param delay: Пауза между запросами, секунды.
+    :return: Название -> перевод (без названий, которые не перевелись).
+    """
+    translator = Translator()
+    translations = {}
+    for name in names:
+        for attempt in range(PRETRANSLATE_RETRIES):
+            try:
+                translations[name] = translator.translate(
+                    name, "english").result.lower()
+                print(f"{name} -> {translations[name]}")
+                break
+            except Exception as e:
+                print(f"Ошибка перевода '{name}' "
+                      f"(попытка {attempt + 1}): {e}")
+                time.sleep(delay * 2 ** (attempt + 1))
+        time.sleep(delay)
+    return translations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Перевод неизвестных названий команд заранее.')
+    parser.add_argument('--html', action='append', default=[],
+                        help='Каталог с сохранёнными страницами akty/fb.')
+    parser.add_argument('--redis', action='store_true',
+                        help='Взять названия текущих игр из Redis.')
+    parser.add_argument('--redis-url', default=None,
+                        help='URL Redis, по умолчанию REDIS_URL.')
+    parser.add_argument('--delay', type=float, default=PRETRANSLATE_DELAY,
+                        help='Пауза между запросами к переводчику.')
+    parser.add_argument('--output', default=None,
+                        help='Записать переводы в этот JSON для проверки '
+                             'вместо добавления в translate_cash.json.')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Только показать неизвестные названия.')
+    args = parser.parse_args()
+    if not args.html and not args.redis:
+        parser.error('укажите --html и (или) --redis')
+
+    names = set()
+    for path in args.html:
+        names.update(directory_team_names(path))
+    if args.redis:
+        names.update(asyncio.run(redis_team_names(args.redis_url)))
+
+    store = TranslateStore()
+    index = TranslateIndex(store.load())
+    unknown = unknown_names(sorted(names), index)
+    print(f"Названий команд: {len(names)}, без перевода: {len(unknown)}")
+    if args.dry_run or not unknown:
+        for name in unknown.values():
+            print(name)
+        return
+
+    translations = translate_names(unknown, args.delay)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(translations, file, ensure_ascii=False, indent=4)
+        print(f"Переводы записаны в {args.output}")
+        return
+    for name, translation in translations.items():
+        store.add(name, translation)
+    # Переносим журнал в translate_cash.json, чтобы проверить переводы
+    # в одном файле
+    store.compact()
+    print(f"Добавлено переводов: {len(translations)}")
+
+
+if __name__ == '__main__':
+    main()
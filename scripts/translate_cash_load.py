@@ -1,19 +1,208 @@
 import json
 import os
+import fcntl
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TRANSLATE_CASH_PATH = os.path.join(BASE_DIR, 'translate_cash.json')
+# Журнал новых переводов: по одной JSON-паре [ключ, перевод] в строке
+TRANSLATE_JOURNAL_PATH = os.path.join(BASE_DIR, 'translate_cash.journal')
+TRANSLATE_LOCK_PATH = os.path.join(BASE_DIR, 'translate_cash.lock')
+# После скольких записей журнал переносится в translate_cash.json
+JOURNAL_COMPACT_SIZE = int(os.getenv('TRANSLATE_JOURNAL_COMPACT_SIZE', '100'))
+# inode журнала до первого чтения (настоящий inode не бывает отрицательным)
+_UNREAD = -1
 
-def load_translate_cash() -> dict:
 
-    if os.path.exists(TRANSLATE_CASH_PATH):
-        with open(TRANSLATE_CASH_PATH, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    return {}
+class TranslateStore:
+    """
+    Словарь переводов, общий для процессов парсеров.
 
+    Основа - translate_cash.json, новые переводы дописываются в
+    журнал одной строкой (O(1) вместо перезаписи всего файла).
+    Запись и чтение выполняются под файловой блокировкой, поэтому
+    параллельные процессы не портят файлы. refresh() дочитывает
+    из журнала переводы, добавленные другими процессами.
 
-def save_translate_cash(translate_cash) -> None:
-    with open(TRANSLATE_CASH_PATH, 'w', encoding='utf-8') as file:
-        json.dump(translate_cash, file, ensure_ascii=False, indent=4)
+    Когда журнал вырастает до JOURNAL_COMPACT_SIZE записей, он
+    переносится в translate_cash.json: новый файл пишется во
+    временный и атомарно заменяет старый, журнал заменяется пустым.
+    """
+
+    def __init__(
+            self,
+            path: str = TRANSLATE_CASH_PATH,
+            journal_path: str = TRANSLATE_JOURNAL_PATH,
+            lock_path: str = TRANSLATE_LOCK_PATH,
+            compact_size: int = JOURNAL_COMPACT_SIZE
+    ):
+        """
+        :param path: Путь к translate_cash.json.
+        :param journal_path: Путь к журналу.
+        :param lock_path: Путь к файлу блокировки.
+        :param compact_size: Размер журнала, после которого он сжимается.
+        """
+        self.path = path
+        self.journal_path = journal_path
+        self.lock_path = lock_path
+        self.compact_size = compact_size
+        self.entries: Dict[str, str] = {}
+        # Прочитанная часть журнала: inode файла и смещение
+        self.journal_inode = _UNREAD
+        self.journal_offset = 0
+        self.journal_size = 0
+        # Прочитанная версия translate_cash.json (см. _base_stamp)
+        self.base_stamp: Optional[Tuple[int, int, int]] = None
+
+    @contextmanager
+    def _lock(self, exclusive: bool) -> Iterator[None]:
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file,
+                        fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_base(self) -> Dict[str, str]:
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        return {}
+
+    def _base_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Версия translate_cash.json: (inode, mtime в нс, размер)."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _read_journal(self) -> Dict[str, str]:
+        """
+        Дочитывает журнал с прошлого смещения. Если журнал был заменён
+        при сжатии, словарь перечитывается целиком. Замена видна по
+        другому inode журнала, по журналу короче прочитанного или по
+        новой версии translate_cash.json (inode журнала после сжатия
+        может совпасть с прежним).
+
+        :return: Новые переводы.
+        """
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            stat = None
+        inode = stat.st_ino if stat else None
+        size = stat.st_size if stat else 0
+        base_stamp = self._base_stamp()
+        if (inode != self.journal_inode or base_stamp != self.base_stamp
+                or size < self.journal_offset):
+            self.journal_inode = inode
+            self.base_stamp = base_stamp
+            self.journal_offset = 0
+            self.journal_size = 0
+            base = self._read_base()
+            new_entries = {key: value for key, value in base.items()
+                           if self.entries.get(key) != value}
+            self.entries.update(base)
+        else:
+            new_entries = {}
+        if size <= self.journal_offset:
+            return new_entries
+
+        with open(self.journal_path, 'rb') as journal:
+            journal.seek(self.journal_offset)
+            data = journal.read()
+        # Незавершённая последняя строка дочитывается в следующий раз
+        complete = data[:data.rfind(b'\n') + 1]
+        self.journal_offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                key, value = json.loads(line)
+            except (ValueError, TypeError):
+                continue
+            self.journal_size += 1
+            if self.entries.get(key) != value:
+                self.entries[key] = value
+                new_entries[key] = value
+        return new_entries
+
+    def load(self) -> Dict[str, str]:
+        """
+        Читает словарь целиком: translate_cash.json и журнал.
+
+        :return: Копия словаря переводов.
+        """
+        self.entries = {}
+        self.journal_inode = _UNREAD
+        with self._lock(exclusive=False):
+            self._read_journal()
+        return dict(self.entries)
+
+    def refresh(self) -> Dict[str, str]:
+        """
+        Переводы, добавленные другими процессами с прошлого чтения.
+
+        :return: Новые или изменённые переводы.
+        """
+        with self._lock(exclusive=False):
+            return self._read_journal()
 
+    def add(self, key: str, value: str) -> None:
+        """
+        Дописывает перевод в журнал.
+
+        :param key: Очищенное название.
+        :param value: Перевод.
+        """
+        line = json.dumps([key, value], ensure_ascii=False) + '\n'
+        with self._lock(exclusive=True):
+            self._read_journal()
+            with open(self.journal_path, 'ab') as journal:
+                journal.write(line.encode('utf-8'))
+                journal.flush()
+                os.fsync(journal.fileno())
+            self._read_journal()
+            if self.journal_size >= self.compact_size:
+                self._compact()
+
+    def _compact(self) -> None:
+        self._write_base(self.entries)
+        temp_path = f'{self.journal_path}.tmp'
+        open(temp_path, 'wb').close()
+        os.replace(temp_path, self.journal_path)
+        self._read_journal()
+
+    def _write_base(self, entries: Dict[str, str]) -> None:
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(entries, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def compact(self) -> None:
+        """Переносит журнал в translate_cash.json."""
+        with self._lock(exclusive=True):
+            self._read_journal()
+            self._compact()
+
+    def replace(self, entries: Dict[str, str]) -> None:
+        """
+        Заменяет словарь целиком (ручная правка, массовый импорт).
+
+        :param entries: Новый словарь переводов.
+        """
+        with self._lock(exclusive=True):
+            self.entries = dict(entries)
+            self._compact()
+
+
+def load_translate_cash() -> dict:
+    return TranslateStore().load()
+
+
+def save_translate_cash(translate_cash) -> None:
+    TranslateStore().replace(translate_cash)
@@ -0,0 +1,58 @@
+"""Протокол дельт: кодировщик парсера и состояние сервера."""
+from transfer_data.delta_protocol import DeltaEncoder, DeltaState
+from transfer_data.key_schema import GameKeys
+
+
+def game(total_bet_0: str) -> dict:
+    return {
+        'opponent_0': 'Kazan',
+        'opponent_1': 'Sochi',
+        'score_game': '48:51',
+        'time_game': 'II 05:32',
+        'rate': {'total_bet_0': total_bet_0},
+    }
+
+
+def test_state_follows_encoder():
+    encoder = DeltaEncoder('akty.com')
+    state = DeltaState('akty.com')
+    assert state.apply(encoder.snapshot({'IPBL': [game('1.85')]}))
+    assert state.apply(encoder.encode({'akty.com': {'IPBL': [game('1.90')]}}))
+    assert state.synced
+    [entry] = state.snapshot()['games']
+    assert entry['rate'] == {'total_bet_0': '1.90'}
+
+
+def test_game_id_matches_redis_keys():
+    encoder = DeltaEncoder('fb.com')
+    [entry] = encoder.snapshot({'IPBL': [game('1.85')]})['games']
+    assert entry['id'] == GameKeys('akty.com', 'IPBL', 'Kazan', 'Sochi').id
+
+
+def test_restarted_server_requests_snapshot():
+    encoder = DeltaEncoder('akty.com')
+    encoder.snapshot({'IPBL': [game('1.85')]})
+    encoder.encode({'akty.com': {'IPBL': [game('1.90')]}})
+
+    # Сервер перезапущен: состояние пустое, дельты не восполняют его
+    state = DeltaState('akty.com')
+    assert not state.apply(
+        encoder.encode({'akty.com': {'IPBL': [game('1.95')]}}))
+    assert not state.apply(
+        encoder.encode({'akty.com': {'IPBL': [game('2.00')]}}))
+    assert not state.synced
+
+    # Снапшот по событию 'resync' восстанавливает состояние
+    assert state.apply(encoder.snapshot({'IPBL': [game('2.00')]}))
+    assert state.apply(encoder.encode({'akty.com': {'IPBL': [game('2.05')]}}))
+
+
+def test_seq_gap_marks_state_unsynced():
+    encoder = DeltaEncoder('fb.com')
+    state = DeltaState('fb.com')
+    state.apply(encoder.snapshot({'IPBL': [game('1.85')]}))
+    encoder.encode({'fb.com': {'IPBL': [game('1.90')]}})  # потеряно
+    assert not state.apply(
+        encoder.encode({'fb.com': {'IPBL': [game('1.95')]}}))
+    assert not state.apply(
+        encoder.encode({'fb.com': {'IPBL': [game('2.00')]}}))
@@ -0,0 +1,44 @@
+"""Записи матчей GameSnapshot."""
+import pytest
+from fetch_data.game_snapshot import GameSnapshot, Tick
+
+
+def make_game(tick: Tick) -> GameSnapshot:
+    return GameSnapshot(
+        league='IPBL Pro Division',
+        opponent_0='Kazan',
+        opponent_1='Sochi',
+        score_game='48:51',
+        time_game='II 05:32',
+        rate={'total_point': '165.5', 'total_bet_0': '1.85'},
+        tick=tick,
+    )
+
+
+def test_replace_keeps_rate_and_updates_clock():
+    game = make_game(Tick(1_700_000_000_000))
+    tick = Tick(1_700_000_001_000)
+    fresh = game.replace(time_game='II 05:31', tick=tick)
+    assert fresh.time_game == 'II 05:31'
+    assert fresh.server_time == tick.server_time
+    assert fresh.rate is game.rate
+    assert fresh.number('total_bet_0') == 1.85
+    assert game.time_game == 'II 05:32'
+
+
+def test_replace_rejects_rate():
+    game = make_game(Tick(1_700_000_000_000))
+    with pytest.raises(TypeError):
+        game.replace(rate={})
+
+
+def test_end_flag_only_when_set():
+    game = make_game(Tick(1_700_000_000_000))
+    # Без is_end_game (akty) ключа нет ни в словаре, ни в Mapping
+    assert 'is_end_game' not in game.to_dict()
+    assert 'is_end_game' not in game and len(game) == 6
+    assert game.get('is_end_game') is None
+    ended = game.replace(is_end_game=True)
+    assert ended.to_dict()['is_end_game'] is True
+    assert ended['is_end_game'] is True and len(ended) == 7
+    assert game.replace(is_end_game=False).to_dict()['is_end_game'] is False
@@ -0,0 +1,93 @@
+"""
+Совпадение результатов бэкендов разбора HTML (html.parser, lxml,
+selectolax) на сохранённых страницах akty и fb.
+"""
+import os
+import re
+import pytest
+from fetch_data.html_parser import HTML_PARSERS, parse_html, compile_selector
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+BACKEND_MODULES = {'html.parser': None, 'lxml': 'lxml', 'selectolax': 'selectolax'}
+
+CARD_CLASS = re.compile('list-card-wrap v-scroll-item relative-position')
+TEAM_NAME_CLASS = re.compile('allow-user-select')
+FB_VALUE_SELECTOR = '.team-odds-list .value.font-din'
+
+
+def load(name: str, backend: str):
+    """
+    Разбирает сохранённую страницу выбранным бэкендом.
+
+    :param name: Имя файла в tests/fixtures.
+    :param backend: Имя бэкенда из HTML_PARSERS.
+    :return: Корень разобранного документа.
+    """
+    if BACKEND_MODULES[backend]:
+        pytest.importorskip(BACKEND_MODULES[backend])
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as file:
+        return parse_html(file.read(), backend)
+
+
+def akty_summary(backend: str) -> list:
+    """Всё, что FetchAkty читает из страницы, в виде списка значений."""
+    soup = load('akty_page.html', backend)
+    scroll_content = soup.find('div', class_='v-scroll-content relative-position')
+    summary = []
+    for card in scroll_content.find_all('div', class_=CARD_CLASS,
+                                        recursive=False):
+        league = card.find('span', class_='ellipsis allow-user-select')
+        summary.append((
+            league.get_text() if league else None,
+            card.get('style'),
+            card.get_text('\x1f'),
+            [timer.get_text()
+             for timer in card.find_all('span', class_='timer-layout2')],
+        ))
+        for match in card.find_all('div', class_='c-match-item'):
+            for team_class in ('row-item team-item', 'row-item team-item soon'):
+                team = match.find('div', class_=team_class)
+                score = team.find('div', class_='score')
+                summary.append((
+                    team.find('div', class_=TEAM_NAME_CLASS).get_text(),
+                    score.find('span').get_text() if score else None,
+                ))
+            for column in card.find_all('div', class_='handicap-col'):
+                summary.append((
+                    [span.get_text() for span in
+                     column.find_all('span', class_='highlight-odds')],
+                    [div.get_text().strip() for div in
+                     column.find_all('div', class_='handicap-value-text')],
+                ))
+    return summary
+
+
+def fb_summary(backend: str, selector) -> list:
+    """Значения коэффициентов fb по строковому или скомпилированному селектору."""
+    soup = load('fb_page.html', backend)
+    return [
+        (box.get('class', ''), [value.text for value in box.select(selector)])
+        for box in soup.select('.home-match-odds-box')
+    ]
+
+
+@pytest.mark.parametrize('backend', HTML_PARSERS)
+def test_akty_backends_match(backend):
+    assert akty_summary(backend) == akty_summary('html.parser')
+
+
+@pytest.mark.parametrize('backend', HTML_PARSERS)
+def test_fb_backends_match(backend):
+    assert fb_summary(backend, FB_VALUE_SELECTOR) == fb_summary(
+        'html.parser', FB_VALUE_SELECTOR)
+
+
+@pytest.mark.parametrize('backend', HTML_PARSERS)
+def test_compiled_selector_matches_text(backend):
+    assert fb_summary(backend, compile_selector(FB_VALUE_SELECTOR)) == \
+        fb_summary(backend, FB_VALUE_SELECTOR)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        parse_html('<div></div>', 'html5lib')
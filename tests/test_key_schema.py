@@ -0,0 +1,32 @@
+"""Ключи Redis и id игр key_schema."""
+import hashlib
+from transfer_data.key_schema import GameKeys, game_id, league_index, site_index
+
+KEYS = GameKeys('akty.com', 'IPBL Pro Division', 'Kazan', 'Sochi')
+
+
+def test_game_id_is_stable():
+    # id хранится в Redis и приходит подписчикам: меняться не должен
+    raw = 'ipbl pro division\x1fkazan\x1fsochi'.encode('utf-8')
+    assert KEYS.id == hashlib.blake2b(raw, digest_size=8).hexdigest()
+    assert KEYS.id == 'b3ea1599c2ad6161'
+    assert KEYS.history == 'odds:hist:akty.com:b3ea1599c2ad6161'
+    assert KEYS.alerts == 'odds:alert:akty.com:b3ea1599c2ad6161'
+    assert KEYS.stream == 'odds:stream:akty.com:b3ea1599c2ad6161'
+    assert KEYS.meta == 'odds:game:b3ea1599c2ad6161'
+    assert KEYS.site_index == site_index('akty.com') == 'odds:live:akty.com'
+    assert KEYS.league_index == 'odds:live:akty.com:12a9e769a748bb5c'
+
+
+def test_game_id_folds_case_and_ignores_site():
+    assert game_id('ipbl pro division', 'KAZAN', 'sochi') == KEYS.id
+    assert KEYS.on('fb.com').id == KEYS.id
+    assert KEYS.on('fb.com').history == 'odds:hist:fb.com:b3ea1599c2ad6161'
+    assert league_index('akty.com', 'ipbl pro division') == KEYS.league_index
+
+
+def test_game_id_separates_fields():
+    # Разделитель не даёт склеить разные названия в один id
+    assert game_id('L', 'ab', 'c') != game_id('L', 'a', 'bc')
+    assert GameKeys('akty.com', 'L', 'a', 'b').id != \
+        GameKeys('akty.com', 'L', 'b', 'a').id
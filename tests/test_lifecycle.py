@@ -0,0 +1,42 @@
+"""Перенос игр GameLifecycle под перевод названия команды."""
+from fetch_data.game_snapshot import GameSnapshot, Tick
+from fetch_data.lifecycle import GameLifecycle
+
+LEAGUE = 'IPBL Pro Division'
+
+
+def make_game(opponent_0: str, opponent_1: str) -> GameSnapshot:
+    return GameSnapshot(
+        league=LEAGUE,
+        opponent_0=opponent_0,
+        opponent_1=opponent_1,
+        score_game='48:51',
+        time_game='II 05:32',
+        rate={'total_point': '165.5'},
+        tick=Tick(1_700_000_000_000),
+    )
+
+
+def test_rename_keeps_game_alive():
+    lifecycle = GameLifecycle(ttl=10)
+    lifecycle.seen(LEAGUE, make_game('北京', 'Sochi'), now=0)
+    events = lifecycle.rename_team('北京', 'beijing')
+    assert [(event.kind, event.game.opponent_0, event.renamed_to.opponent_0)
+            for event in events] == [('renamed', '北京', 'beijing')]
+    assert events[0].renamed_to.rate is events[0].game.rate
+    # Под переводом игра видна с прежним сроком жизни, без 'started'
+    assert lifecycle.seen(LEAGUE, make_game('beijing', 'Sochi'), now=5) is None
+    assert lifecycle.expire(now=12) == []
+    ended = lifecycle.expire(now=15)
+    assert [(event.kind, event.game.opponent_0) for event in ended] == [
+        ('ended', 'beijing')]
+
+
+def test_rename_onto_tracked_game_ends_old_one():
+    lifecycle = GameLifecycle(ttl=10)
+    lifecycle.seen(LEAGUE, make_game('北京', 'Sochi'), now=0)
+    lifecycle.seen(LEAGUE, make_game('beijing', 'Sochi'), now=0)
+    events = lifecycle.rename_team('北京', 'beijing')
+    assert [(event.kind, event.game.opponent_0) for event in events] == [
+        ('ended', '北京')]
+    assert len(lifecycle) == 1
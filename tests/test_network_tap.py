@@ -0,0 +1,103 @@
+"""
+Декодер сетевого фида FeedDecoder на сохранённых кадрах: пути с
+фильтрами, частичные обновления и удаление пропавших матчей.
+"""
+import os
+import json
+import pytest
+from fetch_data.network_tap import FeedDecoder, get_by_path
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+# id матча - в первом сегменте с фильтром
+FIELDS = {
+    'id': 'ids[type=match].value',
+    'league': 'lg.na',
+    'opponent_0': 'ts.0.na',
+    'opponent_1': 'ts.1.na',
+    'score_0': 'nsg[tyg=5].sc.0',
+    'score_1': 'nsg[tyg=5].sc.1',
+    'period': 'mc.pe',
+    'clock': 'mc.cd',
+    'handicap_bet_0': 'mg[mty=1005].op.0.od',
+    'handicap_bet_1': 'mg[mty=1005].op.1.od',
+    'handicap_point_0': 'mg[mty=1005].op.0.li',
+    'handicap_point_1': 'mg[mty=1005].op.1.li',
+    'total_point': 'mg[mty=1006].op.0.li',
+    'total_bet_0': 'mg[mty=1006].op.0.od',
+    'total_bet_1': 'mg[mty=1006].op.1.od',
+}
+
+
+@pytest.fixture
+def frames() -> dict:
+    with open(os.path.join(FIXTURES, 'feed_frames.json'),
+              encoding='utf-8') as file:
+        return json.load(file)
+
+
+def test_get_by_path_filters(frames):
+    record = frames['snapshot']['data']['records'][0]
+    assert get_by_path(record, 'ids[type=match].value') == 1001
+    assert get_by_path(record, 'mg[mty=1006].op.1.od') == 1.95
+    assert get_by_path(record, 'mg[mty=9999].op.0.od') is None
+    assert get_by_path(record, 'lg[mty=1].na') is None
+    assert get_by_path(record, 'ts.5.na') is None
+    assert get_by_path(record['mg'], '[mty=1005].op.0.li') == '-3.5'
+
+
+def test_snapshot_frame(frames):
+    decoder = FeedDecoder(FIELDS)
+    records = decoder.feed([frames['snapshot']], now=0)
+    by_id = {record['opponent_0']: record for record in records}
+    assert set(decoder.matches) == {'1001', '1002'}
+    assert by_id['北京 猛龙'] == {
+        'league': 'IPBL Pro Division',
+        'opponent_0': '北京 猛龙',
+        'opponent_1': '上海 飞鹰',
+        'score_0': '48',
+        'score_1': '51',
+        'period': '第二节',
+        'clock': '05:32',
+        'rate': {
+            'handicap_bet_0': '1.91',
+            'handicap_bet_1': '1.89',
+            'handicap_point_0': '-3.5',
+            'handicap_point_1': '+3.5',
+            'total_point': '165.5',
+            'total_bet_0': '1.85',
+            'total_bet_1': '1.95',
+        },
+    }
+    assert 'handicap_bet_0' not in by_id['火箭 A队']['rate']
+
+
+def test_partial_update_merges_into_state(frames):
+    decoder = FeedDecoder(FIELDS)
+    decoder.feed([frames['snapshot']], now=0)
+    [record] = decoder.feed([frames['update']], now=5)
+    assert record['opponent_0'] == '北京 猛龙'
+    assert (record['score_0'], record['clock'], record['period']) == (
+        '50', '05:01', '第二节')
+    assert record['rate']['total_point'] == '166.5'
+    assert record['rate']['total_bet_0'] == '1.8'
+    # Поле, которого нет в обновлении, остаётся прежним
+    assert record['rate']['total_bet_1'] == '1.95'
+    assert record['rate']['handicap_bet_0'] == '1.91'
+
+
+def test_match_without_names_is_kept_but_not_returned(frames):
+    decoder = FeedDecoder(FIELDS)
+    assert decoder.feed([frames['unknown_only']], now=0) == []
+    assert decoder.matches['1003']['clock'] == '01:00'
+
+
+def test_expire_forgets_silent_matches(frames):
+    decoder = FeedDecoder(FIELDS)
+    decoder.feed([frames['snapshot']], now=0)
+    decoder.feed([frames['update']], now=50)
+    assert decoder.expire(60, now=70) == ['1002']
+    assert set(decoder.matches) == set(decoder.last_seen) == {'1001'}
+    assert decoder.clocks({'IPBL Pro Division'}) == {
+        '1001': ('第二节', '05:01')}
+    assert decoder.expire(60, now=110) == ['1001']
+    assert decoder.matches == {}
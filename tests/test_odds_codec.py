@@ -0,0 +1,55 @@
+"""Компактная запись точек истории odds_codec."""
+import json
+from transfer_data.odds_codec import POINT_STRUCT, decode_point, encode_point
+
+EPOCH_MS = 1_700_000_000_000
+SERVER_TIME = '01:13:20'
+
+
+def point(total_point: str, handicap_point_0: str = '-3.5') -> dict:
+    """Поля rate, как их передают парсеры: линии строками, коэффициенты числами."""
+    return {
+        'total_point': total_point,
+        'total_bet_0': 1.85,
+        'total_bet_1': 1.95,
+        'handicap_point_0': handicap_point_0,
+        'handicap_bet_0': 1.91,
+        'handicap_point_1': '+3.5',
+        'handicap_bet_1': 1.89,
+    }
+
+
+def roundtrip(rate: dict, time_game: str = 'II 05:32') -> dict:
+    data = encode_point(rate, time_game, EPOCH_MS, SERVER_TIME)
+    assert isinstance(data, bytes) and len(data) == POINT_STRUCT.size
+    decoded = decode_point(data)
+    assert decoded['time_game'] == time_game
+    assert decoded['server_time'] == SERVER_TIME
+    assert decoded['epoch_ms'] == EPOCH_MS
+    return {field: decoded[field] for field in rate}
+
+
+def test_akty_point_keeps_total_side():
+    for total_point in ('大 165.5', '小 140', '大 -'):
+        rate = point(total_point)
+        assert roundtrip(rate) == rate
+
+
+def test_fb_point():
+    rate = point('165.5', handicap_point_0='')
+    assert roundtrip(rate, 'IV') == rate
+
+
+def test_legacy_json_point():
+    legacy = {**point('大 165.5'), 'server_time': SERVER_TIME,
+              'time_game': 'II 05:32'}
+    assert decode_point(json.dumps(legacy, ensure_ascii=False)) == legacy
+    assert decode_point(
+        json.dumps(legacy, ensure_ascii=False).encode('utf-8')) == legacy
+
+
+def test_unknown_line_falls_back_to_json():
+    rate = point('over 165.5')
+    data = encode_point(rate, 'II 05:32', EPOCH_MS, SERVER_TIME)
+    assert isinstance(data, str)
+    assert decode_point(data)['total_point'] == 'over 165.5'
@@ -0,0 +1,157 @@
+"""
+Одинаковые game_info akty и fb при разборе сохранённых страниц
+любым бэкендом из HTML_PARSERS.
+"""
+import os
+import asyncio
+import pytest
+from fetch_data.html_parser import HTML_PARSERS, parse_html
+from fetch_data.game_snapshot import Tick
+
+for module in ('socketio', 'translatepy', 'dotenv', 'aioredis', 'telegram',
+               'lxml', 'selectolax', 'undetected_chromedriver'):
+    pytest.importorskip(module)
+# Бот Telegram создаётся при импорте парсеров, запросов он не отправляет
+os.environ.setdefault('TELEGRAM_BOT_TOKEN', '123456:parity-tests')
+
+from fetch_data.akty import FetchAkty, LEAGUES, CARD_CLASS  # noqa: E402
+from fetch_data.fb import OddsFetcher  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+TICK = Tick(1_700_000_000_000)
+TIME_GAME_TRANSLATE = {
+    '第一节': 'I',
+    '第二节': 'II',
+    '第三节': 'III',
+    '第四节': 'IV'
+}
+
+
+async def keep_name(text: str) -> str:
+    """Перевод без обращения к словарю: название остаётся как есть."""
+    return text
+
+
+class ParseOnlyAkty(FetchAkty):
+    """FetchAkty без браузера и подключений: только разбор карточек."""
+
+    def __init__(self):
+        self.time_game_translate = TIME_GAME_TRANSLATE
+        self.translate_and_cache = keep_name
+
+    def __del__(self):
+        pass
+
+
+class ParseOnlyFb(OddsFetcher):
+    """OddsFetcher без браузера и подключений: только разбор матчей."""
+
+    def __init__(self):
+        self.time_game_translate = TIME_GAME_TRANSLATE
+        self.get_translate = keep_name
+
+    def __del__(self):
+        pass
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as file:
+        return file.read()
+
+
+def akty_games(backend: str) -> list:
+    """game_info всех матчей целевых лиг страницы akty."""
+    fetcher = ParseOnlyAkty()
+    soup = parse_html(read_fixture('akty_page.html'), backend)
+    scroll_content = soup.find('div', class_='v-scroll-content relative-position')
+    games = []
+    league_name = None
+    for card in scroll_content.find_all('div', class_=CARD_CLASS,
+                                        recursive=False):
+        div_name_liga = card.find('span', class_='ellipsis allow-user-select')
+        if div_name_liga:
+            league_name = div_name_liga.get_text()
+        elif league_name in LEAGUES:
+            games.extend(asyncio.run(fetcher.parse_match_card(
+                card, LEAGUES[league_name], TICK)))
+    return [(game.league, game.to_dict()) for game in games]
+
+
+def fb_games(backend: str) -> list:
+    """game_info всех матчей целевых лиг страницы fb."""
+    fetcher = ParseOnlyFb()
+    soup = parse_html(read_fixture('fb_page.html'), backend)
+    games = []
+    for record in OddsFetcher.parse_match_records(soup, LEAGUES):
+        record['period'] = fetcher.time_game_translate.get(
+            record['period'], '')
+        game_info = asyncio.run(fetcher.build_game_info(
+            record, LEAGUES[record['league']], TICK))
+        games.append((game_info.league, game_info.to_dict()))
+    return games
+
+
+def test_akty_fixture_games():
+    games = akty_games('html.parser')
+    assert [game['time_game'] for _, game in games] == [
+        'II 05:32', 'IV 00:48', 'I ']
+    assert games[0] == ('IPBL Pro Division', {
+        'opponent_0': '北京 猛龙',
+        'opponent_1': '上海\xa0飞鹰',
+        'score_game': '48:51',
+        'time_game': 'II 05:32',
+        'rate': {
+            'total_point': '大 165.5',
+            'total_bet_0': '1.85',
+            'total_bet_1': '1.95',
+            'handicap_point_0': '-3.5',
+            'handicap_bet_0': '1.91',
+            'handicap_point_1': '+3.5',
+            'handicap_bet_1': '1.89',
+        },
+        'server_time': TICK.server_time,
+    })
+
+
+def test_fb_fixture_games():
+    games = fb_games('html.parser')
+    assert [(league, game['opponent_0']) for league, game in games] == [
+        ('IPBL Pro Division', '北京 猛龙'),
+        ('IPBL Pro Division', '广州 & 深圳联队'),
+        ('Rocket Basketball League', '火箭 A队'),
+    ]
+    assert games[0][1]['rate']['total_point'] == '165.5'
+    assert games[1][1]['time_game'] == 'IV'
+    # game_info fb, в отличие от akty, всегда несёт признак завершения
+    assert list(games[0][1]) == [
+        'opponent_0', 'opponent_1', 'score_game', 'time_game', 'rate',
+        'server_time', 'is_end_game']
+    assert games[0][1]['is_end_game'] is False
+
+
+@pytest.mark.parametrize('backend', HTML_PARSERS)
+def test_akty_backends_match(backend):
+    assert akty_games(backend) == akty_games('html.parser')
+
+
+@pytest.mark.parametrize('backend', HTML_PARSERS)
+def test_fb_backends_match(backend):
+    assert fb_games(backend) == fb_games('html.parser')
+
+
+def test_akty_cached_card_gets_current_clock():
+    fetcher = ParseOnlyAkty()
+    html = read_fixture('akty_page.html')
+    later = html.replace('>05:32<', '>05:31<')
+    cards = [
+        parse_html(page, 'html.parser').find_all('div', class_=CARD_CLASS)[1]
+        for page in (html, later)
+    ]
+    assert fetcher.card_row_key(cards[0]) == fetcher.card_row_key(cards[1])
+    games = asyncio.run(fetcher.parse_match_card(
+        cards[0], 'IPBL Pro Division', TICK))
+    tick = Tick(TICK.epoch_ms + 1000)
+    fresh = fetcher.refresh_card_games(cards[1], games, tick)
+    assert [game.time_game for game in fresh] == ['II 05:31']
+    assert fresh[0].tick is tick
+    assert fresh[0].rate == games[0].rate
@@ -0,0 +1,30 @@
+"""Интервал опроса PollScheduler по игровому времени такта."""
+from fetch_data import poll_scheduler
+from fetch_data.poll_scheduler import PollScheduler, LIVE_HOLD
+
+
+def test_running_clock_keeps_live_interval(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(poll_scheduler.time, 'monotonic', lambda: now[0])
+    scheduler = PollScheduler(live_interval=1, pause_interval=5,
+                              idle_interval=30, min_interval=0.5)
+    scheduler.observe({'game': 'II 05:32'}, False)
+    now[0] += 1
+    scheduler.observe({'game': 'II 05:31'}, False)
+    assert scheduler.state == 'live'
+    assert scheduler.interval == 1
+
+    # Время стоит (тайм-аут): после LIVE_HOLD опрос реже
+    now[0] += LIVE_HOLD
+    scheduler.observe({'game': 'II 05:31'}, False)
+    assert scheduler.state == 'pause'
+    assert scheduler.interval == 5
+
+
+def test_no_games_is_idle():
+    scheduler = PollScheduler(idle_interval=30)
+    assert scheduler.observe({}, False) == 30
+    assert scheduler.state == 'idle'
+    # Матч без игрового времени (ещё не начался) - пауза, а не простой
+    scheduler.observe({'game': 'I '}, False)
+    assert scheduler.state == 'pause'
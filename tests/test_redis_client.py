@@ -0,0 +1,274 @@
+"""
+Операции RedisClient и RedisBatch на fakeredis (со скриптами Lua).
+"""
+import time
+import asyncio
+import pytest
+
+for module in ('aioredis', 'dotenv'):
+    pytest.importorskip(module)
+fakeredis = pytest.importorskip('fakeredis')
+pytest.importorskip('lupa')
+
+from transfer_data import redis_client as redis_module  # noqa: E402
+from transfer_data.redis_client import RedisClient  # noqa: E402
+from transfer_data.key_schema import GameKeys, short_id  # noqa: E402
+from scripts import migrate_keys  # noqa: E402
+
+LEAGUE = 'IPBL Pro Division'
+OLD = GameKeys('akty.com', LEAGUE, '北京', 'sochi')
+NEW = GameKeys('akty.com', LEAGUE, 'beijing', 'sochi')
+# Время точек: индексы текущих игр не хранят точки старше LIVE_GAME_TTL
+NOW_MS = int(time.time() * 1000)
+
+
+def run(scenario):
+    """Запускает сценарий с клиентом поверх пустого fakeredis."""
+    async def main():
+        client = RedisClient('redis://fake')
+        client.redis = fakeredis.FakeAsyncRedis()
+        try:
+            return await scenario(client)
+        finally:
+            await client.redis.aclose()
+    return asyncio.run(main())
+
+
+async def add_points(client: RedisClient, keys: GameKeys, epoch_ms: int):
+    batch = client.batch()
+    batch.add_history(keys, b'point-1', epoch_ms)
+    batch.add_history(keys, b'point-2', epoch_ms + 1000)
+    batch.add_alert(keys, b'point-2')
+    await batch.execute()
+
+
+def test_rename_moves_keys_and_index_entries(monkeypatch):
+    monkeypatch.setattr(redis_module, 'HISTORY_BACKEND', 'list')
+
+    async def scenario(client):
+        await add_points(client, OLD, NOW_MS)
+        await client.rename_game(OLD, NEW)
+        redis = client.redis
+        return {
+            'old': [await redis.exists(key) for key in
+                    (OLD.history, OLD.alerts, OLD.meta)],
+            'history': await redis.lrange(NEW.history, 0, -1),
+            'alerts': await redis.lrange(NEW.alerts, 0, -1),
+            'site': await redis.zrange(NEW.site_index, 0, -1, withscores=True),
+            'league': await redis.zrange(
+                NEW.league_index, 0, -1, withscores=True),
+            'meta': await redis.hgetall(NEW.meta),
+            'ttl': await redis.ttl(NEW.meta),
+        }
+
+    state = run(scenario)
+    assert state['old'] == [0, 0, 0]
+    assert state['history'] == [b'point-2', b'point-1']
+    assert state['alerts'] == [b'point-2']
+    new_id = NEW.id.encode()
+    assert state['site'] == [(new_id, NOW_MS + 1000)]
+    assert state['league'] == [(new_id, NOW_MS + 1000)]
+    assert state['meta'] == {
+        b'league': LEAGUE.encode(),
+        b'opponent_0': b'beijing',
+        b'opponent_1': b'sochi',
+    }
+    assert 0 < state['ttl'] <= redis_module.LIVE_GAME_TTL
+
+
+def test_rename_keeps_meta_tracked_by_other_site(monkeypatch):
+    monkeypatch.setattr(redis_module, 'HISTORY_BACKEND', 'list')
+
+    async def scenario(client):
+        await add_points(client, OLD, NOW_MS)
+        await add_points(client, OLD.on('fb.com'), NOW_MS)
+        await client.rename_game(OLD, NEW)
+        redis = client.redis
+        return (await redis.exists(OLD.meta),
+                await redis.exists(OLD.on('fb.com').history),
+                await redis.zscore(OLD.on('fb.com').site_index, OLD.id))
+
+    meta, fb_history, fb_score = run(scenario)
+    # fb по-прежнему ведёт игру под прежним id
+    assert meta == 1 and fb_history == 1 and fb_score is not None
+
+
+def test_rename_without_data_only_writes_meta(monkeypatch):
+    monkeypatch.setattr(redis_module, 'HISTORY_BACKEND', 'list')
+
+    async def scenario(client):
+        await client.rename_game(OLD, NEW)
+        return sorted(await client.redis.keys('*'))
+
+    assert run(scenario) == [NEW.meta.encode()]
+
+
+def test_migrate_legacy_keys(monkeypatch):
+    stream = f'odds:{short_id("akty.com", LEAGUE, "kazan", "sochi")}'
+    legacy = {
+        f'akty.com_all_data, {LEAGUE.lower()}, kazan, sochi': [b'h2', b'h1'],
+        f'fb.com, {LEAGUE.lower()}, kazan, sochi': [b'a1'],
+        # Запятая в названии: ключ не разбирается однозначно
+        f'akty.com_all_data, {LEAGUE.lower()}, a, b, c': [b'x'],
+    }
+    keys = GameKeys('akty.com', LEAGUE, 'Kazan', 'Sochi')
+
+    async def scenario(client):
+        redis = client.redis
+        for key, items in legacy.items():
+            await redis.rpush(key, *items)
+        await redis.xadd(stream, {'data': b's1'})
+        await redis.xadd('odds:0123456789abcdef', {'data': b'orphan'})
+        # Под новым ключом алертов fb уже есть данные: не трогаем их
+        await redis.rpush(keys.on('fb.com').alerts, b'new')
+
+        async def connect(self):
+            self.redis = redis
+
+        async def close(self):
+            pass
+
+        monkeypatch.setattr(migrate_keys.RedisClient, 'connect', connect)
+        monkeypatch.setattr(migrate_keys.RedisClient, 'close', close)
+        await migrate_keys.migrate(dry_run=True)
+        before = sorted(await redis.keys('*'))
+        await migrate_keys.migrate()
+        return before, {
+            'history': await redis.lrange(keys.history, 0, -1),
+            'stream': await redis.xlen(keys.stream),
+            'fb_alerts': await redis.lrange(keys.on('fb.com').alerts, 0, -1),
+            'left': sorted(key.decode() for key in await redis.keys('*')
+                           if not key.startswith(b'odds:')),
+            'orphan': await redis.exists('odds:0123456789abcdef'),
+        }
+
+    before, state = run(scenario)
+    # --dry-run ничего не меняет
+    assert len(before) == 6
+    assert state['history'] == [b'h2', b'h1']
+    assert state['stream'] == 1
+    assert state['fb_alerts'] == [b'new']
+    assert state['left'] == sorted([
+        f'fb.com, {LEAGUE.lower()}, kazan, sochi',
+        f'akty.com_all_data, {LEAGUE.lower()}, a, b, c',
+    ])
+    assert state['orphan'] == 1
+
+
+def test_parse_legacy_key():
+    assert migrate_keys.parse_legacy_key(
+        'akty.com_all_data, ipbl, kazan, sochi') == (
+        'history', GameKeys('akty.com', 'ipbl', 'kazan', 'sochi'))
+    assert migrate_keys.parse_legacy_key(
+        'fb.com, ipbl, kazan, sochi') == (
+        'alerts', GameKeys('fb.com', 'ipbl', 'kazan', 'sochi'))
+    assert migrate_keys.parse_legacy_key('other.com, ipbl, a, b') is None
+    assert migrate_keys.parse_legacy_key('odds:feed') is None
+
+
+class RecordingPipeline:
+    """Pipeline fakeredis, который запоминает имена команд."""
+
+    def __init__(self, pipeline, calls: list):
+        self.pipeline = pipeline
+        self.calls = calls
+
+    async def __aenter__(self):
+        await self.pipeline.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self.pipeline.__aexit__(*exc_info)
+
+    def __getattr__(self, name):
+        method = getattr(self.pipeline, name)
+        if name == 'execute':
+            return method
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args[0]))
+            return method(*args, **kwargs)
+        return record
+
+
+def test_batch_flush_matches_per_game_writes(monkeypatch):
+    monkeypatch.setattr(redis_module, 'HISTORY_BACKEND', 'list')
+    games = [OLD, NEW]
+
+    async def scenario(client):
+        calls = []
+        pipeline = client.redis.pipeline
+        monkeypatch.setattr(client.redis, 'pipeline', lambda **kwargs:
+                            RecordingPipeline(pipeline(**kwargs), calls))
+        batch = client.batch()
+        for number, keys in enumerate(games):
+            batch.add_history(keys, b'point', NOW_MS + number)
+            batch.add_alert(keys, b'point')
+        batch.get_last_history(NEW.on('fb.com'), 'fb')
+        assert await batch.execute() == {'fb': None}
+        assert len(batch) == 0
+
+        # Прежние отдельные записи каждой игры на втором сервере
+        single = RedisClient('redis://fake')
+        single.redis = fakeredis.FakeAsyncRedis()
+        for number, keys in enumerate(games):
+            await single.add_to_list(keys.history, b'point',
+                                     redis_module.HISTORY_MAX_LEN)
+            await single.add_to_list(keys.alerts, b'point',
+                                     redis_module.HISTORY_MAX_LEN)
+        lists = {
+            key: (await client.redis.lrange(key, 0, -1),
+                  await single.redis.lrange(key, 0, -1))
+            for keys in games for key in (keys.history, keys.alerts)
+        }
+        await single.redis.aclose()
+        redis = client.redis
+        return calls, lists, {
+            'meta': [await redis.hgetall(keys.meta) for keys in games],
+            'ttl': [await redis.ttl(keys.meta) for keys in games],
+            'site': await redis.zrange(OLD.site_index, 0, -1, withscores=True),
+            'league': await redis.zrange(
+                OLD.league_index, 0, -1, withscores=True),
+        }
+
+    calls, lists, state = run(scenario)
+    per_game = [
+        [('lpush', keys.history), ('ltrim', keys.history),
+         ('hset', keys.meta), ('expire', keys.meta),
+         ('zadd', keys.site_index), ('zadd', keys.league_index),
+         ('lpush', keys.alerts), ('ltrim', keys.alerts)]
+        for keys in games
+    ]
+    assert calls == per_game[0] + per_game[1] + [
+        ('zremrangebyscore', OLD.site_index),
+        ('zremrangebyscore', OLD.league_index),
+        ('lindex', NEW.on('fb.com').history),
+    ]
+    for batched, single in lists.values():
+        assert batched == single == [b'point']
+    assert state['meta'][1] == {
+        b'league': LEAGUE.encode(),
+        b'opponent_0': b'beijing',
+        b'opponent_1': b'sochi',
+    }
+    assert all(0 < ttl <= redis_module.LIVE_GAME_TTL for ttl in state['ttl'])
+    expected = [(OLD.id.encode(), NOW_MS), (NEW.id.encode(), NOW_MS + 1)]
+    assert state['site'] == expected
+    assert state['league'] == expected
+
+
+def test_batch_surfaces_failed_command(monkeypatch):
+    monkeypatch.setattr(redis_module, 'HISTORY_BACKEND', 'list')
+
+    async def scenario(client):
+        # Ключ истории другого типа: LPUSH в пакете завершится ошибкой
+        await client.redis.set(OLD.history, b'not a list')
+        batch = client.batch()
+        batch.add_history(OLD, b'point', NOW_MS)
+        batch.add_history(NEW, b'point', NOW_MS)
+        with pytest.raises(Exception, match='WRONGTYPE'):
+            await batch.execute()
+        # Остальные команды пакета выполнены, пакет очищен
+        return (len(batch), await client.redis.lrange(NEW.history, 0, -1))
+
+    assert run(scenario) == (0, [b'point'])
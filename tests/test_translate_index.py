@@ -0,0 +1,60 @@
+"""
+Поиск перевода TranslateIndex совпадает с прежним обходом словаря
+translate_cash по порядку.
+"""
+import pytest
+from fetch_data.translate_index import TranslateIndex
+
+# Ключи пересекаются: короткий ключ добавлен раньше длинного и наоборот
+CACHE = {
+    '北京': 'beijing',
+    '北京猛龙': 'beijing dragons',
+    '猛龙': 'dragons',
+    '上海飞鹰': 'shanghai eagles',
+    '飞鹰': 'eagles',
+    '广州': 'guangzhou',
+    '广州深圳联队': 'guangzhou shenzhen united',
+}
+NAMES = [
+    '北京猛龙', '北京', '猛龙', '猛', '上海飞鹰', '飞鹰', '上海',
+    '广州深圳联队', '深圳', '广州队', '火箭a队',
+]
+
+
+def scan_within(cache: dict, name: str):
+    """Прежнее правило akty: первый ключ, содержащийся в названии."""
+    for key in cache:
+        if key in name:
+            return cache[key]
+    return None
+
+
+def scan_containing(cache: dict, name: str):
+    """Прежнее правило fb: первый ключ, содержащий название."""
+    for key in cache:
+        if name in key:
+            return cache[key]
+    return None
+
+
+@pytest.mark.parametrize('order', [list(CACHE), list(reversed(CACHE))])
+@pytest.mark.parametrize('name', NAMES)
+def test_lookups_match_ordered_scan(order, name):
+    cache = {key: CACHE[key] for key in order}
+    index = TranslateIndex(cache)
+    assert index.find_within(name) == scan_within(cache, name)
+    assert index.find_containing(name) == scan_containing(cache, name)
+
+
+def test_earlier_substring_key_wins_over_exact_key():
+    index = TranslateIndex(CACHE)
+    assert index.find_within('北京猛龙') == 'beijing'
+    assert index.find_containing('猛龙') == 'beijing dragons'
+
+
+def test_added_key_keeps_order():
+    index = TranslateIndex({'北京猛龙': 'beijing dragons'})
+    index.add('北京', 'beijing')
+    index.add('北京猛龙', 'beijing dragons 2')
+    assert index.find_within('北京猛龙') == 'beijing dragons 2'
+    assert index.find_containing('北京') == 'beijing dragons 2'
@@ -0,0 +1,87 @@
+"""
+Фоновый перевод названий: игра под названием со страницы после
+перевода переносится под перевод, а не завершается.
+"""
+import asyncio
+from fetch_data.game_snapshot import GameSnapshot, Tick
+from fetch_data.lifecycle import GameLifecycle
+from fetch_data.translate_queue import TranslateQueue
+from transfer_data.delta_protocol import (
+    DeltaEncoder, DeltaState, RENAMED_TO, renamed_games
+)
+from transfer_data.key_schema import game_id
+
+SITE = 'akty.com'
+LEAGUE = 'IPBL Pro Division'
+
+
+def make_game(opponent_0: str) -> GameSnapshot:
+    return GameSnapshot(
+        league=LEAGUE,
+        opponent_0=opponent_0,
+        opponent_1='sochi',
+        score_game='48:51',
+        time_game='II 05:32',
+        rate={'total_point': '165.5', 'total_bet_0': '1.85'},
+        tick=Tick(1_700_000_000_000),
+    )
+
+
+async def translate(names: dict) -> list:
+    queue = TranslateQueue(names.get)
+    for name in names:
+        queue.request(name, name)
+    await asyncio.gather(*queue.tasks)
+    return queue.drain()
+
+
+def test_translation_renames_provisional_game():
+    encoder = DeltaEncoder(SITE)
+    state = DeltaState(SITE)
+    lifecycle = GameLifecycle()
+
+    # Такт до перевода: игра под названием со страницы
+    provisional = make_game('北京')
+    lifecycle.seen(LEAGUE, provisional)
+    assert state.apply(encoder.snapshot({LEAGUE: [provisional]}))
+
+    [result] = asyncio.run(translate({'北京': 'beijing'}))
+    assert result.translation == 'beijing'
+    assert result.raw_names == {'北京'}
+
+    # Перевод получен: как в collect_ended_games парсеров
+    events = lifecycle.rename_team('北京', result.translation)
+    assert [event.kind for event in events] == ['renamed']
+    games = []
+    for event in events:
+        games.extend(renamed_games(event.game, event.renamed_to))
+    message = encoder.encode({SITE: {LEAGUE: games}})
+
+    new_id = game_id(LEAGUE, 'beijing', 'sochi')
+    assert message['games'] == [{
+        'id': game_id(LEAGUE, '北京', 'sochi'),
+        RENAMED_TO: new_id,
+        'opponent_0': 'beijing',
+        'opponent_1': 'sochi',
+    }]
+    assert state.apply(message)
+    assert [entry['id'] for entry in state.snapshot()['games']] == [new_id]
+    assert state.games[new_id]['opponent_0'] == 'beijing'
+
+    # Следующий такт под переводом без изменений ничего не отправляет
+    assert encoder.encode({SITE: {LEAGUE: [make_game('beijing')]}}) is None
+
+
+def test_failed_translation_is_not_retried():
+    async def scenario():
+        queue = TranslateQueue(lambda name: None, retries=1)
+        queue.request('广州', '广州')
+        await asyncio.gather(*queue.tasks)
+        [result] = queue.drain()
+        # До истечения TRANSLATE_NEGATIVE_TTL название не запрашивается
+        queue.request('广州', '广州')
+        return result, queue.pending
+
+    result, pending = asyncio.run(scenario())
+    assert result.translation is None
+    assert pending == {}
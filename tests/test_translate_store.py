@@ -0,0 +1,126 @@
+"""
+Словарь переводов TranslateStore, общий для процессов: журнал,
+блокировки, refresh и сжатие. Два экземпляра на одних файлах
+изображают два процесса парсеров.
+"""
+import os
+import json
+import threading
+import pytest
+from scripts.translate_cash_load import TranslateStore
+
+
+def make_store(tmp_path, compact_size: int = 100) -> TranslateStore:
+    return TranslateStore(
+        path=str(tmp_path / 'translate_cash.json'),
+        journal_path=str(tmp_path / 'translate_cash.journal'),
+        lock_path=str(tmp_path / 'translate_cash.lock'),
+        compact_size=compact_size,
+    )
+
+
+def read_base(store: TranslateStore) -> dict:
+    with open(store.path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def test_add_appends_journal_line(tmp_path):
+    store = make_store(tmp_path)
+    store.load()
+    store.add('北京', 'beijing')
+    with open(store.journal_path, encoding='utf-8') as journal:
+        assert journal.read() == '["北京", "beijing"]\n'
+    assert not os.path.exists(store.path)
+    assert make_store(tmp_path).load() == {'北京': 'beijing'}
+
+
+def test_refresh_picks_up_other_process(tmp_path):
+    writer, reader = make_store(tmp_path), make_store(tmp_path)
+    writer.load()
+    assert reader.load() == {}
+    writer.add('北京', 'beijing')
+    writer.add('上海', 'shanghai')
+    assert reader.refresh() == {'北京': 'beijing', '上海': 'shanghai'}
+    assert reader.refresh() == {}
+    reader.add('北京', 'beijing ducks')
+    assert writer.refresh() == {'北京': 'beijing ducks'}
+
+
+def test_compaction_moves_journal_to_base(tmp_path):
+    writer = make_store(tmp_path, compact_size=2)
+    reader = make_store(tmp_path, compact_size=2)
+    writer.load()
+    reader.load()
+    writer.add('北京', 'beijing')
+    assert reader.refresh() == {'北京': 'beijing'}
+    inode = os.stat(writer.journal_path).st_ino
+    writer.add('上海', 'shanghai')
+    # Журнал заменён пустым, переводы - в translate_cash.json
+    assert os.path.getsize(writer.journal_path) == 0
+    assert os.stat(writer.journal_path).st_ino != inode
+    assert read_base(writer) == {'北京': 'beijing', '上海': 'shanghai'}
+    assert reader.refresh() == {'上海': 'shanghai'}
+    writer.add('广州', 'guangzhou')
+    assert reader.refresh() == {'广州': 'guangzhou'}
+    assert reader.entries == writer.entries
+
+
+def test_missed_compaction_with_reused_inode(tmp_path):
+    writer, reader = make_store(tmp_path), make_store(tmp_path)
+    writer.load()
+    writer.add('北京', 'beijing')
+    writer.add('上海', 'shanghai')
+    reader.load()
+    # Сжатие, которое reader пропустил: новый translate_cash.json, а
+    # журнал снова с тем же inode и не длиннее прочитанного
+    writer._write_base({'北京': 'beijing', '上海': 'shanghai',
+                        '广州': 'guangzhou'})
+    with open(writer.journal_path, 'wb') as journal:
+        journal.write('["深圳", "shenzhen"]\n'.encode('utf-8'))
+    assert reader.refresh() == {'广州': 'guangzhou', '深圳': 'shenzhen'}
+
+
+def test_partial_trailing_line_is_read_later(tmp_path):
+    writer, reader = make_store(tmp_path), make_store(tmp_path)
+    writer.load()
+    writer.add('北京', 'beijing')
+    reader.load()
+    line = '["上海", "shanghai"]\n'.encode('utf-8')
+    with open(writer.journal_path, 'ab') as journal:
+        journal.write(line[:7])
+    assert reader.refresh() == {}
+    with open(writer.journal_path, 'ab') as journal:
+        journal.write(line[7:])
+    assert reader.refresh() == {'上海': 'shanghai'}
+    assert make_store(tmp_path).load() == {
+        '北京': 'beijing', '上海': 'shanghai'}
+
+
+def test_broken_journal_line_is_skipped(tmp_path):
+    store = make_store(tmp_path)
+    store.load()
+    with open(store.journal_path, 'wb') as journal:
+        journal.write(b'not json\n')
+    store.add('北京', 'beijing')
+    assert make_store(tmp_path).load() == {'北京': 'beijing'}
+
+
+@pytest.mark.parametrize('exclusive', [True, False])
+def test_refresh_waits_for_exclusive_lock(tmp_path, exclusive):
+    writer, reader = make_store(tmp_path), make_store(tmp_path)
+    writer.load()
+    reader.load()
+    done = threading.Event()
+
+    def refresh():
+        reader.refresh()
+        done.set()
+
+    with writer._lock(exclusive=exclusive):
+        thread = threading.Thread(target=refresh)
+        thread.start()
+        # Разделяемую блокировку читатели берут вместе,
+        # исключительная их останавливает
+        assert done.wait(0.2) is not exclusive
+    thread.join(5)
+    assert done.is_set()
@@ -0,0 +1,234 @@
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Any, Dict, List, Mapping, Optional
+from transfer_data.key_schema import game_id
+
+# Протокол сообщений парсеров в Socket.IO: 'delta' - изменения полей
+# с номером последовательности, 'full' - прежний полный leagues_data
+SOCKET_PROTOCOL = os.getenv('SOCKET_PROTOCOL', 'delta')
+
+# Поля игры верхнего уровня, которые передаются в дельтах
+DELTA_FIELDS = ('score_game', 'time_game')
+# Ключ записи такта: игра перенесена под новые названия команд
+RENAMED_TO = 'renamed_to'
+
+
+def full_entry(
+        league: str,
+        game: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """
+    Полная запись игры для снапшота и для первой передачи игры.
+
+    :param league: Наименование лиги.
+    :param game: Словарь game_info.
+    :return: Запись игры протокола (id - key_schema.game_id, как в
+        ключах Redis).
+    """
+    return {
+        'id': game_id(league, game['opponent_0'], game['opponent_1']),
+        'league': league,
+        'opponent_0': game['opponent_0'],
+        'opponent_1': game['opponent_1'],
+        'score_game': game.get('score_game', ''),
+        'time_game': game.get('time_game', ''),
+        'rate': dict(game.get('rate', {})),
+    }
+
+
+def renamed_games(game: Any, renamed: Any) -> List[Dict[str, Any]]:
+    """
+    Записи такта для игры, перенесённой под новые названия команд
+    (например, после перевода): прежняя запись с RENAMED_TO (игра не
+    завершена) и новая запись целиком, чтобы подписчики получили игру
+    под новым названием в том же такте.
+
+    :param game: GameSnapshot под прежними названиями.
+    :param renamed: GameSnapshot той же игры под новыми.
+    :return: Две записи для leagues_data.
+    """
+    notice = game.to_dict()
+    notice[RENAMED_TO] = {
+        'opponent_0': renamed.opponent_0,
+        'opponent_1': renamed.opponent_1,
+    }
+    return [notice, renamed]
+
+
+def _server_time() -> str:
+    return datetime.now(tz=ZoneInfo("Europe/Moscow")).strftime("%H:%M:%S")
+
+
+class DeltaEncoder:
+    """
+    Кодирование данных тактов парсера в дельта-сообщения.
+
+    Сообщение {'type': 'delta', 'site', 'seq', 'server_time', 'games'}
+    содержит по каждой изменившейся игре только её id и изменившиеся
+    поля rate, score_game и time_game. Новая игра передаётся полной
+    записью, завершённая - {'id', 'ended': True}, переименованная -
+    {'id', 'renamed_to': новый id, 'opponent_0', 'opponent_1'}
+    (состояние игры переходит под новый id). Номер seq растёт на
+    единицу с каждым сообщением: пропуск номера означает потерю
+    сообщения, и подписчик запрашивает снапшот.
+
+    Снапшот {'type': 'snapshot', ...} со всеми играми отправляется
+    первым сообщением, после сбоя отправки и по запросу сервера
+    (событие 'resync', если его состояние неполное) - needs_snapshot.
+    """
+
+    def __init__(self, site: str):
+        """
+        :param site: Букмекер (ключ верхнего уровня leagues_data).
+        """
+        self.site = site
+        self.seq = 0
+        self.games: Dict[str, Dict[str, Any]] = {}
+        self.needs_snapshot = True
+
+    def _message(self, kind: str, games: List[Dict[str, Any]]) -> dict:
+        self.seq += 1
+        return {
+            'type': kind,
+            'site': self.site,
+            'seq': self.seq,
+            'server_time': _server_time(),
+            'games': games,
+        }
+
+    def snapshot(self, leagues: Mapping[str, Any]) -> dict:
+        """
+        Снапшот всех текущих игр; состояние кодировщика заменяется им.
+
+        :param leagues: Все текущие игры: лига -> итерируемое game_info.
+        :return: Сообщение snapshot.
+        """
+        self.games = {}
+        for league, games in leagues.items():
+            for game in games:
+                entry = full_entry(league, game)
+                self.games[entry['id']] = entry
+        self.needs_snapshot = False
+        return self._message('snapshot', list(self.games.values()))
+
+    def encode(self, leagues_data: dict) -> Optional[dict]:
+        """
+        Дельта по данным такта.
+
+        :param leagues_data: Данные такта {site: {лига: [game_info]}}.
+        :return: Сообщение delta или None, если изменений нет.
+        """
+        changes = []
+        for league, games in leagues_data.get(self.site, {}).items():
+            for game in games:
+                entry = full_entry(league, game)
+                game_id = entry['id']
+                if game.get(RENAMED_TO):
+                    change = self._rename(league, game_id, game[RENAMED_TO])
+                    if change:
+                        changes.append(change)
+                    continue
+                if game.get('is_end_game'):
+                    if self.games.pop(game_id, None) is not None:
+                        changes.append({'id': game_id, 'ended': True})
+                    continue
+                previous = self.games.get(game_id)
+                self.games[game_id] = entry
+                if previous is None:
+                    changes.append(entry)
+                    continue
+                delta = {'id': game_id}
+                for field in DELTA_FIELDS:
+                    if entry[field] != previous[field]:
+                        delta[field] = entry[field]
+                rate = {
+                    key: value for key, value in entry['rate'].items()
+                    if previous['rate'].get(key) != value
+                }
+                if rate:
+                    delta['rate'] = rate
+                if len(delta) > 1:
+                    changes.append(delta)
+        if not changes:
+            return None
+        return self._message('delta', changes)
+
+    def _rename(
+            self,
+            league: str,
+            old_id: str,
+            names: Mapping[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        previous = self.games.pop(old_id, None)
+        if previous is None:
+            return None
+        new_id = game_id(league, names['opponent_0'], names['opponent_1'])
+        self.games[new_id] = dict(previous, id=new_id, **names)
+        return {'id': old_id, RENAMED_TO: new_id, **names}
+
+
+class DeltaState:
+    """
+    Состояние игр одного букмекера на стороне сервера, собранное
+    из снапшотов и дельт. Из него отвечают на запрос снапшота.
+
+    Состояние считается полным (synced) только после снапшота парсера
+    и до первого пропуска seq. Новое состояние (например, после
+    перезапуска сервера) неполное, пока парсер не пришлёт снапшот.
+    """
+
+    def __init__(self, site: str):
+        self.site = site
+        self.seq = 0
+        self.games: Dict[str, Dict[str, Any]] = {}
+        self.synced = False
+
+    def apply(self, message: dict) -> bool:
+        """
+        Применяет сообщение парсера.
+
+        :param message: Сообщение snapshot или delta.
+        :return: False, если состояние неполное: перед дельтой пропущены
+            сообщения или снапшота ещё не было. Тогда у парсера нужно
+            запросить снапшот.
+        """
+        if message['type'] == 'snapshot':
+            self.games = {entry['id']: entry for entry in message['games']}
+            self.seq = message['seq']
+            self.synced = True
+            return True
+
+        in_order = self.synced and message['seq'] == self.seq + 1
+        for change in message['games']:
+            game_id = change['id']
+            if change.get('ended'):
+                self.games.pop(game_id, None)
+            elif RENAMED_TO in change:
+                entry = self.games.pop(game_id, None)
+                if entry is not None:
+                    self.games[change[RENAMED_TO]] = dict(
+                        entry, id=change[RENAMED_TO],
+                        opponent_0=change['opponent_0'],
+                        opponent_1=change['opponent_1'])
+            elif 'league' in change:
+                self.games[game_id] = change
+            elif game_id in self.games:
+                entry = self.games[game_id]
+                for field in DELTA_FIELDS:
+                    if field in change:
+                        entry[field] = change[field]
+                entry['rate'].update(change.get('rate', {}))
+        self.seq = message['seq']
+        self.synced = in_order
+        return in_order
+
+    def snapshot(self) -> dict:
+        """Снапшот текущего состояния с номером последней дельты."""
+        return {
+            'type': 'snapshot',
+            'site': self.site,
+            'seq': self.seq,
+            'server_time': _server_time(),
+            'games': list(self.games.values()),
+        }
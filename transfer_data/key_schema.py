@@ -0,0 +1,124 @@
+import hashlib
+from typing import NamedTuple, Tuple
+
+# Все ключи данных парсеров начинаются с KEY_PREFIX:
+#   odds:hist:<сайт>:<id игры>    - история коэффициентов (список)
+#   odds:alert:<сайт>:<id игры>   - точки с коэффициентом ниже порога (список)
+#   odds:stream:<сайт>:<id игры>  - история в Redis Streams
+#   odds:game:<id игры>           - hash с лигой и командами
+#   odds:live:<сайт>              - индекс текущих игр сайта (sorted set)
+#   odds:live:<сайт>:<id лиги>    - индекс текущих игр лиги сайта
+#   odds:feed                     - общий поток точек всех игр
+KEY_PREFIX = 'odds'
+SITES = ('akty.com', 'fb.com')
+ODDS_FEED_STREAM = f'{KEY_PREFIX}:feed'
+
+
+def short_id(*parts: str) -> str:
+    """
+    Короткий стабильный идентификатор по частям без учёта регистра.
+
+    :param parts: Части идентификатора (лига, команды).
+    :return: 16 hex-символов.
+    """
+    raw = '\x1f'.join(parts).lower()
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def game_id(league: str, opponent_0: str, opponent_1: str) -> str:
+    """
+    Стабильный идентификатор игры: один и тот же на всех сайтах, между
+    тактами и перезапусками парсера. Используется в ключах Redis и в
+    сообщениях протокола дельт.
+
+    :param league: Наименование лиги.
+    :param opponent_0: Первая команда.
+    :param opponent_1: Вторая команда.
+    :return: 16 hex-символов.
+    """
+    return short_id(league, opponent_0, opponent_1)
+
+
+def site_index(site: str) -> str:
+    """
+    Ключ индекса текущих игр сайта: id игры -> время последней точки (мс).
+
+    :param site: Букмекер, например 'akty.com'.
+    :return: Ключ sorted set.
+    """
+    return f'{KEY_PREFIX}:live:{site}'
+
+
+def league_index(site: str, league: str) -> str:
+    """
+    Ключ индекса текущих игр лиги на сайте.
+
+    :param site: Букмекер, например 'akty.com'.
+    :param league: Наименование лиги.
+    :return: Ключ sorted set.
+    """
+    return f'{KEY_PREFIX}:live:{site}:{short_id(league)}'
+
+
+def game_meta(game_id: str) -> str:
+    """
+    Ключ описания игры: hash с league, opponent_0 и opponent_1.
+
+    :param game_id: id игры (GameKeys.id).
+    :return: Ключ hash.
+    """
+    return f'{KEY_PREFIX}:game:{game_id}'
+
+
+class GameKeys(NamedTuple):
+    """
+    Ключи Redis одной игры на одном сайте.
+
+    id игры не зависит от сайта, поэтому ключи той же игры у другого
+    букмекера получаются через on(site) без разбора строк.
+    """
+    site: str
+    league: str
+    opponent_0: str
+    opponent_1: str
+
+    @property
+    def id(self) -> str:
+        return game_id(self.league, self.opponent_0, self.opponent_1)
+
+    @property
+    def history(self) -> str:
+        return f'{KEY_PREFIX}:hist:{self.site}:{self.id}'
+
+    @property
+    def alerts(self) -> str:
+        return f'{KEY_PREFIX}:alert:{self.site}:{self.id}'
+
+    @property
+    def stream(self) -> str:
+        return f'{KEY_PREFIX}:stream:{self.site}:{self.id}'
+
+    @property
+    def meta(self) -> str:
+        return game_meta(self.id)
+
+    @property
+    def site_index(self) -> str:
+        return site_index(self.site)
+
+    @property
+    def league_index(self) -> str:
+        return league_index(self.site, self.league)
+
+    def on(self, site: str) -> 'GameKeys':
+        """
+        Ключи той же игры на другом сайте.
+
+        :param site: Букмекер, например 'fb.com'.
+        :return: GameKeys другого сайта.
+        """
+        return self._replace(site=site)
+
+    def data_keys(self) -> Tuple[str, str, str]:
+        """Ключи с данными игры на этом сайте."""
+        return self.history, self.alerts, self.stream
@@ -0,0 +1,185 @@
+import os
+import re
+import json
+import struct
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Any, Dict, Mapping, Optional, Union
+
+# Формат точек истории в Redis: 'binary' - компактная запись,
+# 'json' - прежний JSON. Чтение понимает оба формата
+ODDS_CODEC = os.getenv('ODDS_CODEC', 'binary')
+
+# Поля rate в порядке записи (как RATE_FIELDS парсеров)
+POINT_FIELDS = (
+    'total_point',
+    'total_bet_0',
+    'total_bet_1',
+    'handicap_point_0',
+    'handicap_bet_0',
+    'handicap_point_1',
+    'handicap_bet_1',
+)
+# Линии хранятся строками (как на странице), коэффициенты - числами
+POINT_LINES = ('total_point', 'handicap_point_0', 'handicap_point_1')
+
+CODEC_VERSION = 1
+# версия, флаги, период (и сторона тотала), секунды игрового времени,
+# epoch_ms, 7 полей в тысячных долях
+POINT_STRUCT = struct.Struct('<BBBHq7i')
+PERIODS = ('', 'I', 'II', 'III', 'IV')
+# Линия без значения ('' или '-' на странице)
+MISSING = -2 ** 31
+NO_CLOCK = 0xFFFF
+SCALE = 1000
+# Флаги: у линии i знак '+' (бит i) или '-' вместо значения (бит 3 + i),
+# пробел между периодом и временем (бит 6)
+FLAG_DASH = 3
+FLAG_SPACE = 1 << 6
+# Сторона тотала akty перед линией ('大 165.5'): номер в старших битах
+# байта периода (0 - без стороны, как у fb)
+TOTAL_SIDES = ('', '大 ', '小 ')
+SIDE_SHIFT = 4
+
+TIME_GAME = re.compile(
+    r'^(?P<period>I{1,3}|IV)?(?P<space> ?)(?P<clock>\d{2}:\d{2})?$')
+MOSCOW = ZoneInfo("Europe/Moscow")
+
+
+def _server_time(epoch_ms: int) -> str:
+    return datetime.fromtimestamp(
+        epoch_ms / 1000, tz=MOSCOW).strftime("%H:%M:%S")
+
+
+def _format_line(value: int, index: int, flags: int) -> str:
+    if value == MISSING:
+        return '-' if flags & (1 << (FLAG_DASH + index)) else ''
+    text = f'{value / SCALE:g}'
+    return f'+{text}' if flags & (1 << index) else text
+
+
+def _format_time_game(period: int, clock: int, flags: int) -> str:
+    time_game = PERIODS[period & ((1 << SIDE_SHIFT) - 1)]
+    if flags & FLAG_SPACE:
+        time_game += ' '
+    if clock != NO_CLOCK:
+        time_game += f'{clock // 60:02d}:{clock % 60:02d}'
+    return time_game
+
+
+def _encode_binary(
+        rate: Mapping[str, Any],
+        time_game: str,
+        epoch_ms: int
+) -> Optional[bytes]:
+    """
+    Компактная запись точки или None, если точку нельзя записать без
+    потерь (тогда используется JSON).
+    """
+    match = TIME_GAME.match(time_game)
+    if match is None:
+        return None
+    period = PERIODS.index(match.group('period') or '')
+    clock = NO_CLOCK
+    if match.group('clock'):
+        minutes, seconds = match.group('clock').split(':')
+        clock = int(minutes) * 60 + int(seconds)
+    flags = FLAG_SPACE if match.group('space') else 0
+
+    values = []
+    side = 0
+    for field in POINT_FIELDS:
+        raw = rate.get(field, '')
+        if field == 'total_point':
+            for number, prefix in enumerate(TOTAL_SIDES[1:], 1):
+                if raw.startswith(prefix):
+                    side, raw = number, raw[len(prefix):]
+                    break
+        if field in POINT_LINES:
+            index = POINT_LINES.index(field)
+            if raw in ('', '-'):
+                if raw == '-':
+                    flags |= 1 << (FLAG_DASH + index)
+                values.append(MISSING)
+                continue
+            if raw.startswith('+'):
+                flags |= 1 << index
+            try:
+                value = float(raw)
+            except ValueError:
+                return None
+        else:
+            # Коэффициенты уже разобраны в числа
+            value = float(raw or 0.0)
+        scaled = round(value * SCALE)
+        if scaled / SCALE != value or abs(scaled) >= 2 ** 31 - 1:
+            return None
+        values.append(scaled)
+
+    # Точка должна восстановиться без изменений
+    for index, field in enumerate(POINT_LINES):
+        value = values[POINT_FIELDS.index(field)]
+        line = _format_line(value, index, flags)
+        if field == 'total_point':
+            line = TOTAL_SIDES[side] + line
+        if line != rate.get(field, ''):
+            return None
+    if _format_time_game(period, clock, flags) != time_game:
+        return None
+    return POINT_STRUCT.pack(
+        CODEC_VERSION, flags, period | side << SIDE_SHIFT, clock, epoch_ms,
+        *values)
+
+
+def encode_point(
+        rate: Mapping[str, Any],
+        time_game: str,
+        epoch_ms: int,
+        server_time: str
+) -> Union[bytes, str]:
+    """
+    Кодирует точку истории игры для записи в Redis.
+
+    :param rate: Поля rate: линии строками, коэффициенты числами.
+    :param time_game: Период и время вида 'II 05:32'.
+    :param epoch_ms: Время такта, мс.
+    :param server_time: Время такта 'ЧЧ:ММ:СС' (для JSON).
+    :return: Компактная запись (ODDS_CODEC = 'binary') или JSON.
+    """
+    if ODDS_CODEC == 'binary':
+        data = _encode_binary(rate, time_game, epoch_ms)
+        if data is not None:
+            return data
+    point = {field: rate.get(field, '') for field in POINT_FIELDS}
+    point['server_time'] = server_time
+    point['time_game'] = time_game
+    return json.dumps(point, ensure_ascii=False)
+
+
+def decode_point(data: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Декодирует точку истории из Redis: компактную запись или JSON.
+
+    :param data: Значение из Redis.
+    :return: Точка в прежнем формате JSON (server_time, time_game и rate).
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if data[:1] != bytes([CODEC_VERSION]):
+        return json.loads(data.decode('utf-8'))
+
+    (_, flags, period, clock, epoch_ms,
+     *values) = POINT_STRUCT.unpack(data)
+    point = {}
+    for field, value in zip(POINT_FIELDS, values):
+        if field in POINT_LINES:
+            point[field] = _format_line(
+                value, POINT_LINES.index(field), flags)
+            if field == 'total_point':
+                point[field] = TOTAL_SIDES[period >> SIDE_SHIFT] + point[field]
+        else:
+            point[field] = value / SCALE
+    point['server_time'] = _server_time(epoch_ms)
+    point['time_game'] = _format_time_game(period, clock, flags)
+    point['epoch_ms'] = epoch_ms
+    return point
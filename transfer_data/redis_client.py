@@ -1,22 +1,83 @@
 import os
-import json
+import time
 import aioredis
-from typing import Any, Optional, List
+from aioredis.exceptions import ResponseError
+from typing import Any, Dict, Hashable, Optional, List, Set, Tuple, Union
 from dotenv import load_dotenv
-from typing import Any, Optional
+from transfer_data.odds_codec import decode_point
+from transfer_data.key_schema import (
+    GameKeys, SITES, ODDS_FEED_STREAM, game_meta, site_index, league_index
+)
 
 load_dotenv()
 
 REDIS_URL = os.getenv('REDIS_URL')
+# Хранилище истории коэффициентов: 'list' - списки GameKeys.history,
+# 'stream' - Redis Streams GameKeys.stream и общий поток ODDS_FEED_STREAM
+HISTORY_BACKEND = os.getenv('REDIS_HISTORY_BACKEND', 'list')
+# Размер истории одной игры (для потоков - приблизительный, MAXLEN ~)
+HISTORY_MAX_LEN = int(os.getenv('REDIS_HISTORY_MAX_LEN', '300'))
+# Размер общего потока точек для групп потребителей
+ODDS_FEED_MAX_LEN = int(os.getenv('REDIS_FEED_MAX_LEN', '100000'))
+# Игра без новых точек столько секунд выпадает из индексов текущих игр
+# (если парсер не удалил её сам, например после падения), её
+# описание odds:game:<id> истекает через тот же срок
+LIVE_GAME_TTL = int(os.getenv('REDIS_LIVE_TTL', '10800'))
+
+# Перенос данных игры сайта под новый id (см. RedisBatch.rename_game).
+# KEYS: 3 прежних ключа данных, 3 новых, индекс лиги, прежнее и новое
+# описание игры, индексы всех сайтов (первый - индекс сайта игры).
+# ARGV: прежний id, новый id, league, opponent_0, opponent_1, срок
+# описания в секундах.
+RENAME_GAME_SCRIPT = """
+for i = 1, 3 do
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        redis.call('RENAME', KEYS[i], KEYS[i + 3])
+    end
+end
+for _, index in ipairs({KEYS[10], KEYS[7]}) do
+    local score = redis.call('ZSCORE', index, ARGV[1])
+    if score then
+        redis.call('ZREM', index, ARGV[1])
+        redis.call('ZADD', index, score, ARGV[2])
+    end
+end
+redis.call('HSET', KEYS[9], 'league', ARGV[3],
+           'opponent_0', ARGV[4], 'opponent_1', ARGV[5])
+redis.call('EXPIRE', KEYS[9], ARGV[6])
+for i = 10, #KEYS do
+    if redis.call('ZSCORE', KEYS[i], ARGV[1]) then
+        return 0
+    end
+end
+redis.call('DEL', KEYS[8])
+return 1
+"""
+
+
+def _stream_item(entry: Tuple[bytes, Dict[bytes, bytes]]) -> Any:
+    _, fields = entry
+    return decode_point(fields[b'data'])
 
 
 class RedisClient:
     """
     Класс для асинхронной работы с Redis.
 
+    Один объект aioredis.Redis создаётся в connect() и используется
+    всеми вызовами (соединения берутся из его пула).
+
+    Списки истории хранятся от новых к старым: новый элемент
+    добавляется в начало (LPUSH), а при превышении max_len
+    отбрасываются самые старые элементы в конце списка.
+
+    Ключи данных игр строятся по схеме transfer_data/key_schema.py;
+    текущие игры перечисляются по индексам сайтов и лиг, без SCAN.
+
     Attributes:
         redis_url (str): URL подключения к Redis.
         pool (aioredis.ConnectionPool): Пул подключений к Redis.
+        redis (aioredis.Redis): Клиент Redis поверх пула.
 
     Methods:
         __init__(redis_url: str): Инициализирует класс с заданным URL Redis.
@@ -26,18 +87,32 @@ class RedisClient:
         get_data(key: str) -> Optional[Any]: Загружает данные из Redis по ключу.
         add_to_list(key: str, value: Any, max_len: int): Добавляет данные в список Redis.
         get_last_items(key: str, count: int) -> List[Any]: Получает последние элементы из списка Redis.
+        get_last_item(key: str) -> Optional[Any]: Получает последний добавленный элемент списка.
+        scan_keys(pattern: str) -> List[str]: Находит ключи по шаблону через SCAN.
+        get_history(...) -> List[Any]: История игры за последние минуты.
+        get_alerts(...) -> List[Any]: Точки игры с коэффициентом ниже порога.
+        live_games(...) -> List[dict]: Текущие игры сайта или лиги по индексу.
+        delete_game(...): Удаляет данные игры на всех сайтах и из индексов.
+        rename_game(...): Переносит данные игры сайта под новые ключи.
+        create_group(...), read_group(...), ack(...): Чтение общего потока группами потребителей.
+        batch() -> RedisBatch: Пакет операций, выполняемых одним запросом.
     """
 
     def __init__(self, redis_url: str = REDIS_URL):
         self.redis_url = redis_url
         self.pool: Optional[aioredis.ConnectionPool] = None
+        self.redis: Optional[aioredis.Redis] = None
 
     async def connect(self):
         """Устанавливает соединение с Redis."""
         self.pool = aioredis.ConnectionPool.from_url(self.redis_url)
+        self.redis = aioredis.Redis(connection_pool=self.pool)
 
     async def close(self):
         """Закрывает соединение с Redis."""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
         if self.pool:
             await self.pool.disconnect()
 
@@ -49,9 +124,8 @@ class RedisClient:
             key (str): Ключ для сохранения данных.
             value (Any): Данные для сохранения.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                await redis.set(key, value)
+        if self.redis:
+            await self.redis.set(key, value)
 
     async def get_data(self, key: str) -> Optional[Any]:
         """
@@ -63,45 +137,48 @@ class RedisClient:
         Returns:
             Optional[Any]: Загруженные данные или None, если ключ не найден.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                data = await redis.get(key)
-                if data:
-                    return data.decode("utf-8")
-                return None
+        if self.redis:
+            data = await self.redis.get(key)
+            if data:
+                return data.decode("utf-8")
+            return None
 
     async def add_to_list(self, key: str, value: Any, max_len: int = 300):
         """
-        Добавляет данные в список Redis. Если размер списка превышает max_len, удаляет старые элементы.
+        Добавляет данные в начало списка Redis. Если размер списка превышает
+        max_len, удаляет самые старые элементы.
+
+        LPUSH и LTRIM выполняются одной транзакцией (MULTI/EXEC) за один
+        запрос к Redis.
 
         Args:
             key (str): Ключ для сохранения данных.
             value (Any): Данные для сохранения.
             max_len (int): Максимальное количество элементов в списке. По умолчанию 300.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                # Добавляем элемент в конец списка
-                await redis.lpush(key, value)
-                # Обрезаем список до max_len элементов
-                await redis.ltrim(key, -max_len, -1)
+        if self.redis:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                # Новый элемент - в начало, старые обрезаются с конца
+                pipe.lpush(key, value)
+                pipe.ltrim(key, 0, max_len - 1)
+                await pipe.execute()
 
     async def get_last_items(self, key: str, count: int = 300) -> List[Any]:
         """
-        Получает последние элементы из списка Redis.
+        Получает последние добавленные элементы из списка Redis.
 
         Args:
             key (str): Ключ для загрузки данных.
             count (int): Количество элементов для загрузки. По умолчанию 300.
 
         Returns:
-            List[Any]: Список последних элементов.
+            List[Any]: Список элементов от новых к старым.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                items = await redis.lrange(key, 0, count - 1)
-                # Декодируем байты и преобразуем в JSON объекты
-                return [json.loads(item.decode("utf-8")) for item in items]
+        if self.redis:
+            items = await self.redis.lrange(key, 0, count - 1)
+            # Декодируем точки (компактные или JSON)
+            return [decode_point(item) for item in items]
+        return []
 
     async def delete_data(self, key: str):
         """
@@ -110,23 +187,411 @@ class RedisClient:
         Args:
             key (str): Ключ, который необходимо удалить.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                await redis.delete(key)
+        if self.redis:
+            await self.redis.delete(key)
+
+    async def scan_keys(self, pattern: str, count: int = 1000) -> List[str]:
+        """
+        Находит ключи по шаблону через SCAN (без блокировки Redis, как KEYS).
+        Для разовых обходов всех ключей (scripts/migrate_keys.py); текущие
+        игры перечисляются по индексам (live_games).
+
+        Args:
+            pattern (str): Шаблон ключей, например "*, *, *, *".
+            count (int): Сколько ключей просматривать за один вызов SCAN.
+
+        Returns:
+            List[str]: Найденные ключи.
+        """
+        if self.redis:
+            return [key.decode("utf-8") async for key in
+                    self.redis.scan_iter(match=pattern, count=count)]
+        return []
 
     async def get_last_item(self, key: str) -> Optional[Any]:
         """
-        Получает последний элемент из списка Redis.
+        Получает последний добавленный элемент из списка Redis.
 
         Args:
             key (str): Ключ для загрузки данных.
 
         Returns:
-            Optional[Any]: Последний элемент списка или None, если список пуст.
+            Optional[Any]: Последний добавленный элемент списка или None, если список пуст.
         """
-        if self.pool:
-            async with aioredis.Redis(connection_pool=self.pool) as redis:
-                item = await redis.lindex(key, -1)
-                if item:
-                    return json.loads(item.decode("utf-8"))
-                return None
\ No newline at end of file
+        if self.redis:
+            item = await self.redis.lindex(key, 0)
+            if item:
+                return decode_point(item)
+            return None
+
+    async def get_history(
+            self,
+            keys: GameKeys,
+            minutes: float = None,
+            count: int = HISTORY_MAX_LEN
+    ) -> List[Any]:
+        """
+        Получает историю коэффициентов игры от новых к старым.
+
+        Для потоков (HISTORY_BACKEND = 'stream') выборка идёт по
+        времени через XREVRANGE без перебора; для списков minutes
+        не поддерживается и возвращаются последние count точек.
+
+        Args:
+            keys (GameKeys): Ключи игры на сайте.
+            minutes (float): Глубина истории в минутах, по умолчанию вся.
+            count (int): Максимальное количество точек.
+
+        Returns:
+            List[Any]: Точки истории.
+        """
+        if HISTORY_BACKEND != 'stream':
+            return await self.get_last_items(keys.history, count)
+        if not self.redis:
+            return []
+        start = '-'
+        if minutes is not None:
+            start = str(int((time.time() - minutes * 60) * 1000))
+        entries = await self.redis.xrevrange(
+            keys.stream, max='+', min=start, count=count)
+        return [_stream_item(entry) for entry in entries]
+
+    async def get_alerts(
+            self,
+            keys: GameKeys,
+            count: int = HISTORY_MAX_LEN
+    ) -> List[Any]:
+        """
+        Получает точки игры, в которых коэффициент был ниже порога.
+
+        Args:
+            keys (GameKeys): Ключи игры на сайте.
+            count (int): Максимальное количество точек.
+
+        Returns:
+            List[Any]: Точки от новых к старым.
+        """
+        return await self.get_last_items(keys.alerts, count)
+
+    async def live_games(
+            self,
+            site: str,
+            league: str = None
+    ) -> List[Dict[str, str]]:
+        """
+        Текущие игры сайта (или одной лиги) по индексу, от недавно
+        обновлённых к давним. Игры без точек дольше LIVE_GAME_TTL
+        не возвращаются.
+
+        Args:
+            site (str): Букмекер, например 'akty.com'.
+            league (str): Наименование лиги, по умолчанию все лиги.
+
+        Returns:
+            List[Dict[str, str]]: {'id', 'league', 'opponent_0', 'opponent_1'}.
+        """
+        if not self.redis:
+            return []
+        index = league_index(site, league) if league else site_index(site)
+        min_score = int(time.time() * 1000) - LIVE_GAME_TTL * 1000
+        game_ids = [game_id.decode("utf-8") for game_id in
+                    await self.redis.zrevrangebyscore(index, '+inf', min_score)]
+        if not game_ids:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for game_id in game_ids:
+                pipe.hgetall(game_meta(game_id))
+            metas = await pipe.execute()
+        games = []
+        for game_id, meta in zip(game_ids, metas):
+            if not meta:
+                continue
+            game = {key.decode("utf-8"): value.decode("utf-8")
+                    for key, value in meta.items()}
+            game['id'] = game_id
+            games.append(game)
+        return games
+
+    async def delete_game(self, keys: GameKeys):
+        """
+        Удаляет данные игры на всех сайтах, её описание и записи индексов.
+
+        Args:
+            keys (GameKeys): Ключи игры (сайт не важен).
+        """
+        batch = self.batch()
+        batch.remove_game(keys)
+        await batch.execute()
+
+    async def rename_game(self, old: GameKeys, new: GameKeys):
+        """
+        Переносит историю игры на сайте и её записи в индексах под
+        ключи игры с новыми названиями команд.
+
+        Args:
+            old (GameKeys): Ключи игры под прежними названиями.
+            new (GameKeys): Ключи той же игры под новыми.
+        """
+        batch = self.batch()
+        batch.rename_game(old, new)
+        await batch.execute()
+
+    async def create_group(
+            self,
+            group: str,
+            stream: str = ODDS_FEED_STREAM,
+            start_id: str = '$'
+    ):
+        """
+        Создаёт группу потребителей потока, если её ещё нет.
+
+        Args:
+            group (str): Имя группы.
+            stream (str): Поток, по умолчанию общий поток точек.
+            start_id (str): С какой записи читать ('$' - только новые).
+        """
+        if self.redis:
+            try:
+                await self.redis.xgroup_create(
+                    stream, group, id=start_id, mkstream=True)
+            except ResponseError as e:
+                if 'BUSYGROUP' not in str(e):
+                    raise
+
+    async def read_group(
+            self,
+            group: str,
+            consumer: str,
+            stream: str = ODDS_FEED_STREAM,
+            count: int = 100,
+            block_ms: int = 5000
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Читает новые записи потока для потребителя группы.
+
+        Args:
+            group (str): Имя группы.
+            consumer (str): Имя потребителя в группе.
+            stream (str): Поток, по умолчанию общий поток точек.
+            count (int): Максимальное количество записей.
+            block_ms (int): Сколько ждать новых записей, мс.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any]]]: (id записи, поля; data -
+            декодированная точка). Записи нужно подтвердить через ack.
+        """
+        if not self.redis:
+            return []
+        response = await self.redis.xreadgroup(
+            group, consumer, {stream: '>'}, count=count, block=block_ms)
+        entries = []
+        for _, stream_entries in response or []:
+            for entry_id, fields in stream_entries:
+                entry = {key.decode("utf-8"): value
+                         for key, value in fields.items()}
+                entry = {key: decode_point(value) if key == 'data'
+                         else value.decode("utf-8")
+                         for key, value in entry.items()}
+                entries.append((entry_id.decode("utf-8"), entry))
+        return entries
+
+    async def ack(
+            self,
+            group: str,
+            *entry_ids: str,
+            stream: str = ODDS_FEED_STREAM
+    ):
+        """
+        Подтверждает обработку записей потока группой.
+
+        Args:
+            group (str): Имя группы.
+            entry_ids (str): id записей из read_group.
+            stream (str): Поток, по умолчанию общий поток точек.
+        """
+        if self.redis and entry_ids:
+            await self.redis.xack(stream, group, *entry_ids)
+
+    def batch(self) -> 'RedisBatch':
+        """
+        Создаёт пакет операций такта (см. RedisBatch).
+
+        Returns:
+            RedisBatch: Пустой пакет этого клиента.
+        """
+        return RedisBatch(self)
+
+
+class RedisBatch:
+    """
+    Пакет операций Redis за один такт парсера.
+
+    Записи и чтения последних элементов накапливаются и отправляются
+    одним pipeline в execute(), вместо отдельного запроса на каждую
+    игру. Из индексов, обновлённых пакетом, в execute() удаляются
+    игры без точек дольше LIVE_GAME_TTL. Чтения выполняются после записей этого пакета, их
+    результаты возвращаются по метке, переданной в get_last_item или
+    get_last_history (например, ключу игры).
+    """
+
+    def __init__(self, client: RedisClient):
+        """
+        :param client: Подключённый RedisClient.
+        """
+        self.client = client
+        # (метод pipeline, аргументы, именованные аргументы)
+        self.writes: List[Tuple[str, tuple, dict]] = []
+        # (метка, 'list' или 'stream', ключ)
+        self.lookups: List[Tuple[Hashable, str, str]] = []
+        # Индексы текущих игр, обновлённые пакетом
+        self.indexes: Set[str] = set()
+
+    def add_to_list(self, key: str, value: Any, max_len: int = 300) -> None:
+        """
+        Добавляет в пакет запись в начало списка с обрезкой до max_len
+        (как RedisClient.add_to_list).
+
+        :param key: Ключ списка.
+        :param value: Данные для сохранения.
+        :param max_len: Максимальное количество элементов в списке.
+        """
+        self.writes.append(('lpush', (key, value), {}))
+        self.writes.append(('ltrim', (key, 0, max_len - 1), {}))
+
+    def add_history(
+            self,
+            keys: GameKeys,
+            value: Union[bytes, str],
+            epoch_ms: int
+    ) -> None:
+        """
+        Добавляет в пакет точку истории игры в хранилище HISTORY_BACKEND
+        (для потоков - и в общий поток), описание игры (со сроком
+        LIVE_GAME_TTL) и её время обновления в индексах сайта и лиги.
+
+        :param keys: Ключи игры на сайте.
+        :param value: Точка истории (см. odds_codec.encode_point).
+        :param epoch_ms: Время точки, мс.
+        """
+        if HISTORY_BACKEND != 'stream':
+            self.add_to_list(keys.history, value, HISTORY_MAX_LEN)
+        else:
+            self.writes.append(('xadd', (keys.stream, {'data': value}), {
+                'maxlen': HISTORY_MAX_LEN, 'approximate': True}))
+            self.writes.append(('xadd', (ODDS_FEED_STREAM, {
+                'game': keys.id, 'site': keys.site, 'data': value}), {
+                'maxlen': ODDS_FEED_MAX_LEN, 'approximate': True}))
+        self.writes.append(('hset', (keys.meta,), {'mapping': {
+            'league': keys.league,
+            'opponent_0': keys.opponent_0,
+            'opponent_1': keys.opponent_1,
+        }}))
+        self.writes.append(('expire', (keys.meta, LIVE_GAME_TTL), {}))
+        self.writes.append(
+            ('zadd', (keys.site_index, {keys.id: epoch_ms}), {}))
+        self.writes.append(
+            ('zadd', (keys.league_index, {keys.id: epoch_ms}), {}))
+        self.indexes.update((keys.site_index, keys.league_index))
+
+    def add_alert(self, keys: GameKeys, value: Union[bytes, str]) -> None:
+        """
+        Добавляет в пакет точку с коэффициентом ниже порога.
+
+        :param keys: Ключи игры на сайте.
+        :param value: Точка истории (см. odds_codec.encode_point).
+        """
+        self.add_to_list(keys.alerts, value, HISTORY_MAX_LEN)
+
+    def remove_game(self, keys: GameKeys) -> None:
+        """
+        Добавляет в пакет удаление данных игры на всех сайтах, её
+        описания и записей в индексах.
+
+        :param keys: Ключи игры (сайт не важен).
+        """
+        for site in SITES:
+            site_keys = keys.on(site)
+            self.writes.append(('delete', site_keys.data_keys(), {}))
+            self.writes.append(
+                ('zrem', (site_keys.site_index, site_keys.id), {}))
+            self.writes.append(
+                ('zrem', (site_keys.league_index, site_keys.id), {}))
+        self.writes.append(('delete', (keys.meta,), {}))
+
+    def rename_game(self, old: GameKeys, new: GameKeys) -> None:
+        """
+        Добавляет в пакет перенос данных игры на сайте old.site под
+        ключи new (RENAME существующих ключей), её записей в индексах
+        сайта и лиги с прежним временем обновления и описания игры.
+        Прежнее описание удаляется, если игру с прежним id не ведёт
+        другой сайт.
+
+        :param old: Ключи игры под прежними названиями.
+        :param new: Ключи той же игры на том же сайте под новыми.
+        """
+        indexes = [old.site_index] + [
+            site_index(site) for site in SITES if site != old.site]
+        keys = (*old.data_keys(), *new.data_keys(), old.league_index,
+                old.meta, new.meta, *indexes)
+        self.writes.append(('eval', (
+            RENAME_GAME_SCRIPT, len(keys), *keys, old.id, new.id,
+            new.league, new.opponent_0, new.opponent_1, LIVE_GAME_TTL), {}))
+
+    def get_last_item(self, key: str, tag: Hashable) -> None:
+        """
+        Добавляет в пакет чтение последнего добавленного элемента списка.
+
+        :param key: Ключ списка.
+        :param tag: Метка результата в execute().
+        """
+        self.lookups.append((tag, 'list', key))
+
+    def get_last_history(self, keys: GameKeys, tag: Hashable) -> None:
+        """
+        Добавляет в пакет чтение последней точки истории игры.
+
+        :param keys: Ключи игры на сайте (например, keys.on('fb.com')).
+        :param tag: Метка результата в execute().
+        """
+        if HISTORY_BACKEND != 'stream':
+            self.get_last_item(keys.history, tag)
+            return
+        self.lookups.append((tag, 'stream', keys.stream))
+
+    def __len__(self) -> int:
+        return len(self.writes) + len(self.lookups)
+
+    async def execute(self) -> Dict[Hashable, Optional[Any]]:
+        """
+        Отправляет все операции пакета одним pipeline и очищает пакет.
+
+        :return: Метка -> последний элемент (декодированная точка) или None.
+        """
+        writes, self.writes = self.writes, []
+        lookups, self.lookups = self.lookups, []
+        indexes, self.indexes = self.indexes, set()
+        if indexes:
+            min_score = int(time.time() * 1000) - LIVE_GAME_TTL * 1000
+            writes.extend(
+                ('zremrangebyscore', (index, '-inf', f'({min_score}'), {})
+                for index in sorted(indexes))
+        if not self.client.redis or not (writes or lookups):
+            return {}
+        async with self.client.redis.pipeline(transaction=False) as pipe:
+            for method, args, kwargs in writes:
+                getattr(pipe, method)(*args, **kwargs)
+            for _, kind, key in lookups:
+                if kind == 'stream':
+                    pipe.xrevrange(key, count=1)
+                else:
+                    pipe.lindex(key, 0)
+            replies = await pipe.execute()
+        results = {}
+        for (tag, kind, _), reply in zip(lookups, replies[len(writes):]):
+            if not reply:
+                results[tag] = None
+            elif kind == 'stream':
+                results[tag] = _stream_item(reply[0])
+            else:
+                results[tag] = decode_point(reply)
+        return results
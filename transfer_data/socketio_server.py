@@ -1,7 +1,9 @@
 import os
+import json
 import socketio
 from dotenv import load_dotenv
 from app.logging import setup_logger
+from transfer_data.delta_protocol import DeltaState
 
 # Загрузка переменных окружения из .env файла
 load_dotenv()
@@ -29,6 +31,9 @@ app = socketio.ASGIApp(sio)
 # Предопределенные пароли
 SOCKET_KEY = os.getenv('SOCKET_KEY')
 
+# Состояние игр по букмекерам для ответа на запрос снапшота
+delta_states = {}
+
 
 async def send_to_logs(message: str):
     """
@@ -78,5 +83,61 @@ async def message(sid: str, data: str):
     :param data: Данные, полученные от клиента.
     """
     await send_to_logs(f"Получено сообщение от {sid}: {data}")
+    await apply_delta_message(sid, data)
     await sio.send(data)
 
+
+async def apply_delta_message(sid: str, data: str) -> None:
+    """
+    Обновляет состояние букмекера по сообщению протокола дельт.
+    Сообщения прежнего формата пропускаются.
+
+    Если состояние неполное (пропуск seq или нет снапшота после
+    перезапуска сервера), отправившему парсеру отправляется событие
+    'resync', и он присылает снапшот.
+
+    :param sid: Идентификатор сессии парсера.
+    :param data: JSON-строка сообщения парсера.
+    """
+    try:
+        message = json.loads(data)
+    except (TypeError, ValueError):
+        return
+    if not isinstance(message, dict) or message.get('type') not in (
+            'delta', 'snapshot'):
+        return
+    site = message['site']
+    state = delta_states.setdefault(site, DeltaState(site))
+    expected_seq = state.seq + 1
+    was_synced = state.synced
+    if not state.apply(message):
+        if was_synced:
+            await send_to_logs(
+                f"Пропуск сообщений {site}: ожидался seq {expected_seq}, "
+                f"получен {message['seq']}. Запрошен снапшот")
+        else:
+            await send_to_logs(
+                f"Нет полного состояния {site}. Запрошен снапшот")
+        await sio.emit('resync', {'site': site}, to=sid)
+
+
+@sio.on('snapshot')
+async def snapshot(sid: str, data: dict = None):
+    """
+    Запрос полного состояния подписчиком: при подключении или после
+    пропуска номера seq в дельтах. Снапшоты отправляются только
+    запросившему клиенту.
+
+    :param sid: Идентификатор сессии клиента.
+    :param data: {'site': ...} для одного букмекера, иначе все.
+    """
+    site = (data or {}).get('site')
+    states = [delta_states[site]] if site in delta_states else (
+        [] if site else list(delta_states.values()))
+    for state in states:
+        await sio.emit(
+            'message',
+            json.dumps(state.snapshot(), ensure_ascii=False),
+            to=sid
+        )
+
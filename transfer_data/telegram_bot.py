@@ -87,10 +87,11 @@ async def send_message_to_telegram(
     trigger_bk_0 = False
     trigger_bk_1 = False
 
-    total_bet_0 = float(content.get('total_bet_0', '0'))
-    total_bet_1 = float(content.get('total_bet_1', '0'))
-    handicap_bet_0 = float(content.get('handicap_bet_0', '0'))
-    handicap_bet_1 = float(content.get('handicap_bet_1', '0'))
+    # Коэффициенты приходят уже разобранными в числа (см. save_games)
+    total_bet_0 = content.get('total_bet_0', 0.0)
+    total_bet_1 = content.get('total_bet_1', 0.0)
+    handicap_bet_0 = content.get('handicap_bet_0', 0.0)
+    handicap_bet_1 = content.get('handicap_bet_1', 0.0)
     opponent_0 = content.get('opponent_0', '')
     opponent_1 = content.get('opponent_1', '')
     liga = content['liga']
@@ -113,10 +114,10 @@ async def send_message_to_telegram(
         f"Handi: {content['handicap_point_0']}|{handicap_bet_0} {emoji_handicap_0}|{content['handicap_point_1']}|{handicap_bet_1} {emoji_handicap_1}\n"
     )
     if content_2:
-        site_2_total_bet_0 = float(content_2.get('total_bet_0', '0'))
-        site_2_total_bet_1 = float(content_2.get('total_bet_1', '0'))
-        site_2_handicap_bet_0 = float(content_2.get('handicap_bet_0', '0'))
-        site_2_handicap_bet_1 = float(content_2.get('handicap_bet_1', '0'))
+        site_2_total_bet_0 = content_2.get('total_bet_0', 0.0)
+        site_2_total_bet_1 = content_2.get('total_bet_1', 0.0)
+        site_2_handicap_bet_0 = content_2.get('handicap_bet_0', 0.0)
+        site_2_handicap_bet_1 = content_2.get('handicap_bet_1', 0.0)
         site_2 = content_2['site']
 
         # Проверка коэффициентов для второй букмекерской конторы